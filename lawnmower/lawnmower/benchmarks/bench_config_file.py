@@ -0,0 +1,109 @@
+"""
+    Compares the throughput of the different ways of loading a configuration file.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_config_file.py [<mower_count>] [<instruction_count>]
+"""
+import os
+import bz2
+import sys
+import gzip
+import lzma
+import time
+import tempfile
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.scenario_file import convert
+from lawnmower.src.scenario_cache import ScenarioCache
+from lawnmower.src.config_file_validator import ConfigFileValidator
+from lawnmower.benchmarks.scenarios import write_scenario
+
+
+def timed(function, *args, repeat=3):
+    """
+        Runs the specified function several times.
+
+    :return: (float) Best elapsed time, in seconds.
+    """
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def load_and_read_all(filepath):
+    """
+        Loads the specified file, reading the info of every mower (i.e., not only loading it).
+
+    :return: None
+    """
+    config_file = ConfigFile()
+    config_file.load(filepath)
+
+    for _ in config_file.mowers:
+        pass
+
+
+def compress(filepath, compression_module, extension):
+    """
+        Compresses the specified file.
+
+    :return: (str) Path to the compressed file.
+    """
+    compressed_filepath = "{}.{}".format(filepath, extension)
+
+    with open(filepath, "rb") as f, compression_module.open(compressed_filepath, "wb") as g:
+        g.write(f.read())
+
+    return compressed_filepath
+
+
+def report(name, elapsed, size):
+    print("{:<28} {:>9.3f} s {:>9.1f} MB/s".format(name, elapsed, size / elapsed / 1e6))
+
+
+def main():
+    mower_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    instruction_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as folder:
+        filepath = write_scenario(os.path.join(folder, "input.txt"), mower_count, instruction_count)
+        size = os.path.getsize(filepath)
+
+        print("{} mowers x {} instructions ({:.1f} MB)".format(mower_count, instruction_count, size / 1e6))
+        report("load (readline)", timed(lambda: ConfigFile().load(filepath)), size)
+        report("load_mmap", timed(lambda: ConfigFile().load_mmap(filepath)), size)
+        report("load_mmap (compact)", timed(lambda: ConfigFile(compact=True).load_mmap(filepath)), size)
+
+        for processes in sorted({1, os.cpu_count() or 1}):
+            report("validate ({} processes)".format(processes),
+                   timed(lambda: ConfigFileValidator(processes=processes).validate(filepath)), size)
+
+        # Compressed input files (throughput relative to the uncompressed size)
+        for extension, compression_module in [("gz", gzip), ("bz2", bz2), ("xz", lzma)]:
+            compressed_filepath = compress(filepath, compression_module, extension)
+            print("{} file: {:.1f} MB".format(extension, os.path.getsize(compressed_filepath) / 1e6))
+            report("load ({})".format(extension), timed(lambda: ConfigFile().load(compressed_filepath)), size)
+            report("load_mmap ({})".format(extension), timed(lambda: ConfigFile().load_mmap(compressed_filepath)),
+                   size)
+
+        binary_filepath = os.path.join(folder, "input.lmwb")
+        convert(filepath, binary_filepath)
+        print("binary scenario file: {:.1f} MB".format(os.path.getsize(binary_filepath) / 1e6))
+        report("load (binary)", timed(lambda: ConfigFile().load(binary_filepath)), size)
+        report("load (binary) + read all", timed(load_and_read_all, binary_filepath), size)
+
+        # Cached parsed configuration file (the first load stores it, so the timed ones are all cache hits)
+        scenario_cache = ScenarioCache(folder=os.path.join(folder, "cache"), min_file_size=0)
+        ConfigFile(cache=scenario_cache).load(filepath)
+        report("load (cached)", timed(lambda: ConfigFile(cache=scenario_cache).load(filepath)), size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+    Compares the throughput (instructions per second) of running the mowers one by one against running the whole fleet
+    at once (see lawnmower.src.fleet.FleetSimulator), with mower overlapping allowed, from 10^3 to 10^6 mowers.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_fleet.py [<instruction_count>] [<max_mower_count>]
+"""
+import os
+import sys
+import tempfile
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.fleet import FleetSimulator
+from lawnmower.src.program import Program
+from lawnmower.src.scheduler import Scheduler
+from lawnmower.benchmarks.scenarios import write_scenario
+from lawnmower.benchmarks.bench_scheduler import timed_run, report
+
+
+class FleetRun:
+    """
+        Runs only the vectorized simulation of an already built fleet (i.e., without creating the mowers).
+    """
+    def __init__(self, scheduler):
+        scheduler.init_scheduler()
+        self.fleet = FleetSimulator(scheduler.lawn)
+
+        for mower_info in scheduler.config_file.mowers:
+            mower = scheduler.init_mower(mower_info)
+            self.fleet.add(mower.x, mower.y, mower.orientation.orientation,
+                           Program.compile(mower_info["instruction_list"]).opcodes)
+
+    def run(self):
+        self.fleet.run()
+
+
+def main():
+    if not FleetSimulator.is_available():
+        print("ERROR while running benchmark : NumPy not installed")
+        return
+
+    instruction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    max_mower_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10 ** 6
+    mower_count = 10 ** 3
+
+    while mower_count <= max_mower_count:
+        with tempfile.TemporaryDirectory() as folder:
+            config_file = ConfigFile()
+            config_file.load(write_scenario(os.path.join(folder, "input.txt"), mower_count, instruction_count))
+
+        total_instruction_count = mower_count * instruction_count
+        print("{} mowers x {} instructions".format(mower_count, instruction_count))
+        results = {}
+
+        for name, vectorized in [("compiled", False), ("vectorized", True)]:
+            scheduler = Scheduler(config_file=config_file, mower_overlapping=True, vectorized=vectorized)
+            report(name, timed_run(scheduler, repeat=1), total_instruction_count)
+            results[name] = repr(scheduler)
+
+        report("FleetSimulator.run only", timed_run(FleetRun(Scheduler(config_file=config_file)), repeat=1),
+               total_instruction_count)
+
+        if len(set(results.values())) != 1:
+            print("ERROR : Different results ({})".format(", ".join(results)))
+
+        mower_count *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+    Compares the throughput (instructions per second) of running the mowers instruction by instruction, with mower
+    overlapping NOT allowed, checking the final positions of the prior mowers one by one against the occupancy index
+    (see lawnmower.src.occupancy.OccupancyIndex) and the dense occupancy grid (see
+    lawnmower.src.occupancy.OccupancyGrid), from 10^3 to 10^5 mowers. The time per instruction of the former grows with
+    the number of mowers, whereas the latter ones stay flat.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_occupancy.py [<instruction_count>] [<max_mower_count>]
+                                                                           [<max_linear_mower_count>] [<lawn_size>]
+"""
+import os
+import sys
+import tempfile
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.scheduler import Scheduler
+from lawnmower.benchmarks.scenarios import write_scenario
+from lawnmower.benchmarks.bench_scheduler import timed_run, report
+
+
+class LinearScheduler(Scheduler):
+    """
+        Scheduler checking the final positions of the prior mowers one by one (i.e., O(n) per forward move).
+    """
+    def is_prior_mower_position(self, x, y):
+        for prior_mower in self.mowers:
+            if x == prior_mower.x and y == prior_mower.y:
+                return True
+
+        return False
+
+
+def main():
+    instruction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    max_mower_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10 ** 5
+    max_linear_mower_count = int(sys.argv[3]) if len(sys.argv) > 3 else 10 ** 4
+    lawn_size = int(sys.argv[4]) if len(sys.argv) > 4 else 1000
+    mower_count = 10 ** 3
+
+    while mower_count <= max_mower_count:
+        with tempfile.TemporaryDirectory() as folder:
+            config_file = ConfigFile()
+            config_file.load(write_scenario(os.path.join(folder, "input.txt"), mower_count, instruction_count,
+                                            lawn_x_max=lawn_size, lawn_y_max=lawn_size))
+
+        total_instruction_count = mower_count * instruction_count
+        print("{} mowers x {} instructions ({}x{} lawn)".format(mower_count, instruction_count, lawn_size + 1,
+                                                                lawn_size + 1))
+        results = {}
+
+        for name, scheduler_class, occupancy_grid in [("linear scan", LinearScheduler, False),
+                                                      ("occupancy index", Scheduler, False),
+                                                      ("occupancy grid", Scheduler, True)]:
+            if scheduler_class is LinearScheduler and mower_count > max_linear_mower_count:
+                continue
+
+            scheduler = scheduler_class(config_file=config_file, compile_programs=False, occupancy_grid=occupancy_grid)
+            report(name, timed_run(scheduler, repeat=1), total_instruction_count)
+            results[name] = repr(scheduler)
+
+        if len(set(results.values())) != 1:
+            print("ERROR : Different results ({})".format(", ".join(results)))
+
+        mower_count *= 10
+
+
+if __name__ == "__main__":
+    main()
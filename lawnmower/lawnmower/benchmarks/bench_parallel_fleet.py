@@ -0,0 +1,71 @@
+"""
+    Compares the throughput (instructions per second) of running the mowers one by one, within a single process,
+    against splitting the fleet into contiguous chunks run by several processes (see
+    lawnmower.src.parallel_fleet.ParallelFleetRunner), with mower overlapping allowed, from 2 processes up to as many as
+    CPUs. One of the mowers has a huge instruction list (a quarter of all instructions), so chunks balanced by number of
+    instructions are compared against chunks balanced by number of mowers too.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_parallel_fleet.py [<mower_count>] [<instruction_count>]
+            [<max_processes>]
+"""
+import os
+import sys
+import random
+import tempfile
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.parallel_fleet import ParallelFleetRunner
+from lawnmower.src.scheduler import Scheduler
+from lawnmower.benchmarks.scenarios import write_scenario
+from lawnmower.benchmarks.bench_scheduler import timed_run, report
+
+
+class MowerCountRunner(ParallelFleetRunner):
+    """
+        Splits the fleet into chunks with about the same number of mowers, no matter how many instructions they have.
+    """
+    def get_chunks(self, instruction_counts):
+        mean_count = sum(instruction_counts) // max(1, len(instruction_counts))
+
+        return super().get_chunks([mean_count] * len(instruction_counts))
+
+
+def main():
+    mower_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 4
+    instruction_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    max_processes = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as folder:
+        config_file = ConfigFile()
+        config_file.load(write_scenario(os.path.join(folder, "input.txt"), mower_count, instruction_count))
+
+    rnd = random.Random(1)
+    config_file.mowers[mower_count // 2]["instruction_list"] = "".join(
+        rnd.choices("LRFFF", k=mower_count * instruction_count // 3))
+    total_instruction_count = sum(len(mower_info["instruction_list"]) for mower_info in config_file.mowers)
+    print("{} mowers x {} instructions, one of them x {} ({} CPUs)".format(
+        mower_count, instruction_count, mower_count * instruction_count // 3, os.cpu_count()))
+
+    scheduler = Scheduler(config_file=config_file, mower_overlapping=True)
+    report("1 process", timed_run(scheduler, repeat=1), total_instruction_count)
+    expected = repr(scheduler)
+    processes = 2
+
+    while processes <= max(2, max_processes):
+        for name, runner_class in [("balanced by instructions", ParallelFleetRunner),
+                                   ("balanced by mowers", MowerCountRunner)]:
+            scheduler = Scheduler(config_file=config_file, mower_overlapping=True, processes=processes)
+            scheduler.parallel_runner = runner_class(processes=processes)
+            report("{} processes, {}".format(processes, name), timed_run(scheduler, repeat=1),
+                   total_instruction_count)
+
+            if repr(scheduler) != expected:
+                print("ERROR : Different results")
+
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
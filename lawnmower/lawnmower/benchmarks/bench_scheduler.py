@@ -0,0 +1,80 @@
+"""
+    Compares the throughput (instructions per second) of the different ways of running the mowers.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_scheduler.py [<mower_count>] [<instruction_count>]
+                                                                           [sweep|patrol|run|fleet|small-fleet]
+
+    With "sweep", the instructions are sweep patterns (long runs of forward instructions) instead of random ones. With
+    "patrol", they are a short pattern repeated over and over again. With "run", a single run of forward instructions
+    followed by a single rotation (i.e., almost periodic programs, see lawnmower.src.program.Program.get_period). With
+    "fleet", the mowers share a few instruction lists ("small-fleet": on a small lawn).
+"""
+import os
+import sys
+import time
+import tempfile
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.scheduler import Scheduler
+from lawnmower.benchmarks.scenarios import write_scenario
+
+
+def timed_run(scheduler, repeat=3):
+    """
+        Runs the specified scheduler several times.
+
+    :return: (float) Best elapsed time, in seconds.
+    """
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scheduler.run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def report(name, elapsed, instruction_count):
+    print("{:<48} {:>9.3f} s {:>12.0f} instructions/s".format(name, elapsed, instruction_count / elapsed))
+
+
+def main():
+    mower_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    instruction_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    workload = sys.argv[3] if len(sys.argv) > 3 else "random"
+    scenario_options = {"sweep": {"kind": "sweep"},
+                        "patrol": {"kind": "patrol"},
+                        "run": {"kind": "run"},
+                        "fleet": {"program_count": 10},
+                        "small-fleet": {"lawn_x_max": 9, "lawn_y_max": 9, "program_count": 5}}.get(workload, {})
+
+    with tempfile.TemporaryDirectory() as folder:
+        config_file = ConfigFile()
+        config_file.load(write_scenario(os.path.join(folder, "input.txt"), mower_count, instruction_count,
+                                        **scenario_options))
+
+    total_instruction_count = mower_count * instruction_count
+    print("{} mowers x {} instructions ({})".format(mower_count, instruction_count, workload))
+
+    for mower_overlapping in [True, False]:
+        results = {}
+
+        for name, compile_programs, cache_programs in [("Mower.execute", False, False),
+                                                       ("compiled, not cached", True, False),
+                                                       ("compiled", True, True)]:
+            scheduler = Scheduler(config_file=config_file, mower_overlapping=mower_overlapping,
+                                  compile_programs=compile_programs, cache_programs=cache_programs)
+            report("{} (mower_overlapping={})".format(name, mower_overlapping), timed_run(scheduler),
+                   total_instruction_count)
+            results[name] = repr(scheduler)
+
+        if len(set(results.values())) != 1:
+            print("ERROR : Different results ({})".format(", ".join(results)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+    Measures the throughput (instructions, i.e. mower-ticks, per second) of running the mowers all at once, one
+    instruction per tick (see lawnmower.src.simultaneous.SimultaneousSimulator), against running them one after the
+    other, with mower overlapping NOT allowed, from 10^3 mowers up to max_mower_count. Since each tick only costs
+    O(number of active mowers), the time per instruction stays flat as the fleet grows. If NumPy is installed, conflicts
+    solved for the whole fleet at once (see lawnmower.src.simultaneous_fleet.SimultaneousFleetSimulator) are measured
+    too.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_simultaneous.py [<instruction_count>] [<max_mower_count>]
+"""
+import os
+import sys
+import tempfile
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.scheduler import Scheduler
+from lawnmower.src.simultaneous_fleet import SimultaneousFleetSimulator
+from lawnmower.benchmarks.scenarios import write_scenario
+from lawnmower.benchmarks.bench_scheduler import timed_run, report
+
+
+def main():
+    instruction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    max_mower_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10 ** 5
+    mower_count = 10 ** 3
+
+    while mower_count <= max_mower_count:
+        with tempfile.TemporaryDirectory() as folder:
+            config_file = ConfigFile()
+            config_file.load(write_scenario(os.path.join(folder, "input.txt"), mower_count, instruction_count))
+
+        total_instruction_count = mower_count * instruction_count
+        print("{} mowers x {} instructions".format(mower_count, instruction_count))
+
+        runs = [("one after the other", False, False), ("all at once (ticks)", True, False)]
+
+        if SimultaneousFleetSimulator.is_available():
+            runs.append(("all at once (NumPy)", True, True))
+
+        for name, simultaneous, vectorized in runs:
+            scheduler = Scheduler(config_file=config_file, simultaneous=simultaneous, vectorized=vectorized)
+            report(name, timed_run(scheduler, repeat=1), total_instruction_count)
+
+        mower_count *= 10
+
+
+if __name__ == "__main__":
+    main()
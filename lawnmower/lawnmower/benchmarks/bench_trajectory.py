@@ -0,0 +1,65 @@
+"""
+    Compares the throughput (instructions per second) of running a single, very long, instruction list through a
+    compiled program (see lawnmower.src.program.Program) against its vectorized trajectory (see
+    lawnmower.src.trajectory.TrajectorySimulator), either every intermediate state or only the final one.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_trajectory.py [<instruction_count>] [<lawn_size>]
+"""
+import sys
+import time
+import random
+from collections import deque
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.program import Program
+from lawnmower.src.trajectory import TrajectorySimulator
+from lawnmower.benchmarks.bench_scheduler import report
+
+
+def timed(function):
+    """
+        Calls the specified function once.
+
+    :return: (tuple) (<elapsed>, <result>) with the elapsed time, in seconds, and whatever the function returned.
+    """
+    start = time.perf_counter()
+    result = function()
+
+    return time.perf_counter() - start, result
+
+
+def main():
+    if not TrajectorySimulator.is_available():
+        print("ERROR while running benchmark : NumPy not installed")
+        return
+
+    instruction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 8
+    lawn_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    rnd = random.Random(0)
+    instruction_list = bytes(rnd.choices(b"LRFFF", k=instruction_count))
+    lawn = Lawn(x_max=lawn_size, y_max=lawn_size)
+    mower = Mower(lawn_size // 2, lawn_size // 2, Orientation("N"), lawn)
+    print("1 mower x {} instructions ({}x{} lawn)".format(instruction_count, lawn_size, lawn_size))
+
+    elapsed, program = timed(lambda: Program.compile(instruction_list))
+    report("Program.compile", elapsed, instruction_count)
+    elapsed, expected = timed(lambda: program.run(mower.x, mower.y, mower.orientation.orientation, lawn))
+    report("Program.run", elapsed, instruction_count)
+
+    simulator = TrajectorySimulator(mower, instruction_list)
+    elapsed, final_state = timed(simulator.get_final_state)
+    report("TrajectorySimulator.get_final_state", elapsed, instruction_count)
+    elapsed, (last_chunk, ) = timed(lambda: deque(simulator.iter_states(), maxlen=1))
+    report("TrajectorySimulator.iter_states", elapsed, instruction_count)
+
+    if len({expected, final_state, tuple(int(values[-1]) for values in last_chunk)}) != 1:
+        print("ERROR : Different results")
+
+
+if __name__ == "__main__":
+    main()
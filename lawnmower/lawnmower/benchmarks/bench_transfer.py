@@ -0,0 +1,47 @@
+"""
+    Compares the throughput (instructions per second) of running a single, huge, instruction list through a compiled
+    program (see lawnmower.src.program.Program) against splitting it into chunks whose transfer functions are computed
+    by several processes (see lawnmower.src.transfer.ParallelCompiler), from 1 process up to as many as CPUs.
+
+    Use:
+
+        PYTHONPATH=<lawnmower/path> python3 benchmarks/bench_transfer.py [<instruction_count>] [<max_processes>]
+"""
+import os
+import sys
+import random
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.program import Program
+from lawnmower.src.transfer import ParallelCompiler
+from lawnmower.benchmarks.bench_scheduler import report
+from lawnmower.benchmarks.bench_trajectory import timed
+
+
+def main():
+    instruction_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 8
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    rnd = random.Random(0)
+    instruction_list = bytes(rnd.choices(b"LRFFF", k=instruction_count))
+    lawn = Lawn(x_max=1000, y_max=1000)
+    print("1 mower x {} instructions ({} CPUs)".format(instruction_count, os.cpu_count()))
+
+    elapsed, expected = timed(lambda: Program.compile(instruction_list).run(500, 500, 0, lawn))
+    report("Program.compile + run", elapsed, instruction_count)
+
+    processes = 1
+
+    while processes <= max_processes:
+        compiler = ParallelCompiler(processes=processes)
+        elapsed, transfer_function = timed(lambda: compiler.compile(instruction_list, lawn))
+        report("ParallelCompiler ({} processes)".format(processes), elapsed, instruction_count)
+
+        if transfer_function.apply(500, 500, 0, lawn) != expected:
+            print("ERROR : Different results")
+
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import random
+
+
+def generate_instruction_list(rnd, instruction_count, lawn_x_max=1000, kind="random"):
+    """
+        Generates a random instruction list (see generate_scenario_lines).
+
+    :param rnd: (random.Random) The random generator.
+    :return: (str) The instruction list.
+    """
+    if kind == "run":
+        return "F" * (instruction_count - 1) + rnd.choice("LR")[:instruction_count]
+
+    if kind == "patrol":
+        pattern = "".join(rnd.choices("LRFFF", k=rnd.randint(4, 16)))
+        return (pattern * (instruction_count // len(pattern) + 1))[:instruction_count]
+
+    if kind != "sweep":
+        return "".join(rnd.choices("LRFFF", k=instruction_count))
+
+    instructions = []
+
+    while len(instructions) < instruction_count:
+        instructions.extend("F" * rnd.randint(1, lawn_x_max))
+        instructions.append(rnd.choice("LR"))
+
+    return "".join(instructions[:instruction_count])
+
+
+def generate_scenario_lines(mower_count, instruction_count, lawn_x_max=1000, lawn_y_max=1000, seed=0, kind="random",
+                            program_count=None):
+    """
+        Generates, line by line, a random configuration file (see lawnmower.src.config_file.ConfigFile).
+
+    :param mower_count: (int) Number of mowers.
+    :param instruction_count: (int) Number of instructions of each mower.
+    :param lawn_x_max: (int) Coordinate X of the upper-right corner of the lawn.
+    :param lawn_y_max: (int) Coordinate Y of the upper-right corner of the lawn.
+    :param seed: (int) Seed of the random generator, so that the very same scenario can be generated again.
+    :param kind: (str) Kind of instruction lists: "random", "sweep" (i.e., long runs of forward instructions separated
+                by single rotations), "patrol" (i.e., a short random pattern repeated over and over again) or "run"
+                (i.e., a single run of forward instructions followed by a single rotation, almost periodic).
+    :param program_count: (int) If specified, the mowers share this number of instruction lists (i.e., fleets).
+    :return: (generator of str) Each line of the configuration file, including its trailing new line.
+    """
+    rnd = random.Random(seed)
+
+    instruction_lists = [generate_instruction_list(rnd, instruction_count, lawn_x_max, kind)
+                         for _ in range(program_count)] if program_count else None
+
+    yield "{} {}\n".format(lawn_x_max, lawn_y_max)
+
+    for _ in range(mower_count):
+        yield "{} {} {}\n".format(rnd.randint(0, lawn_x_max), rnd.randint(0, lawn_y_max), rnd.choice("NESW"))
+        yield (rnd.choice(instruction_lists) if instruction_lists
+               else generate_instruction_list(rnd, instruction_count, lawn_x_max, kind)) + "\n"
+
+
+def write_scenario(filepath, mower_count, instruction_count, lawn_x_max=1000, lawn_y_max=1000, seed=0, kind="random",
+                   program_count=None):
+    """
+        Writes a random configuration file (see generate_scenario_lines).
+
+    :param filepath: (str) Path to the configuration file to write.
+    :return: (str) The path to the written configuration file.
+    """
+    with open(filepath, "w") as f:
+        f.writelines(generate_scenario_lines(mower_count, instruction_count, lawn_x_max, lawn_y_max, seed, kind,
+                                             program_count))
+
+    return filepath
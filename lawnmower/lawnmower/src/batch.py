@@ -0,0 +1,160 @@
+import io
+import os
+import glob
+import traceback
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+import lawnmower.src.config_file
+import lawnmower.src.scheduler
+
+
+class BatchRunner:
+    """
+        Runs a whole batch of configuration files (see lawnmower.src.config_file.ConfigFile) using several processes,
+        thus paying the interpreter start-up only once.
+
+        The output of each scenario (i.e., exactly what lawnmower.src.main would print for it) is captured within the
+        process running it, and printed as a single block. Blocks are always printed in the order of the configuration
+        files (sorted by path), no matter which process finishes first. A failing scenario does not abort the batch.
+    """
+    # Header of the output block of each scenario
+    block_header = "==> {} <=="
+
+    def __init__(self, processes=None, verbose=False, mower_overlapping=False, compact=False, cache=None):
+        """
+            Initializes the batch runner.
+
+        :param processes: (int) Number of processes to use. If not specified, as many as CPUs.
+        :param verbose: (bool) If True the output of each scenario includes all intermediate steps.
+        :param mower_overlapping: (bool) If True more than one mower can be in the same cell of the lawn grid at the
+                    same time (see lawnmower.src.scheduler.Scheduler).
+        :param compact: (bool) If True the mowers are stored in a compact table (see
+                    lawnmower.src.config_file.ConfigFile).
+        :param cache: (lawnmower.src.scenario_cache.ScenarioCache) Cache of parsed configuration files, if any.
+        :return: None
+        """
+        # Number of processes to use (int)
+        self.processes = processes or os.cpu_count() or 1
+
+        # Tells if the output includes all intermediate steps (bool)
+        self.verbose = verbose
+
+        # Tells if more than one mower can be in the same lawn grid cell (bool)
+        self.mower_overlapping = mower_overlapping
+
+        # Tells if the mowers are stored in a compact table (bool)
+        self.compact = compact
+
+        # Cache of parsed configuration files (lawnmower.src.scenario_cache.ScenarioCache)
+        self.cache = cache
+
+        # Number of scenarios run in the last batch (int)
+        self.scenario_count = 0
+
+        # Paths to the configuration files of the failed scenarios in the last batch (list of str)
+        self.failed = []
+
+    @staticmethod
+    def get_filepaths(pattern):
+        """
+            Gets the configuration files of a batch.
+
+        :param pattern: (str) Either the path to a folder (all its non-hidden files are included) or a glob pattern
+                    (e.g., "conf/*.txt").
+        :return: (list of str) Paths to the configuration files, sorted.
+        """
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*")
+
+        return sorted(filepath for filepath in glob.glob(pattern) if os.path.isfile(filepath))
+
+    def run_scenario(self, filepath):
+        """
+            Loads and runs a single configuration file, capturing all its output.
+
+        :param filepath: (str) Path to the configuration file.
+        :return: (tuple)    (<success>, <output>)
+
+                with:
+                        <success> : (bool) True if the scenario was successfully loaded and run; False otherwise.
+                        <output> : (str) Everything printed while loading and running it.
+        """
+        output = io.StringIO()
+        success = False
+
+        with contextlib.redirect_stdout(output):
+            try:
+                config_file = lawnmower.src.config_file.ConfigFile(compact=self.compact, cache=self.cache)
+
+                if config_file.load(filepath):
+                    scheduler = lawnmower.src.scheduler.Scheduler(config_file=config_file,
+                                                                  mower_overlapping=self.mower_overlapping)
+                    scheduler.run(verbose=self.verbose)
+                    print(scheduler)
+                    success = True
+
+            except Exception as e:
+                print("Unexpected ERROR while running scenario '{}' : {}\n{}".format(filepath, e,
+                                                                                     traceback.format_exc()))
+
+        return success, output.getvalue()
+
+    def iter_run(self, filepaths):
+        """
+            Runs the specified configuration files, yielding the result of each one in order.
+
+        :param filepaths: (list of str) Paths to the configuration files.
+        :return: (generator of tuples) (<filepath>, <success>, <output>) of each configuration file (see
+                    run_scenario).
+        """
+        # Small batches are run within this very same process
+        executor = ProcessPoolExecutor(max_workers=min(self.processes, len(filepaths))) \
+            if self.processes > 1 and len(filepaths) > 1 else None
+
+        try:
+            if executor:
+                # Send several scenarios at once to each process, so that small ones are not dominated by
+                #   inter-process communication
+                chunksize = max(1, len(filepaths) // (4 * self.processes))
+                results = executor.map(self.run_scenario, filepaths, chunksize=chunksize)
+
+            else:
+                results = map(self.run_scenario, filepaths)
+
+            for filepath, (success, output) in zip(filepaths, results):
+                yield filepath, success, output
+
+        finally:
+            if executor:
+                executor.shutdown()
+
+    def run(self, pattern):
+        """
+            Runs all configuration files matching the specified pattern, printing the output block of each one as soon
+            as it (and all prior ones) finished, followed by a summary.
+
+        :param pattern: (str) Folder or glob pattern (see get_filepaths).
+        :return: (bool) True if all scenarios were successfully run; False otherwise (including no scenarios at all).
+        """
+        filepaths = self.get_filepaths(pattern)
+        self.scenario_count = 0
+        self.failed = []
+
+        if not filepaths:
+            print("ERROR while running batch : No configuration files found in '{}'".format(pattern))
+            return False
+
+        for filepath, success, output in self.iter_run(filepaths):
+            self.scenario_count += 1
+
+            if not success:
+                self.failed.append(filepath)
+
+            print(self.block_header.format(filepath))
+            print(output, end="" if output.endswith("\n") else "\n")
+
+        print("{} scenarios : {} OK, {} FAILED".format(self.scenario_count, self.scenario_count - len(self.failed),
+                                                       len(self.failed)))
+
+        return not self.failed
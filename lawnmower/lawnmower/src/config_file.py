@@ -1,5 +1,16 @@
+import io
+import os
+import sys
+import bz2
+import gzip
+import lzma
+import mmap
 import traceback
 
+import lawnmower.src.mower_table
+import lawnmower.src.program_tree
+import lawnmower.src.scenario_file
+
 
 class ConfigFile:
     """
@@ -23,15 +34,61 @@ class ConfigFile:
                 LFLFLFLFF
                 3 3 E
                 FFRFFRFRRF
+
+        Instruction lists may be written with repeat blocks (e.g., "(FFRFF)*100000") and named macros, defined right
+        after the lawn info, one per line, and shared by all mowers (see lawnmower.src.program_tree.ProgramTree). They
+        are parsed into program trees, which are never expanded unless needed. Example:
+
+                5 5
+                $PATROL = (FFRFF)*100000
+                1 2 N
+                L$PATROL
+                3 3 E
+                (FR)*3$PATROL
     """
-    def __init__(self):
+    # Format errors (formatted with the path to the configuration file and the line number)
+    invalid_lawn_info_error = "ERROR while loading configuration file '{}' : Invalid format in line 1 '{}'"
+    invalid_format_error = "ERROR while loading configuration file '{}' : Invalid format in line {}"
+    missing_mowers_error = "ERROR while loading configuration file '{}' : Invalid format - Missing mowers info in " \
+                           "line {}"
+    missing_instructions_error = "ERROR while loading configuration file '{}' : Invalid format - Missing mower #{} " \
+                                 "instructions info in line {}"
+    not_text_error = "ERROR while loading configuration file '{}' : Invalid format - Not a text file"
+
+    # Path meaning the standard input (e.g., to read configurations from a Unix pipeline)
+    stdin_filepath = "-"
+
+    # Modules able to decompress each supported compression format, by magic number
+    compression_modules = {
+        b"\x1f\x8b": gzip,              # gzip
+        b"BZh": bz2,                    # bzip2
+        b"\xfd7zXZ\x00": lzma           # xz
+    }
+
+    def __init__(self, compact=False, cache=None):
+        """
+            Initializes the configuration file.
+
+        :param compact: (bool) If True the mowers are stored in a compact, columnar, table (see
+                    lawnmower.src.mower_table.MowerTable) instead of a list of dicts. Notice that, in that case,
+                    coordinates are stored as integers, so non-integer ones are reported as invalid format.
+        :param cache: (lawnmower.src.scenario_cache.ScenarioCache) Cache of parsed configuration files to be used by
+                    load. If not specified, files are always parsed.
+        :return: None
+        """
+        # Tells if the mowers are stored in a lawnmower.src.mower_table.MowerTable (bool)
+        self.compact = compact
+
+        # Cache of parsed configuration files (lawnmower.src.scenario_cache.ScenarioCache)
+        self.cache = cache
+
         # Coordinate X of the upper-right corner of the lawn (int)
         self.lawn_x_max = None
 
         # Coordinate X of the upper-right corner of the lawn (int)
         self.lawn_y_max = None
 
-        # List of mowers (list of dicts)
+        # List of mowers (list of dicts, or lawnmower.src.mower_table.MowerTable if compact)
         # For each mower, stored in order of appearance, there will be three pairs of key-values
         #
         #     initial_position (tuple of str): with (X, Y) being the coordinates of the initial position of the mower.
@@ -41,103 +98,499 @@ class ConfigFile:
         #
         self.mowers = []
 
+        # Program trees of the named macros (see lawnmower.src.program_tree.ProgramTree), by name (dict)
+        self.macros = {}
+
+        # Tells if the last file read mower by mower (see read_mowers and iter_mowers) was completely read without
+        # errors (bool)
+        self.stream_ok = False
+
+    @staticmethod
+    def get_compression(filepath):
+        """
+            Gets the compression format of the specified file, according to its first bytes (i.e., magic number).
+
+        :throws TypeError, FileNotFoundError (same as Python built-in open)
+
+        :param filepath: (str) Path to the file.
+        :return: (module) The module able to decompress it (i.e., gzip, bz2 or lzma). Returns None if the file is not
+                    compressed.
+        """
+        with open(filepath, "rb") as f:
+            return ConfigFile.get_stream_compression(f)
+
     @staticmethod
-    def open_file(*args, **kwargs):
+    def get_stream_compression(f):
+        """
+            Gets the compression format of the specified binary stream, according to its first bytes (i.e., magic
+            number). They are peeked, not consumed, if possible (i.e., buffered streams, such as the standard input).
+
+        :param f: (file) Binary stream, positioned at its beginning.
+        :return: (module) The module able to decompress it (i.e., gzip, bz2 or lzma). Returns None if the stream is
+                    not compressed.
+        """
+        magic_size = max(len(magic) for magic in ConfigFile.compression_modules)
+        magic = f.peek(magic_size)[:magic_size] if hasattr(f, "peek") else f.read(magic_size)
+
+        for compression_magic, compression_module in ConfigFile.compression_modules.items():
+            if magic.startswith(compression_magic):
+                return compression_module
+
+        return None
+
+    @staticmethod
+    def open_file(filepath, mode="r", **kwargs):
         """
             Opens a file (see Python built-in open in https://docs.python.org/3/library/functions.html#open)
 
+            Compressed files (gzip, bz2 or xz) are automatically detected, and transparently decompressed while read
+            (i.e., without decompressing the whole file at once).
+
+            The standard input is opened if filepath is "-" (see stdin_filepath). It is read as it arrives (i.e., it is
+            not waited to be closed) and it is NOT closed along with the returned file. Its first bytes are peeked to
+            check for compression, since it cannot be rewound.
+
             NOTE: For improved testability reasons only.
         """
-        return open(*args, **kwargs)
+        if filepath == ConfigFile.stdin_filepath:
+            # Buffered reader of its own, so that its first bytes are peeked without being consumed
+            stdin = open(sys.stdin.fileno(), "rb", closefd=False)
+            compression_module = ConfigFile.get_stream_compression(stdin)
+
+            if compression_module is None:
+                return stdin if "b" in mode else io.TextIOWrapper(stdin, **kwargs)
+
+            filepath = stdin
+
+        else:
+            compression_module = ConfigFile.get_compression(filepath)
+
+            if compression_module is None:
+                return open(filepath, mode, **kwargs)
+
+        # Compression modules open files in binary mode by default
+        return compression_module.open(filepath, mode if "b" in mode else mode.replace("t", "") + "t", **kwargs)
+
+    def get_lawn_info(self, line, filepath):
+        """
+            Parses the first line of the configuration file, that is the coordinates of the upper-right corner of the
+            lawn.
+
+        :param line: (str) First line of the configuration file (as read, it may include the trailing new line).
+        :param filepath: (str) Path to the configuration file being loaded (for error reporting only).
+        :return: (tuple) (lawn_x_max, lawn_y_max), both of them as str. Returns None in case of invalid format.
+        """
+        line = line.replace("\n", "")
+
+        try:
+            lawn_x_max, lawn_y_max = line.split()
+
+        except ValueError:
+            print(self.invalid_lawn_info_error.format(filepath, line))
+            return None
+
+        return lawn_x_max, lawn_y_max
+
+    @staticmethod
+    def get_next_mower_position_and_orientation(line):
+        """
+            Parses the line with the initial position and orientation of a mower.
+
+        :param line: (str) Line to parse, without the trailing new line.
+        :return: (dict) Mower info with the keys initial_position and initial_orientation (see self.mowers). Returns
+                    None in case of invalid format.
+        """
+        line_parts = line.split()
+
+        try:
+            return {"initial_position": (line_parts[0], line_parts[1]), "initial_orientation": line_parts[2]}
+
+        except IndexError:
+            return None
+
+    @staticmethod
+    def is_end_of_mowers(line, mower_count, filepath, line_offset=0):
+        """
+            Given a line that could not be parsed as the initial position and orientation of a mower, tells if it is
+            the proper end of the mowers info. Otherwise, the corresponding error is printed out.
+
+        :param line: (str/bytes) The line that could not be parsed, without the trailing new line.
+        :param mower_count: (int) Number of mowers already read.
+        :param filepath: (str) Path to the configuration file being read (for error reporting only).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: (bool) True if there is NO error (i.e., end of file after, at least, one mower); False otherwise.
+        """
+        if not line and mower_count == 0:
+            print(ConfigFile.missing_mowers_error.format(filepath, 2 * (mower_count + 1) + line_offset))
+
+        elif line:
+            print(ConfigFile.invalid_format_error.format(filepath, 2 * (mower_count + 1) + line_offset))
+
+        else:
+            # In this case there is NO error. Already read valid info
+            return True
+
+        return False
+
+    @staticmethod
+    def print_missing_instructions_error(mower_count, filepath, line_offset=0):
+        """
+            Prints out the error of a mower without instruction list.
+
+        :param mower_count: (int) Number of mowers already read (i.e., not including the one missing instructions).
+        :param filepath: (str) Path to the configuration file being read (for error reporting only).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: None
+        """
+        print(ConfigFile.missing_instructions_error.format(filepath, mower_count + 1,
+                                                           2 * (mower_count + 1) + 1 + line_offset))
+
+    def new_mowers(self):
+        """
+            Creates an empty container of mowers, according to the storage mode (see self.compact).
+
+        :return: (list/lawnmower.src.mower_table.MowerTable) The empty container.
+        """
+        return lawnmower.src.mower_table.MowerTable() if self.compact else []
+
+    @staticmethod
+    def add_mower(mowers, mower_info, filepath, line_offset=0):
+        """
+            Adds the info of a mower to the specified container, reporting any error. Notice that compact containers
+            only hold plain instruction lists (i.e., not program trees).
+
+        :param mowers: (list/lawnmower.src.mower_table.MowerTable) Container of the mowers already read.
+        :param mower_info: (dict) Info of the mower to add.
+        :param filepath: (str) Path to the configuration file being read (for error reporting only).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: (bool) True if the mower was successfully added; False otherwise.
+        """
+        try:
+            mowers.append(mower_info)
+
+        except (ValueError, OverflowError):
+            # Either not an integer coordinate, or too big for the compact container
+            print(ConfigFile.invalid_format_error.format(filepath, 2 * (len(mowers) + 1) + line_offset))
+            return False
+
+        return True
+
+    def read_mowers(self, f, filepath, macros=None):
+        """
+            Generator that reads, from the current position of an already opened configuration file (i.e., just after
+            the lawn info line), the info of the next mower each time it is iterated. Macros (see self.macros) are read
+            before the first mower.
+
+            Any format error is printed out, exactly as load does, and stops the iteration. Once the iteration finishes
+            self.stream_ok tells whether the whole file was properly read or not.
+
+        :param f: (file) Opened configuration file, already positioned at the first mower line.
+        :param filepath: (str) Path to the configuration file being read (for error reporting only).
+        :param macros: (dict) Where the macros read are added, by name. If not specified, they are just used to parse
+                    the instruction lists.
+        :return: (generator of dict) Info of each mower, in order of appearance (see self.mowers).
+        """
+        self.stream_ok = False
+        macros = {} if macros is None else macros
+        mower_count = 0
+
+        line = f.readline().replace("\n", "")
+
+        while self.is_macro(line):
+            if not self.add_macro(macros, line, filepath):
+                return
+
+            line = f.readline().replace("\n", "")
+
+        while True:
+            #
+            # Initial position and orientation
+            #
+            if mower_count:
+                line = f.readline().replace("\n", "")
+
+            new_mower = self.get_next_mower_position_and_orientation(line)
+
+            if new_mower is None:
+                self.stream_ok = self.is_end_of_mowers(line, mower_count, filepath, len(macros))
+                return
+
+            #
+            # Instruction list
+            #
+            line = f.readline().replace("\n", "")
+
+            if not line:
+                self.print_missing_instructions_error(mower_count, filepath, len(macros))
+                return
+
+            line = self.get_instruction_list(line, macros, mower_count, filepath)
+
+            if line is None:
+                return
+
+            new_mower.update({"instruction_list": line})
+            mower_count += 1
+
+            yield new_mower
+
+    @staticmethod
+    def is_macro(line):
+        """
+            Tells if the specified line is a macro definition (see
+            lawnmower.src.program_tree.ProgramTree.macro_pattern).
+
+        :param line: (str/bytes) The line, without the trailing new line.
+        :return: (bool) True if it is a macro definition; False otherwise.
+        """
+        return line.lstrip()[:1] in ("$", b"$")
+
+    @staticmethod
+    def add_macro(macros, line, filepath):
+        """
+            Parses a macro definition, reporting any error. Macros can not be redefined.
+
+        :param macros: (dict) Macros already read, by name, where the new one is added.
+        :param line: (str) The macro definition, without the trailing new line.
+        :param filepath: (str) Path to the configuration file being read (for error reporting only).
+        :return: (bool) True if the macro was successfully added; False otherwise.
+        """
+        macro = lawnmower.src.program_tree.ProgramTree.parse_macro(line, macros)
+
+        if macro is None or macro[0] in macros:
+            print(ConfigFile.invalid_format_error.format(filepath, len(macros) + 2))
+            return False
+
+        name, program_tree = macro
+        macros[name] = program_tree
+
+        return True
+
+    @staticmethod
+    def get_instruction_list(line, macros, mower_count, filepath):
+        """
+            Parses the instruction list of a mower, reporting any error. Instruction lists using repeat blocks or
+            macros are parsed into program trees (see lawnmower.src.program_tree.ProgramTree). Otherwise, they are
+            kept as they are.
+
+        :param line: (str) The instruction list, without the trailing new line.
+        :param macros: (dict) Macros already read, by name.
+        :param mower_count: (int) Number of mowers already read (i.e., not including this one).
+        :param filepath: (str) Path to the configuration file being read (for error reporting only).
+        :return: (str/lawnmower.src.program_tree.ProgramTree) The instruction list. Returns None in case of invalid
+                    format.
+        """
+        if not lawnmower.src.program_tree.ProgramTree.is_program_tree(line):
+            return line
+
+        program_tree = lawnmower.src.program_tree.ProgramTree.parse(line, macros)
+
+        if program_tree is None:
+            print(ConfigFile.invalid_format_error.format(filepath, 2 * (mower_count + 1) + 1 + len(macros)))
+
+        return program_tree
 
     def load(self, filepath):
         """
             Reads the specified file and updates the information according to its contain.
 
-            TODO: For the sake of readability, split this long method into:
-                    get_lawn_info, get_next_mower_position_and_orientation, get_next_mower_instructions
-
+            Binary scenario files (see lawnmower.src.scenario_file.BinaryScenarioFile) are automatically detected and
+            loaded as well. If there is a cache (see self.cache), parsed files are stored in it, so that loading them
+            again does not require any parsing.
 
         :param filepath: (str) Path to the configuration file to be loaded.
         :return: (bool) True if the file was successfully loaded; False otherwise.
         """
         result = False
 
+        if lawnmower.src.scenario_file.BinaryScenarioFile.is_binary_scenario_file(filepath):
+            return self.load_binary(filepath)
+
+        if self.cache is not None and self.cache.load(self, filepath):
+            return True
+
         try:
             with self.open_file(filepath) as f:
                 # Add lawn info
-                line = f.readline().replace("\n", "")
-                try:
-                    lawn_x_max, lawn_y_max = line.split()
-
-                except ValueError:
-                    print("ERROR while loading configuration file '{}' : Invalid format in line 1 '{}'".format(filepath,
-                                                                                                               line))
-                    line = ""
-
-                mowers = []
-                # print("\nSTEP 1 - line: {}".format(line))  # DEBUGGING
-
-                while line:
-                    #
-                    # Add info of the next mower
-                    #
-                    # print("STEP 2 - line: {}".format(line))  # DEBUGGING
-                    try:
-                        #
-                        # Initial position and orientation
-                        #
-                        line = f.readline().replace("\n", "")
-                        # print("STEP 3 - line: {}".format(line))  # DEBUGGING
-                        line_parts = line.split()
-                        new_mower = {"initial_position": (line_parts[0], line_parts[1]),
-                                     "initial_orientation": line_parts[2]}
-
-                    except IndexError:
-                        # print("STEP 4")  # DEBUGGING
-
-                        if not line and len(mowers) == 0:
-                            # print("STEP 5")  # DEBUGGING
-                            print("ERROR while loading configuration file '{}' : Invalid format - Missing mowers "
-                                  "info in line {}".format(filepath, 2 * (len(mowers) + 1)))
-
-                        elif line:
-                            # print("STEP 6")  # DEBUGGING
-                            print("ERROR while loading configuration file '{}' : Invalid format in line {}".format(
-                                filepath, 2 * (len(mowers) + 1)))
-
-                        else:
-                            # In this case there is NO error. Already read valid info
-                            result = True
-                            # print("STEP 7")  # DEBUGGING
-                            break
-
-                        # print("STEP 8")  # DEBUGGING
-                        return result
-
-                    #
-                    # Instruction list
-                    #
-                    line = f.readline().replace("\n", "")
-                    # print("STEP 9")  # DEBUGGING
-
-                    if line:
-                        new_mower.update({"instruction_list": line})
-                        mowers.append(new_mower)
-                        # print("STEP 10")  # DEBUGGING
-                    else:
-                        print("ERROR while loading configuration file '{}' : Invalid format - Missing mower #{} "
-                              "instructions info in line {}".format(filepath, len(mowers) + 1,
-                                                                    2 * (len(mowers) + 1) + 1))
-                        # print("STEP 11")  # DEBUGGING
-                        return result
-
-                # print("STEP 12")  # DEBUGGING
-                if len(mowers) > 0:
+                lawn_info = self.get_lawn_info(f.readline(), filepath)
+
+                if lawn_info is not None:
+                    # Add info of all mowers
+                    mowers = self.new_mowers()
+                    macros = {}
+                    added = all(self.add_mower(mowers, mower_info, filepath, len(macros))
+                                for mower_info in self.read_mowers(f, filepath, macros))
+
+                    if added and self.stream_ok and len(mowers) > 0:
+                        # If everything is OK, update the loaded configuration
+                        self.lawn_x_max, self.lawn_y_max = lawn_info
+                        self.mowers = mowers
+                        self.macros = macros
+                        result = True
+
+            if result and self.cache is not None:
+                self.cache.store(self, filepath)
+
+        except TypeError:
+            print("ERROR while loading configuration : Invalid filepath '{}'".format(filepath))
+
+        except FileNotFoundError:
+            print("ERROR while loading configuration : File not found '{}'".format(filepath))
+
+        except Exception as e:
+            print("Unexpected ERROR while loading configuration from file '{}' : {}\n{}".format(filepath, e,
+                                                                                                traceback.format_exc()))
+
+        return result
+
+    def load_binary(self, filepath):
+        """
+            Loads the specified binary scenario file (see lawnmower.src.scenario_file.BinaryScenarioFile), without
+            copying its contents, and updates the information accordingly. The mowers are stored in a read-only
+            lawnmower.src.scenario_file.BinaryMowerTable, and the coordinates of the lawn as integers.
+
+        :param filepath: (str) Path to the binary scenario file to be loaded.
+        :return: (bool) True if the file was successfully loaded; False otherwise.
+        """
+        binary_scenario_file = lawnmower.src.scenario_file.BinaryScenarioFile()
+
+        if not binary_scenario_file.load(filepath):
+            return False
+
+        self.lawn_x_max = binary_scenario_file.lawn_x_max
+        self.lawn_y_max = binary_scenario_file.lawn_y_max
+        self.mowers = binary_scenario_file.mowers
+
+        return True
+
+    @staticmethod
+    def strip_line(line):
+        """
+            Removes the trailing new line of a raw line (same as universal newlines in text mode).
+
+        :param line: (bytes) Raw line, as read.
+        :return: (bytes) The line without its trailing new line.
+        """
+        if line.endswith(b"\n"):
+            line = line[:-1]
+
+        if line.endswith(b"\r"):
+            line = line[:-1]
+
+        return line
+
+    def parse_buffer(self, buffer, filepath, macros=None):
+        """
+            Parses the raw contents of a configuration file, producing the very same info (and errors) as load. Line
+            boundaries are found directly in the raw bytes (i.e., buffer.readline), and only the parsed values are
+            decoded.
+
+        :param buffer: (mmap.mmap/file) Raw contents of the configuration file, positioned at its beginning. Any object
+                    with a readline method returning bytes is allowed (e.g., a file opened in binary mode).
+        :param filepath: (str) Path to the configuration file being parsed (for error reporting only).
+        :param macros: (dict) Where the macros read are added, by name (see read_mowers).
+        :return: (tuple) (lawn_x_max, lawn_y_max, mowers) as they would be stored by load. Returns None in case of
+                    invalid format.
+        """
+        readline = buffer.readline
+
+        line = self.strip_line(readline())
+        line_parts = line.split()
+
+        if len(line_parts) != 2:
+            print(self.invalid_lawn_info_error.format(filepath, line.decode()))
+            return None
+
+        lawn_x_max, lawn_y_max = line_parts[0].decode(), line_parts[1].decode()
+        mowers = self.new_mowers()
+        append = mowers.append
+        append_values = mowers.append_values if self.compact else None
+        macros = {} if macros is None else macros
+        is_program_tree = lawnmower.src.program_tree.ProgramTree.is_program_tree
+
+        line = readline()
+
+        while self.is_macro(line):
+            if not self.add_macro(macros, self.strip_line(line).decode(), filepath):
+                return None
+
+            line = readline()
+
+        while True:
+            # Initial position and orientation
+            if len(mowers):
+                line = readline()
+
+            line_parts = line.split()
+
+            if len(line_parts) < 3:
+                if not self.is_end_of_mowers(self.strip_line(line), len(mowers), filepath, len(macros)):
+                    return None
+
+                break
+
+            # Instruction list
+            instruction_list = readline().rstrip(b"\r\n")
+
+            if not instruction_list:
+                self.print_missing_instructions_error(len(mowers), filepath, len(macros))
+                return None
+
+            if is_program_tree(instruction_list):
+                instruction_list = self.get_instruction_list(instruction_list.decode(), macros, len(mowers), filepath)
+
+                if instruction_list is None:
+                    return None
+
+            if append_values is None:
+                append({"initial_position": (line_parts[0].decode(), line_parts[1].decode()),
+                        "initial_orientation": line_parts[2].decode(),
+                        "instruction_list": instruction_list if not isinstance(instruction_list, bytes)
+                        else instruction_list.decode()})
+                continue
+
+            try:
+                append_values(line_parts[0], line_parts[1], line_parts[2], instruction_list)
+
+            except (ValueError, OverflowError):
+                print(self.invalid_format_error.format(filepath, 2 * (len(mowers) + 1) + len(macros)))
+                return None
+
+        return lawn_x_max, lawn_y_max, mowers
+
+    def load_mmap(self, filepath):
+        """
+            Same as load, but memory-mapping the file instead of reading it line by line. Line boundaries are found
+            directly in the raw bytes, and only the parsed values are decoded, which is much faster for huge files.
+
+            Compressed files (see open_file) cannot be mapped, so they are parsed as they are decompressed.
+
+            NOTE: Only "\n" and "\r\n" line endings are supported (i.e., not old Mac "\r" ones).
+
+        :param filepath: (str) Path to the configuration file to be loaded.
+        :return: (bool) True if the file was successfully loaded; False otherwise.
+        """
+        result = False
+        macros = {}
+
+        try:
+            with self.open_file(filepath, "rb") as f:
+                if not isinstance(f, io.BufferedReader):
+                    # Compressed files cannot be mapped. Parse them as they are decompressed
+                    parsed = self.parse_buffer(f, filepath, macros)
+
+                elif os.fstat(f.fileno()).st_size == 0:
+                    # Empty files cannot be mapped
+                    parsed = self.parse_buffer(io.BytesIO(), filepath, macros)
+
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                        parsed = self.parse_buffer(buffer, filepath, macros)
+
+                if parsed is not None and len(parsed[2]) > 0:
                     # If everything is OK, update the loaded configuration
-                    self.lawn_x_max = lawn_x_max
-                    self.lawn_y_max = lawn_y_max
-                    self.mowers = mowers
+                    self.lawn_x_max, self.lawn_y_max, self.mowers = parsed
+                    self.macros = macros
                     result = True
 
         except TypeError:
@@ -151,3 +604,68 @@ class ConfigFile:
                                                                                                 traceback.format_exc()))
 
         return result
+
+    def iter_mowers(self, filepath):
+        """
+            Lazily reads the specified file, so that huge configuration files can be processed without keeping all
+            mowers in memory (see lawnmower.src.scheduler.Scheduler.iter_run).
+
+            The first line is read right away, updating the lawn info (i.e., lawn_x_max and lawn_y_max), whereas the
+            info of each mower is only read when the returned generator is iterated. Notice that self.mowers is NOT
+            updated, unlike self.macros, which are read along with the first mower. Errors are reported just like load
+            does, stopping the iteration at the first one found (see self.stream_ok).
+
+        :param filepath: (str) Path to the configuration file to be read ("-" for the standard input).
+        :return: (generator of dict) Info of each mower, in order of appearance (see self.mowers). Returns None if the
+                    file could not be opened or its first line is invalid.
+        """
+        try:
+            f = self.open_file(filepath)
+
+        except TypeError:
+            print("ERROR while loading configuration : Invalid filepath '{}'".format(filepath))
+            return None
+
+        except FileNotFoundError:
+            print("ERROR while loading configuration : File not found '{}'".format(filepath))
+            return None
+
+        except Exception as e:
+            print("Unexpected ERROR while loading configuration from file '{}' : {}\n{}".format(filepath, e,
+                                                                                                traceback.format_exc()))
+            return None
+
+        try:
+            lawn_info = self.get_lawn_info(f.readline(), filepath)
+
+        except UnicodeDecodeError:
+            # E.g., a binary scenario file, which cannot be read as it arrives (see
+            #   lawnmower.src.scenario_file.BinaryScenarioFile)
+            print(self.not_text_error.format(filepath))
+            lawn_info = None
+
+        if lawn_info is None:
+            f.close()
+            return None
+
+        self.lawn_x_max, self.lawn_y_max = lawn_info
+        self.macros = {}
+
+        return self._iter_opened_file(f, filepath)
+
+    def _iter_opened_file(self, f, filepath):
+        """
+            Generator wrapping read_mowers so that the file is closed once the iteration finishes (see iter_mowers).
+        """
+        try:
+            with f:
+                yield from self.read_mowers(f, filepath, self.macros)
+
+        except UnicodeDecodeError:
+            self.stream_ok = False
+            print(self.not_text_error.format(filepath))
+
+        except Exception as e:
+            self.stream_ok = False
+            print("Unexpected ERROR while loading configuration from file '{}' : {}\n{}".format(filepath, e,
+                                                                                                traceback.format_exc()))
@@ -0,0 +1,340 @@
+import os
+import mmap
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.program_tree import ProgramTree
+from lawnmower.src.scenario_file import BinaryScenarioFile
+
+
+class ConfigFileValidator:
+    """
+        Validates huge configuration files (see lawnmower.src.config_file.ConfigFile) using several processes.
+
+        Unlike ConfigFile.load, validation does not stop at the first error, but reports all of them. The file is split
+        into chunks at mower boundaries (i.e., every chunk begins with the initial position line of a mower), which are
+        checked in parallel. The format rules are exactly the same as those of ConfigFile.load, so are the error
+        messages and line numbers. Macros (see ConfigFile.macros) are validated first, and then shared by all chunks.
+    """
+    # Minimum size of each chunk (in bytes), to avoid wasting time in inter-process communication for small files
+    min_chunk_size = 1 << 20
+
+    # Size of the blocks in which each chunk is read when counting lines (in bytes)
+    block_size = 1 << 24
+
+    def __init__(self, processes=None):
+        """
+            Initializes the validator.
+
+        :param processes: (int) Number of processes to use. If not specified, as many as CPUs.
+        :return: None
+        """
+        # Number of processes to use (int)
+        self.processes = processes or os.cpu_count() or 1
+
+        # Errors found in the last validated file, ordered by line (list of tuples (<line_number>, <message>))
+        self.errors = []
+
+        # Number of mowers found in the last validated file (int)
+        self.mower_count = 0
+
+    @staticmethod
+    def open_buffer(filepath):
+        """
+            Maps the specified file into memory.
+
+        :param filepath: (str) Path to the file.
+        :return: (mmap.mmap) The mapped file. Returns None if the file is empty (empty files cannot be mapped).
+        """
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def count_lines(cls, filepath, start, end):
+        """
+            Counts the new lines within the specified chunk of a file.
+
+        :param filepath: (str) Path to the file.
+        :param start: (int) Offset of the first byte of the chunk.
+        :param end: (int) Offset just after the last byte of the chunk.
+        :return: (int) Number of new lines.
+        """
+        with cls.open_buffer(filepath) as buffer:
+            return sum(buffer[offset:min(offset + cls.block_size, end)].count(b"\n")
+                       for offset in range(start, end, cls.block_size))
+
+    @classmethod
+    def validate_chunk(cls, filepath, start, end, first_line_number, macros=None, line_offset=0):
+        """
+            Validates the mowers within the specified chunk of a configuration file.
+
+        :param filepath: (str) Path to the configuration file.
+        :param start: (int) Offset of the first byte of the chunk. It MUST be the beginning of a mower (i.e., its
+                    initial position and orientation line).
+        :param end: (int) Offset just after the last byte of the chunk. It MUST be the end of a mower (i.e., its
+                    instruction list line) or the end of the file.
+        :param first_line_number: (int) Line number of the first line of the chunk (in the whole file).
+        :param macros: (dict) Program trees of the macros, by name (see ConfigFile.macros).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: (tuple)    (<errors>, <mower_count>, <end_line_number>)
+
+                with:
+                        <errors> : (list of tuples) (<line_number>, <message>) of each error found.
+                        <mower_count> : (int) Number of mowers found.
+                        <end_line_number> : (int) Line number of the end of the mowers info (i.e., the first empty
+                                    line where a mower was expected, including the end of the file), if found within
+                                    the chunk. Otherwise, None.
+        """
+        with cls.open_buffer(filepath) as buffer:
+            buffer.seek(start)
+
+            return cls.validate_mowers(buffer.readline, first_line_number, filepath,
+                                       lambda: buffer.tell() < end or end == len(buffer), macros, line_offset)
+
+    @staticmethod
+    def validate_mowers(readline, first_line_number, filepath, has_more_mowers=lambda: True, macros=None,
+                        line_offset=0):
+        """
+            Validates the mowers read line by line (see validate_chunk).
+
+        :param readline: (function) Returns the next line (bytes), or b"" at the end of the file.
+        :param first_line_number: (int) Line number of the first line to read (in the whole file).
+        :param filepath: (str) Path to the configuration file (for error reporting only).
+        :param has_more_mowers: (function) Tells if there are more mowers to read (e.g., before the end of a chunk).
+        :param macros: (dict) Program trees of the macros, by name (see ConfigFile.macros).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: (tuple) (<errors>, <mower_count>, <end_line_number>) (see validate_chunk).
+        """
+        errors = []
+        mower_count = 0
+        line_number = first_line_number
+
+        while has_more_mowers():
+            # Initial position and orientation
+            line = ConfigFile.strip_line(readline())
+
+            if not line:
+                return errors, mower_count, line_number
+
+            if len(line.split()) < 3:
+                errors.append((line_number, ConfigFile.invalid_format_error.format(filepath, line_number)))
+
+            # Instruction list
+            line = ConfigFile.strip_line(readline())
+
+            if not line:
+                errors.append((line_number + 1, ConfigFile.missing_instructions_error.format(
+                    filepath, (line_number - line_offset) // 2, line_number + 1)))
+
+            elif ProgramTree.is_program_tree(line) and ProgramTree.parse(line.decode(), macros) is None:
+                errors.append((line_number + 1, ConfigFile.invalid_format_error.format(filepath, line_number + 1)))
+
+            mower_count += 1
+            line_number += 2
+
+        return errors, mower_count, None
+
+    def get_chunks(self, buffer, start):
+        """
+            Splits the specified buffer into chunks of whole lines, as many as needed to keep all processes busy.
+
+        :param buffer: (mmap.mmap) The mapped file.
+        :param start: (int) Offset of the first byte to split.
+        :return: (list of int) Offset of the beginning of each chunk, plus the end of the buffer.
+        """
+        chunk_count = max(1, min(4 * self.processes, (len(buffer) - start) // self.min_chunk_size))
+        boundaries = [start]
+
+        for index in range(1, chunk_count):
+            # Move each boundary to the beginning of the next line
+            boundary = buffer.find(b"\n", max(boundaries[-1], start + index * (len(buffer) - start) // chunk_count))
+
+            if boundary == -1:
+                break
+
+            if boundary + 1 > boundaries[-1]:
+                boundaries.append(boundary + 1)
+
+        boundaries.append(len(buffer))
+
+        return boundaries
+
+    def validate_lawn_info(self, line, filepath):
+        """
+            Validates the first line of a configuration file (i.e., lawn info).
+
+        :param line: (bytes) The first line, as read.
+        :param filepath: (str) Path to the configuration file (for error reporting only).
+        :return: None
+        """
+        line = ConfigFile.strip_line(line)
+
+        if len(line.split()) != 2:
+            self.errors.append((1, ConfigFile.invalid_lawn_info_error.format(filepath, line.decode())))
+
+    def validate_macros(self, f, filepath):
+        """
+            Validates the macro definitions right after the lawn info (see ConfigFile.macros). The file is left just
+            after them.
+
+        :param f: (mmap.mmap/file) The configuration file, positioned just after the lawn info.
+        :param filepath: (str) Path to the configuration file (for error reporting only).
+        :return: (tuple) (<macros>, <line_count>) with the program trees of the valid macros, by name, and the number
+                    of macro lines.
+        """
+        macros = {}
+        line_count = 0
+        position = f.tell()
+        line = ConfigFile.strip_line(f.readline())
+
+        while ConfigFile.is_macro(line):
+            macro = ProgramTree.parse_macro(line.decode(), macros)
+
+            if macro is None or macro[0] in macros:
+                self.errors.append((line_count + 2, ConfigFile.invalid_format_error.format(filepath, line_count + 2)))
+
+            else:
+                macros[macro[0]] = macro[1]
+
+            line_count += 1
+            position = f.tell()
+            line = ConfigFile.strip_line(f.readline())
+
+        f.seek(position)
+
+        return macros, line_count
+
+    def validate(self, filepath):
+        """
+            Validates the specified configuration file, updating self.errors and self.mower_count accordingly.
+
+        :param filepath: (str) Path to the configuration file to validate.
+        :return: (bool) True if the file is valid; False otherwise.
+        """
+        self.errors = []
+        self.mower_count = 0
+
+        try:
+            if BinaryScenarioFile.is_binary_scenario_file(filepath):
+                binary_scenario_file = BinaryScenarioFile()
+
+                if binary_scenario_file.load(filepath):
+                    self.mower_count = len(binary_scenario_file.mowers)
+                    return True
+
+                self.errors.append((1, "ERROR while loading binary scenario file '{}'".format(filepath)))
+                return False
+
+            if ConfigFile.get_compression(filepath) is not None:
+                # Compressed files cannot be mapped (nor split). Validate them as they are decompressed
+                with ConfigFile.open_file(filepath, "rb") as f:
+                    self.validate_lawn_info(f.readline(), filepath)
+                    macros, line_offset = self.validate_macros(f, filepath)
+                    self.merge_results(filepath, [self.validate_mowers(f.readline, 2 + line_offset, filepath,
+                                                                       macros=macros, line_offset=line_offset)],
+                                       line_offset)
+
+                return len(self.errors) == 0
+
+            buffer = self.open_buffer(filepath)
+
+            if buffer is None:
+                self.errors = [(1, ConfigFile.invalid_lawn_info_error.format(filepath, "")),
+                               (2, ConfigFile.missing_mowers_error.format(filepath, 2))]
+                return False
+
+            with buffer:
+                self.validate_lawn_info(buffer.readline(), filepath)
+                macros, line_offset = self.validate_macros(buffer, filepath)
+                boundaries = self.get_chunks(buffer, buffer.tell())
+
+            self.validate_chunks(filepath, boundaries, macros, line_offset)
+
+        except TypeError:
+            self.errors.append((0, "ERROR while loading configuration : Invalid filepath '{}'".format(filepath)))
+
+        except FileNotFoundError:
+            self.errors.append((0, "ERROR while loading configuration : File not found '{}'".format(filepath)))
+
+        except Exception as e:
+            self.errors.append((0, "Unexpected ERROR while loading configuration from file '{}' : {}\n{}".format(
+                filepath, e, traceback.format_exc())))
+
+        return len(self.errors) == 0
+
+    def validate_chunks(self, filepath, boundaries, macros=None, line_offset=0):
+        """
+            Validates, in parallel, the specified chunks of a configuration file, merging all the results.
+
+            It works in two steps. First, the lines of every chunk are counted, so that the global line number of each
+            chunk is known and chunks not beginning with a mower are moved one line forward. Then, the chunks are
+            validated.
+
+        :param filepath: (str) Path to the configuration file.
+        :param boundaries: (list of int) Offset of the beginning of each chunk, plus the end of the file. The first
+                    chunk MUST begin with the first mower (i.e., line 2, after the macros if any).
+        :param macros: (dict) Program trees of the macros, by name (see ConfigFile.macros).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: None
+        """
+        chunk_count = len(boundaries) - 1
+
+        # Small files are validated within this very same process
+        executor = ProcessPoolExecutor(max_workers=min(self.processes, chunk_count)) if chunk_count > 1 else None
+        map_function = executor.map if executor else map
+
+        try:
+            line_counts = list(map_function(self.count_lines, [filepath] * chunk_count, boundaries[:-1],
+                                            boundaries[1:]))
+
+            # Align the chunks to mower boundaries
+            first_line_numbers = [2 + line_offset]
+            line_number = 2 + line_offset
+
+            with self.open_buffer(filepath) as buffer:
+                for index in range(1, chunk_count):
+                    line_number += line_counts[index - 1]
+
+                    if (line_number - line_offset) % 2 == 1:
+                        # It begins with an instruction list. Move it to the beginning of the next line (if any)
+                        next_line = buffer.find(b"\n", boundaries[index])
+                        boundaries[index] = len(buffer) if next_line == -1 else next_line + 1
+                        first_line_numbers.append(line_number + 1)
+
+                    else:
+                        first_line_numbers.append(line_number)
+
+            results = list(map_function(self.validate_chunk, [filepath] * chunk_count, boundaries[:-1],
+                                        boundaries[1:], first_line_numbers, [macros] * chunk_count,
+                                        [line_offset] * chunk_count))
+
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.merge_results(filepath, results, line_offset)
+
+    def merge_results(self, filepath, results, line_offset=0):
+        """
+            Merges the results of validating consecutive chunks of a configuration file.
+
+        :param filepath: (str) Path to the configuration file (for error reporting only).
+        :param results: (list of tuples) Result of validating each chunk, in order (see validate_chunk).
+        :param line_offset: (int) Number of lines before the mowers info, besides the lawn info (i.e., macros).
+        :return: None
+        """
+        for errors, mower_count, end_line_number in results:
+            self.errors.extend(errors)
+            self.mower_count += mower_count
+
+            if end_line_number is not None:
+                # Anything after the end of the mowers info is ignored (as ConfigFile.load does)
+                if end_line_number == 2 + line_offset:
+                    self.errors.append((end_line_number,
+                                        ConfigFile.missing_mowers_error.format(filepath, end_line_number)))
+
+                break
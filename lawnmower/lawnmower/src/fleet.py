@@ -0,0 +1,135 @@
+try:
+    import numpy
+except ImportError:
+    # Optional dependency: without it, lawnmower.src.scheduler.Scheduler runs the mowers one by one
+    numpy = None
+
+from lawnmower.src.orientation import Orientation
+
+
+class FleetSimulator:
+    """
+        Vectorized simulation of a whole fleet of mowers, when mower overlapping is allowed (i.e., every mower is
+        independent from the others). Requires NumPy (see is_available).
+
+        The state (x, y, orientation) of all mowers is kept in arrays, and the whole fleet is advanced one instruction
+        index per step: the i-th opcode of every mower (see lawnmower.src.program.Program.opcodes) is applied at once
+        through the transition table of lawnmower.src.orientation.Orientation, and moves are clamped to the lawn
+        bounds. Mowers are sorted by program length, so that those whose program has ended are simply left out of the
+        arrays slices being advanced.
+
+        The result is exactly the same as running each mower through lawnmower.src.mower.Mower.execute.
+    """
+    # Position modification and new orientation, by <orientation> * 3 + <opcode> (see
+    #   lawnmower.src.orientation.Orientation.transitions)
+    transition_x, transition_y, transition_orientation = zip(*(transition for transitions in Orientation.transitions
+                                                               for transition in transitions))
+
+    def __init__(self, lawn):
+        """
+            Initializes an empty fleet.
+
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn on which the mowers are located.
+        :return: None
+        """
+        # The lawn on which the mowers are located (lawnmower.src.lawn.Lawn)
+        self.lawn = lawn
+
+        # Coordinate X of the initial position of each mower (list of int)
+        self.x = []
+
+        # Coordinate Y of the initial position of each mower (list of int)
+        self.y = []
+
+        # Initial orientation integer value of each mower (list of int)
+        self.orientation = []
+
+        # Opcodes of each mower (list of bytes)
+        self.opcodes = []
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    @staticmethod
+    def is_available():
+        """
+            Tells if the vectorized simulation can be used (i.e., NumPy installed).
+
+        :return: (bool) True if available; False otherwise.
+        """
+        return numpy is not None
+
+    def add(self, x, y, orientation, opcodes):
+        """
+            Adds a mower to the fleet.
+
+        :param x: (int) Coordinate X of its initial position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of its initial position. It MUST be within the lawn.
+        :param orientation: (int) Initial orientation integer value (see lawnmower.src.orientation.Orientation).
+        :param opcodes: (bytes) Its compiled program (see lawnmower.src.program.Program.opcodes).
+        :return: (int) Index of the mower within the fleet.
+        """
+        self.x.append(x)
+        self.y.append(y)
+        self.orientation.append(orientation)
+        self.opcodes.append(opcodes)
+
+        return len(self.opcodes) - 1
+
+    def run(self):
+        """
+            Runs the programs of all mowers of the fleet.
+
+        :return: (tuple) (<x>, <y>, <orientation>) final state of every mower, in the order they were added, with:
+                        <x> : (numpy.ndarray of int) Coordinate X of the final position of each mower.
+                        <y> : (numpy.ndarray of int) Coordinate Y of the final position of each mower.
+                        <orientation> : (numpy.ndarray of int) Final orientation integer value of each mower.
+        """
+        lengths = numpy.fromiter(map(len, self.opcodes), dtype=numpy.int64, count=len(self.opcodes))
+
+        # Longest programs first: at step i, only the first active_counts[i] mowers have not finished yet
+        order = numpy.argsort(-lengths, kind="stable")
+        sorted_lengths = lengths[order]
+        active_counts = numpy.searchsorted(-sorted_lengths, -numpy.arange(sorted_lengths[0] if len(order) else 0),
+                                           side="left")
+
+        # All opcodes in a single buffer. Position of the next opcode of each mower within it
+        opcodes = numpy.frombuffer(b"".join(self.opcodes), dtype=numpy.uint8)
+        positions = (numpy.cumsum(lengths) - lengths)[order]
+
+        x = numpy.array(self.x, dtype=numpy.int64)[order]
+        y = numpy.array(self.y, dtype=numpy.int64)[order]
+        orientation = numpy.array(self.orientation, dtype=numpy.int64)[order]
+
+        transition_x = numpy.array(self.transition_x, dtype=numpy.int64)
+        transition_y = numpy.array(self.transition_y, dtype=numpy.int64)
+        transition_orientation = numpy.array(self.transition_orientation, dtype=numpy.int64)
+        lawn = self.lawn
+
+        for active_count in active_counts.tolist():
+            active_x = x[:active_count]
+            active_y = y[:active_count]
+            active_orientation = orientation[:active_count]
+            active_positions = positions[:active_count]
+
+            transitions = active_orientation * 3
+            transitions += opcodes[active_positions]
+
+            # Forward moves leading outside the lawn are ignored: clamping them to its bounds is equivalent
+            active_x += transition_x[transitions]
+            numpy.clip(active_x, lawn.x_min, lawn.x_max, out=active_x)
+            active_y += transition_y[transitions]
+            numpy.clip(active_y, lawn.y_min, lawn.y_max, out=active_y)
+            active_orientation[:] = transition_orientation[transitions]
+
+            active_positions += 1
+
+        # Back to the order the mowers were added
+        final_x = numpy.empty_like(x)
+        final_y = numpy.empty_like(y)
+        final_orientation = numpy.empty_like(orientation)
+        final_x[order] = x
+        final_y[order] = y
+        final_orientation[order] = orientation
+
+        return final_x, final_y, final_orientation
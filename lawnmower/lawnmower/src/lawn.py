@@ -108,6 +108,10 @@ class Lawn:
         :param y: (int) Coordinate in the Y Axis of the cell to check.
         :return: (bool) True if the cell checked is a valid one, contained in the lawn.
         """
+        if type(x) is int and type(y) is int:
+            # No need to convert them (e.g., mower moves)
+            return self.x_min <= x <= self.x_max and self.y_min <= y <= self.y_max
+
         try:
             x_int = int(x)
 
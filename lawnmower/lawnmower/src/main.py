@@ -1,17 +1,41 @@
 import sys
 
+import lawnmower.src.batch
 import lawnmower.src.utils
 import lawnmower.src.config_file
+import lawnmower.src.config_file_validator
+import lawnmower.src.scenario_cache
 import lawnmower.src.scheduler
 
 
+def get_options():
+    """
+        Gets the optional flags from command line (i.e., those arguments starting with "--"), removing them from
+        sys.argv so that the remaining positional arguments can be processed as usual.
+
+        A flag may have a value (e.g., --processes=4). Otherwise, its value is True.
+
+    :return: (dict) The value of each specified flag, by name (without the leading "--").
+    """
+    options = {}
+
+    for argument in sys.argv[1:]:
+        if argument.startswith("--"):
+            name, _, value = argument[2:].partition("=")
+            options[name] = value if value else True
+
+    sys.argv[1:] = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+
+    return options
+
+
 def get_arguments():
     """
         Gets arguments from command line.
 
         NOTE : If no arguments are given prints to stdout an error message, since input_filepath is mandatory.
 
-    :return: (tuple)   (<input_filepath>, <verbose>, <mower_overlapping>)
+    :return: (tuple)   (<input_filepath>, <verbose>, <mower_overlapping>, <options>)
 
             with:
 
@@ -21,10 +45,13 @@ def get_arguments():
 
             <mower_overlapping> : (bool) If True the lawn grid cells are large enough to assume more than a single
                         mower can move/stay in the same cell without interfering each other.
+
+            <options> : (dict) Optional flags (see get_options).
     """
     mower_overlapping = False
     verbose = False
     input_filepath = ""
+    options = get_options()
 
     if len(sys.argv) > 3:
         mower_overlapping = lawnmower.src.utils.get_bool_from_str(sys.argv[3])
@@ -35,30 +62,92 @@ def get_arguments():
     if len(sys.argv) > 1:
         input_filepath = sys.argv[1]
 
-    else:
+    elif not options.get("clear-cache"):
         print("ERROR : missing input_filepath")
-        print("use   : {} <input_filepath> [<verbose>] [<mower_overlapping>]".format(sys.argv[0]))
-        print("\n <input_filepath>    : The path to the text file including all configuration details."
+        print("use   : {} [<options>] <input_filepath> [<verbose>] [<mower_overlapping>]".format(sys.argv[0]))
+        print("\n <input_filepath>    : The path to the text file including all configuration details. If \"-\" it "
+              "\n                       is read from the standard input, and the final position/orientation of "
+              "\n                       each mower is printed as soon as it finishes (neither --compact, "
+              "\n                       --processes nor --simultaneous can be used then)."
               "\n <verbose>           : If True (True, T, t, Yes, Y, y, 1) the output does not only include the final "
               "\n                       position/orientation of each mower but all intermediate steps."
               "\n <mower_overlapping> : If True (True, T, t, Yes, Y, y, 1) the lawn grid cells are large enough to "
               "\n                       assume more than a single mower can move/stay in the same cell without "
-              "\n                       interfering each other.\n")
-
-    return input_filepath, verbose, mower_overlapping
+              "\n                       interfering each other."
+              "\n\n <options>:"
+              "\n --compact           : Stores the mowers in a compact, columnar, table instead of a list of dicts "
+              "\n                       (much less memory for huge fleets)."
+              "\n --check             : Only validates the configuration file, reporting all errors found (without "
+              "\n                       running any mower)."
+              "\n --batch             : Runs all configuration files in a folder (or matching a glob pattern, e.g. "
+              "\n                       'conf/*.txt') given as <input_filepath>, with several processes."
+              "\n --processes=<n>     : Number of processes to use, either for a batch or a check (as many as CPUs "
+              "\n                       by default) or for big fleets and huge instruction lists (a single one by "
+              "\n                       default)."
+              "\n --simultaneous      : All mowers move at once, one instruction per tick, instead of one after the "
+              "\n                       other (only relevant if mower overlapping is not allowed)."
+              "\n --no-cache          : Always parses the configuration file, without using the cache of parsed "
+              "\n                       configuration files."
+              "\n --clear-cache       : Removes all entries of the cache of parsed configuration files.\n")
+
+    return input_filepath, verbose, mower_overlapping, options
 
 
 def main():
     # Get arguments
-    input_filepath, verbose, mower_overlapping = get_arguments()
+    input_filepath, verbose, mower_overlapping, options = get_arguments()
 
-    if input_filepath:
-        # Load configuration
+    # Cache of parsed configuration files
+    cache = None if options.get("no-cache") else lawnmower.src.scenario_cache.ScenarioCache()
+
+    if options.get("clear-cache"):
+        cache_to_clear = cache or lawnmower.src.scenario_cache.ScenarioCache()
+        print("Removed {} entries from scenario cache '{}'".format(cache_to_clear.clear(), cache_to_clear.folder))
+
+    if input_filepath and options.get("check"):
+        # Only validate configuration
+        validator = lawnmower.src.config_file_validator.ConfigFileValidator(
+            processes=lawnmower.src.utils.get_int_from_str(options.get("processes")))
+        valid = validator.validate(input_filepath)
+
+        for _, message in validator.errors:
+            print(message)
+
+        print("{} : {} ({} mowers, {} errors)".format(input_filepath, "OK" if valid else "INVALID",
+                                                      validator.mower_count, len(validator.errors)))
+
+    elif input_filepath and options.get("batch"):
+        # Run a whole batch of configuration files
+        batch_runner = lawnmower.src.batch.BatchRunner(
+            processes=lawnmower.src.utils.get_int_from_str(options.get("processes")), verbose=verbose,
+            mower_overlapping=mower_overlapping, compact=bool(options.get("compact")), cache=cache)
+        batch_runner.run(input_filepath)
+
+    elif input_filepath == "-" and any(options.get(name) for name in ["compact", "processes", "simultaneous"]):
+        # Mowers are run one by one, as soon as they are read, so the whole fleet is never available
+        print("ERROR : --compact, --processes and --simultaneous cannot be used when reading from the standard input")
+
+    elif input_filepath == "-":
+        # Read configuration from the standard input as it arrives, printing each mower as soon as it finishes
         config_file = lawnmower.src.config_file.ConfigFile()
+        mowers_info = config_file.iter_mowers(input_filepath)
 
-        if config_file.load(input_filepath):
-            # Create and run scheduler
+        if mowers_info is not None:
             scheduler = lawnmower.src.scheduler.Scheduler(config_file=config_file, mower_overlapping=mower_overlapping)
+
+            for mower in scheduler.iter_run(mowers_info=mowers_info, verbose=verbose, keep_mowers=False):
+                print(scheduler.get_mower_str(mower), flush=True)
+
+    elif input_filepath:
+        # Load configuration
+        config_file = lawnmower.src.config_file.ConfigFile(compact=bool(options.get("compact")), cache=cache)
+
+        if config_file.load(input_filepath):
+            # Create and run scheduler. Several processes only if explicitly requested
+            scheduler = lawnmower.src.scheduler.Scheduler(
+                config_file=config_file, mower_overlapping=mower_overlapping,
+                processes=lawnmower.src.utils.get_int_from_str(options.get("processes"), default=1),
+                simultaneous=bool(options.get("simultaneous")))
             scheduler.run(verbose=verbose)
             print(scheduler)
 
@@ -1,3 +1,5 @@
+import re
+
 from lawnmower.src.lawn import Lawn
 from lawnmower.src.orientation import Orientation
 
@@ -13,6 +15,15 @@ class Mower:
         "F"     # Forward (moves 1 position in the current orientation)
     ]
 
+    # Opcode of the forward instruction (see lawnmower.src.orientation.Orientation.transitions)
+    forward_opcode = Orientation.opcodes["F"]
+
+    # Run-length encoded instruction lists (e.g., "F1200R L3"): each instruction may be followed by its number of
+    #   repetitions, and runs may be separated by blanks. Lists without any digit are never taken as run-length encoded.
+    run_length_encoded_pattern = re.compile(r"\s*(?:[LRFlrf]\d*\s*)+")
+    run_pattern = re.compile(r"([LRFlrf])(\d*)")
+    digit_pattern = re.compile(r"\d")
+
     def __init__(self, x, y, orientation, lawn):
         """
             Initializes the orientation.
@@ -92,10 +103,18 @@ class Mower:
                         x : (int) Coordinate X of the mower new/predicted position
                         y : (int) Coordinate Y of the mower new/predicted position
         """
-        new_x = int(self.x)
-        new_y = int(self.y)
+        new_x = self.x if type(self.x) is int else int(self.x)
+        new_y = self.y if type(self.y) is int else int(self.y)
 
-        if self.orientation.get_str() == "N":
+        orientation = getattr(self.orientation, "orientation", None)
+
+        if type(orientation) is int and 0 <= orientation < len(Orientation.transitions):
+            # Valid orientation integer value. Simply look the move up in the state transition table
+            dx, dy, _ = Orientation.transitions[orientation][self.forward_opcode]
+            new_x += dx
+            new_y += dy
+
+        elif self.orientation.get_str() == "N":
             new_y += 1
 
         elif self.orientation.get_str() == "E":
@@ -173,6 +192,95 @@ class Mower:
 
         return new_x, new_y
 
+    @classmethod
+    def parse_runs(cls, instruction_list):
+        """
+            Parses a run-length encoded instruction list (see self.run_length_encoded_pattern).
+
+        :param instruction_list: (str) The instruction list (e.g., "F1200R L3").
+        :return: (list of tuples) (<instruction>, <count>) of each run, in chronological order, with the instruction in
+                    upper case (e.g., [("F", 1200), ("R", 1), ("L", 3)]). Returns None if the instruction list is not
+                    run-length encoded (i.e., it must be executed instruction by instruction).
+        """
+        try:
+            if cls.digit_pattern.search(instruction_list) is None or \
+                    cls.run_length_encoded_pattern.fullmatch(instruction_list) is None:
+                return None
+
+        except (TypeError, AttributeError):
+            # Not a str
+            return None
+
+        return [(instruction.upper(), int(count) if count else 1)
+                for instruction, count in cls.run_pattern.findall(instruction_list)]
+
+    def forward_run(self, count, dry_run_mode=False):
+        """
+            Moves several positions forward, according to current orientation, as a single move bounded by the lawn.
+            That is, exactly as count forward instructions would do: the mower stops at the lawn edge.
+
+        :param count: (int) Number of forward instructions.
+        :param dry_run_mode: (bool) Activates/Deactivates dry_run_mode, that allows to predict the expected new position
+                            of the mower if the specified instructions were executed.
+
+        :return: (tuple)    (x, y)
+
+                with:
+                        x : (int) Coordinate X of the mower new/predicted position
+                        y : (int) Coordinate Y of the mower new/predicted position
+        """
+        if count <= 0:
+            return self.x, self.y
+
+        # Direction of the movement, according to a single forward instruction (errors are reported by it)
+        next_x, next_y = self.forward(dry_run_mode=True)
+
+        try:
+            new_x = self.x + (next_x - self.x) * count
+            new_y = self.y + (next_y - self.y) * count
+
+            # Bound the move to the lawn (the mower only moves towards the edge, never beyond it)
+            new_x = max(min(new_x, self.lawn.x_max), self.lawn.x_min) if next_x != self.x else self.x
+            new_y = max(min(new_y, self.lawn.y_max), self.lawn.y_min) if next_y != self.y else self.y
+
+        except (AttributeError, TypeError):
+            # Simply ignore any position modification (the error was already reported)
+            return self.x, self.y
+
+        if not dry_run_mode:
+            # Update current position
+            self.x = new_x
+            self.y = new_y
+
+        return new_x, new_y
+
+    def execute_run(self, instruction, count, dry_run_mode=False):
+        """
+            Executes count times the specified instruction (see execute), as a single operation. Rotations are reduced
+            to at most 3 and forward moves are bounded by the lawn (see forward_run).
+
+        :param instruction: (str) Instruction to be executed (see self.instructions).
+        :param count: (int) Number of times to execute it.
+        :param dry_run_mode: (bool) Activates/Deactivates dry_run_mode, that allows to predict the expected new position
+                            of the mower if the specified instructions were executed.
+
+        :return: (tuple)    (x, y)
+
+                with:
+                        x : (int) Coordinate X of the mower new/predicted position (None if it is a rotation)
+                        y : (int) Coordinate Y of the mower new/predicted position (None if it is a rotation)
+        """
+        if str(instruction).upper() == "F":
+            return self.forward_run(count, dry_run_mode=dry_run_mode)
+
+        x = y = None
+
+        # Four rotations in the same direction lead to the very same orientation
+        for _ in range(count % 4):
+            x, y = self.execute(instruction, dry_run_mode=dry_run_mode)
+
+        return x, y
+
     def execute(self, instruction, dry_run_mode=False):
         """
             Executes the specified instruction. If the dry_mode is active (i.e., True) the mower does not really
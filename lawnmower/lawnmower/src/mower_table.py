@@ -0,0 +1,118 @@
+from array import array
+
+from lawnmower.src.orientation import Orientation
+
+
+class MowerTable:
+    """
+        Compact, columnar, storage of the info of a fleet of mowers (see lawnmower.src.config_file.ConfigFile.mowers).
+
+        Instead of a dict per mower, each field is stored in a typed column:
+
+            * x, y (array of signed long long): Coordinates of the initial position of each mower.
+            * orientation (array of signed char): Initial orientation of each mower, represented as an integer value
+                (see lawnmower.src.orientation.Orientation).
+            * instructions (bytearray): Instruction lists of all mowers, one after another, in a single buffer.
+            * offsets (array of unsigned long long): Offset of the instruction list of each mower within instructions.
+                It has an additional last item, so that the instruction list of mower i is
+                instructions[offsets[i]:offsets[i + 1]].
+
+        It behaves like a list of mower info dicts (i.e., it can be iterated, indexed and appended to), so it can be
+        used wherever such a list is expected (e.g., lawnmower.src.scheduler.Scheduler).
+    """
+    # Integer value of each valid orientation, either as str or bytes. Invalid orientations are stored as North, as
+    #   lawnmower.src.orientation.Orientation does.
+    orientation_codes = dict(Orientation.str_to_int)
+    orientation_codes.update({key.encode(): value for key, value in Orientation.str_to_int.items()})
+
+    def __init__(self):
+        # Coordinate X of the initial position of each mower (array of int)
+        self.x = array("q")
+
+        # Coordinate Y of the initial position of each mower (array of int)
+        self.y = array("q")
+
+        # Initial orientation of each mower, as an integer value (array of int)
+        self.orientation = array("b")
+
+        # Instruction lists of all mowers, one after another (bytearray)
+        self.instructions = bytearray()
+
+        # Offset of the instruction list of each mower within self.instructions, plus the final length (array of int)
+        self.offsets = array("Q", [0])
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        """
+            Gets the info of the specified mower, in the same format as lawnmower.src.config_file.ConfigFile.mowers
+            (but with integer coordinates).
+
+        :param index: (int) Index of the mower (negative values allowed).
+        :return: (dict) The mower info.
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("MowerTable index out of range")
+
+        return {"initial_position": (self.x[index], self.y[index]),
+                "initial_orientation": Orientation.int_to_str[self.orientation[index]],
+                "instruction_list": self.get_instruction_list(index).decode()}
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def get_instruction_list(self, index):
+        """
+            Gets the instruction list of the specified mower, without decoding it.
+
+        :param index: (int) Index of the mower.
+        :return: (bytes) The instruction list.
+        """
+        return bytes(self.instructions[self.offsets[index]:self.offsets[index + 1]])
+
+    def append_values(self, x, y, orientation, instruction_list):
+        """
+            Adds a mower at the end of the table.
+
+        :throws ValueError: If any coordinate is not an integer, or the instruction list is not a plain one (e.g., a
+                    program tree, see lawnmower.src.program_tree.ProgramTree).
+        :throws OverflowError: If any coordinate does not fit in a signed 64-bit integer.
+
+        :param x: (int/str/bytes) Coordinate X of the initial position of the mower.
+        :param y: (int/str/bytes) Coordinate Y of the initial position of the mower.
+        :param orientation: (str/bytes) Initial orientation of the mower (e.g., "N").
+        :param instruction_list: (str/bytes) Instructions to be executed by the mower.
+        :return: None
+        """
+        # Both coordinates are checked before modifying any column (i.e., no partially added mower)
+        x, y = array("q", (int(x), int(y)))
+
+        if isinstance(instruction_list, str):
+            instruction_list = instruction_list.encode()
+
+        elif not isinstance(instruction_list, (bytes, bytearray)):
+            raise ValueError("Not a plain instruction list '{}'".format(instruction_list))
+
+        self.x.append(x)
+        self.y.append(y)
+        self.orientation.append(self.orientation_codes.get(orientation, 0))
+        self.instructions += instruction_list
+        self.offsets.append(len(self.instructions))
+
+    def append(self, mower_info):
+        """
+            Adds a mower at the end of the table (same as list.append).
+
+        :throws ValueError: If any coordinate is not an integer, or the instruction list is not a plain one.
+        :throws OverflowError: If any coordinate does not fit in a signed 64-bit integer.
+
+        :param mower_info: (dict) Info of the mower (see lawnmower.src.config_file.ConfigFile.mowers).
+        :return: None
+        """
+        self.append_values(mower_info["initial_position"][0], mower_info["initial_position"][1],
+                           mower_info["initial_orientation"], mower_info["instruction_list"])
@@ -0,0 +1,244 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class OccupancyIndex:
+    """
+        Positions occupied by mowers (e.g., the final positions of prior mowers, see
+        lawnmower.src.scheduler.Scheduler), hashed so that checking a single position costs O(1), and indexed by row
+        and by column.
+
+        Besides telling if a position is occupied, it finds the nearest occupied position in the way of a straight
+        move, so that a whole run of forward instructions can be bounded at once (see
+        lawnmower.src.program.Program.run).
+    """
+    def __init__(self):
+        # Occupied positions (set of tuples (x, y))
+        self.positions = set()
+
+        # Sorted coordinates X of the occupied positions of each row, by coordinate Y (dict of lists of int)
+        self.rows = {}
+
+        # Sorted coordinates Y of the occupied positions of each column, by coordinate X (dict of lists of int)
+        self.columns = {}
+
+    def add(self, x, y):
+        """
+            Marks the specified position as occupied.
+
+        :param x: (int) Coordinate X of the position.
+        :param y: (int) Coordinate Y of the position.
+        :return: None
+        """
+        self.positions.add((x, y))
+        insort(self.rows.setdefault(y, []), x)
+        insort(self.columns.setdefault(x, []), y)
+
+    def is_occupied(self, x, y):
+        """
+            Tells if the specified position is occupied.
+
+        :param x: (int) Coordinate X of the position.
+        :param y: (int) Coordinate Y of the position.
+        :return: (bool) True if it is occupied; False otherwise.
+        """
+        return (x, y) in self.positions
+
+    def get_free_steps(self, x, y, dx, dy, count):
+        """
+            Gets how many steps can be done from the specified position, in a straight line, before reaching the
+            nearest occupied position (the starting position itself is not checked).
+
+        :param x: (int) Coordinate X of the starting position.
+        :param y: (int) Coordinate Y of the starting position.
+        :param dx: (int) Position modification in the X axis of each step (-1, 0 or 1).
+        :param dy: (int) Position modification in the Y axis of each step (-1, 0 or 1). Either dx or dy must be 0.
+        :param count: (int) Maximum number of steps.
+        :return: (int) Number of steps, up to count.
+        """
+        if dx:
+            line = self.rows.get(y)
+            position = x
+            step = dx
+
+        else:
+            line = self.columns.get(x)
+            position = y
+            step = dy
+
+        if line:
+            if step > 0:
+                index = bisect_right(line, position)
+
+                if index < len(line):
+                    return min(count, line[index] - position - 1)
+
+            else:
+                index = bisect_left(line, position)
+
+                if index > 0:
+                    return min(count, position - line[index - 1] - 1)
+
+        return count
+
+    def is_area_free(self, x_min, x_max, y_min, y_max):
+        """
+            Tells if there is no occupied position within the specified rectangle (edges included).
+
+        :param x_min: (int) Coordinate X of the bottom-left corner.
+        :param x_max: (int) Coordinate X of the upper-right corner.
+        :param y_min: (int) Coordinate Y of the bottom-left corner.
+        :param y_max: (int) Coordinate Y of the upper-right corner.
+        :return: (bool) True if no position within it is occupied; False otherwise.
+        """
+        rows = self.rows
+
+        if len(rows) <= y_max - y_min + 1:
+            lines = (row for y, row in rows.items() if y_min <= y <= y_max)
+
+        else:
+            lines = (rows[y] for y in range(y_min, y_max + 1) if y in rows)
+
+        for row in lines:
+            index = bisect_left(row, x_min)
+
+            if index < len(row) and row[index] <= x_max:
+                return False
+
+        return True
+
+
+class OccupancyGrid:
+    """
+        Positions occupied by mowers, as OccupancyIndex does, but stored as a dense bitmap of the whole lawn (one byte
+        per cell), instead of hashed and indexed positions.
+
+        It is both faster and smaller than OccupancyIndex for small and medium lawns with many mowers, since its size
+        only depends on the lawn area (not on the number of occupied positions). The bitmap is stored twice, row by row
+        and column by column, so that the nearest occupied position in the way of a straight move, along any axis, is
+        found by a single search within a contiguous slice (see get_free_steps).
+    """
+    def __init__(self, lawn):
+        """
+            Initializes the grid, with no occupied position.
+
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn whose positions may be occupied.
+        :return: None
+        """
+        # Coordinates of the bottom-left corner of the lawn (int)
+        self.x_min = lawn.x_min
+        self.y_min = lawn.y_min
+
+        # Coordinates of the upper-right corner of the lawn (int)
+        self.x_max = lawn.x_max
+        self.y_max = lawn.y_max
+
+        # Number of cells of each row and of each column (int)
+        self.width = lawn.x_max - lawn.x_min + 1
+        self.height = lawn.y_max - lawn.y_min + 1
+
+        # Cells of the lawn, row by row from the bottom one, 1 if occupied and 0 otherwise (bytearray)
+        self.rows = bytearray(self.width * self.height)
+
+        # Cells of the lawn, column by column from the leftmost one (bytearray)
+        self.columns = bytearray(self.width * self.height)
+
+        # Number of occupied positions (int)
+        self.count = 0
+
+    def add(self, x, y):
+        """
+            Marks the specified position as occupied.
+
+        :param x: (int) Coordinate X of the position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of the position. It MUST be within the lawn.
+        :return: None
+        """
+        column = x - self.x_min
+        row = y - self.y_min
+        index = row * self.width + column
+
+        if not self.rows[index]:
+            self.rows[index] = 1
+            self.columns[column * self.height + row] = 1
+            self.count += 1
+
+    def is_occupied(self, x, y):
+        """
+            Tells if the specified position is occupied.
+
+        :param x: (int) Coordinate X of the position.
+        :param y: (int) Coordinate Y of the position.
+        :return: (bool) True if it is occupied; False otherwise (e.g., out of the lawn).
+        """
+        return self.x_min <= x <= self.x_max and self.y_min <= y <= self.y_max and \
+            self.rows[(y - self.y_min) * self.width + x - self.x_min] == 1
+
+    def get_free_steps(self, x, y, dx, dy, count):
+        """
+            Gets how many steps can be done from the specified position, in a straight line, before reaching the
+            nearest occupied position (see OccupancyIndex.get_free_steps).
+
+        :param x: (int) Coordinate X of the starting position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of the starting position. It MUST be within the lawn.
+        :param dx: (int) Position modification in the X axis of each step (-1, 0 or 1).
+        :param dy: (int) Position modification in the Y axis of each step (-1, 0 or 1). Either dx or dy must be 0.
+        :param count: (int) Maximum number of steps.
+        :return: (int) Number of steps, up to count.
+        """
+        if not self.count or count <= 0:
+            return count
+
+        if dx:
+            cells = self.rows
+            start = (y - self.y_min) * self.width
+            end = start + self.width
+            position = start + x - self.x_min
+            step = dx
+
+        else:
+            cells = self.columns
+            start = (x - self.x_min) * self.height
+            end = start + self.height
+            position = start + y - self.y_min
+            step = dy
+
+        if step > 0:
+            index = cells.find(1, position + 1, min(end, position + count + 1))
+
+            return count if index < 0 else index - position - 1
+
+        index = cells.rfind(1, max(start, position - count), position)
+
+        return count if index < 0 else position - index - 1
+
+    def is_area_free(self, x_min, x_max, y_min, y_max):
+        """
+            Tells if there is no occupied position within the specified rectangle (edges included). Parts of the
+            rectangle out of the lawn are ignored.
+
+        :param x_min: (int) Coordinate X of the bottom-left corner.
+        :param x_max: (int) Coordinate X of the upper-right corner.
+        :param y_min: (int) Coordinate Y of the bottom-left corner.
+        :param y_max: (int) Coordinate Y of the upper-right corner.
+        :return: (bool) True if no position within it is occupied; False otherwise.
+        """
+        if not self.count:
+            return True
+
+        first_column = max(x_min, self.x_min) - self.x_min
+        last_column = min(x_max, self.x_max) - self.x_min
+        first_row = max(y_min, self.y_min) - self.y_min
+        last_row = min(y_max, self.y_max) - self.y_min
+
+        if last_row - first_row <= last_column - first_column:
+            # Fewer rows than columns: search row by row
+            for row in range(first_row, last_row + 1):
+                if self.rows.find(1, row * self.width + first_column, row * self.width + last_column + 1) >= 0:
+                    return False
+
+        else:
+            for column in range(first_column, last_column + 1):
+                if self.columns.find(1, column * self.height + first_row, column * self.height + last_row + 1) >= 0:
+                    return False
+
+        return True
@@ -14,6 +14,24 @@ class Orientation:
 
     str_to_int = {value: key for key, value in int_to_str.items()}
 
+    # Opcode of each mower instruction (see lawnmower.src.mower.Mower.instructions)
+    opcodes = {
+        "L": 0,     # Left Rotate
+        "R": 1,     # Right Rotate
+        "F": 2      # Forward
+    }
+
+    # Translation table from instructions (either upper or lower case) to opcodes (see opcodes), one per byte
+    instructions_to_opcodes = bytes.maketrans(b"LRFlrf", b"\x00\x01\x02\x00\x01\x02")
+
+    # Mower state transition table, indexed by orientation integer value and opcode. Each transition is a tuple
+    #   (<dx>, <dy>, <new_orientation>) with the position modification (if within the lawn) and the new orientation.
+    #   For instance, a forward instruction facing East is transitions[1][2], that is (1, 0, 1).
+    transitions = tuple(((0, 0, (orientation - 1) % 4),                   # Left Rotate
+                         (0, 0, (orientation + 1) % 4),                   # Right Rotate
+                         ((0, 1, 0, -1)[orientation], (1, 0, -1, 0)[orientation], orientation))    # Forward
+                        for orientation in range(len(int_to_str)))
+
     def __init__(self, orientation_str=None):
         """
             Initializes the orientation.
@@ -78,19 +96,8 @@ class Orientation:
                 print("Recalibrating to '{}' ...".format(self.int_to_str[0]))
                 self.orientation = 0
 
-            if right:
-                # Rotates to the right. That is, adding 1
-                self.orientation += 1
-
-                if self.orientation >= len(self.int_to_str):
-                    self.orientation = 0
-
-            else:
-                # Rotates to the left. That is, subtracting 1
-                self.orientation -= 1
-
-                if self.orientation < 0:
-                    self.orientation = len(self.int_to_str) - 1
+            # Rotates to the right (i.e., adding 1) or to the left (i.e., subtracting 1)
+            self.orientation = self.transitions[self.orientation][self.opcodes["R" if right else "L"]][2]
 
         except TypeError:
             print("ERROR while rotating : Invalid orientation '{}'".format(self.orientation))
@@ -0,0 +1,154 @@
+import os
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+import lawnmower.src.config_file
+import lawnmower.src.program_tree
+import lawnmower.src.scheduler
+
+
+class ParallelFleetRunner:
+    """
+        Runs a whole fleet of mowers using several processes, when mower overlapping is allowed (i.e., every mower is
+        independent from the others).
+
+        The fleet is split into contiguous chunks of mowers, each one run within a worker process by a
+        lawnmower.src.scheduler.Scheduler of its own, and the final states are gathered back in the original order.
+        Chunks are balanced by number of instructions, not by number of mowers, so that a few huge instruction lists do
+        not leave the other processes idle: a mower with a huge instruction list gets a chunk of its own (or shares it
+        with just a few other mowers), whereas mowers with short ones are packed together. The heaviest chunks are
+        sent first.
+    """
+    # Minimum number of instructions of each chunk, to avoid wasting time in inter-process communication for small
+    #   fleets
+    min_chunk_instructions = 1 << 20
+
+    # Number of chunks per process, so that the processes finishing their chunks earlier take the remaining ones
+    chunks_per_process = 4
+
+    def __init__(self, processes=None, compile_programs=True, cache_programs=True, vectorized=False):
+        """
+            Initializes the runner.
+
+        :param processes: (int) Number of processes to use. If not specified, as many as CPUs.
+        :param compile_programs: (bool) Tells if instruction lists are compiled (see
+                    lawnmower.src.scheduler.Scheduler).
+        :param cache_programs: (bool) Tells if compiled programs, and their results, are cached within each process (see
+                    lawnmower.src.scheduler.Scheduler).
+        :param vectorized: (bool) Tells if each chunk is run at once (see lawnmower.src.scheduler.Scheduler).
+        :return: None
+        """
+        # Number of processes to use (int)
+        self.processes = processes or os.cpu_count() or 1
+
+        # Tells if instruction lists are compiled before being run (bool)
+        self.compile_programs = compile_programs
+
+        # Tells if compiled programs, and their results, are cached (bool)
+        self.cache_programs = cache_programs
+
+        # Tells if each chunk is run at once, whenever possible (bool)
+        self.vectorized = vectorized
+
+    @staticmethod
+    def get_instruction_count(instruction_list):
+        """
+            Gets the number of instructions of the specified instruction list, as a measure of the time needed to run
+            it. Program trees (see lawnmower.src.program_tree.ProgramTree) are never expanded, so they take about as
+            long as a single instruction per item.
+
+        :param instruction_list: (str/bytes/lawnmower.src.program_tree.ProgramTree) The instructions.
+        :return: (int) Its number of instructions.
+        """
+        if isinstance(instruction_list, lawnmower.src.program_tree.ProgramTree):
+            return len(instruction_list.items)
+
+        return len(instruction_list)
+
+    def get_chunks(self, instruction_counts):
+        """
+            Splits a fleet into contiguous chunks with about the same number of instructions, as many as needed to keep
+            all processes busy.
+
+        :param instruction_counts: (list of int) Number of instructions of each mower (see get_instruction_count).
+        :return: (list of int) Index of the first mower of each chunk, plus the number of mowers.
+        """
+        # Every mower takes some time, no matter how short its instruction list is
+        cumulative_counts = list(accumulate(count + 1 for count in instruction_counts))
+        total_count = cumulative_counts[-1] if cumulative_counts else 0
+        chunk_count = max(1, min(self.chunks_per_process * self.processes, total_count // self.min_chunk_instructions,
+                                 len(instruction_counts)))
+        boundaries = [0]
+
+        for index in range(1, chunk_count):
+            # Move each boundary either right before or right after the mower reaching its share of instructions,
+            #   whichever is closer (i.e., a huge instruction list is not packed together with the prior mowers)
+            share = index * total_count // chunk_count
+            boundary = bisect_left(cumulative_counts, share)
+            prior_count = cumulative_counts[boundary - 1] if boundary else 0
+
+            if cumulative_counts[boundary] - share <= share - prior_count:
+                boundary += 1
+
+            if boundaries[-1] < boundary < len(instruction_counts):
+                boundaries.append(boundary)
+
+        boundaries.append(len(instruction_counts))
+
+        return boundaries
+
+    def run_chunk(self, lawn_x_max, lawn_y_max, mowers_info):
+        """
+            Runs a chunk of mowers (within a worker process).
+
+        :param lawn_x_max: (int) Coordinate X of the upper-right corner of the lawn.
+        :param lawn_y_max: (int) Coordinate Y of the upper-right corner of the lawn.
+        :param mowers_info: (list of dict) Info of the mowers (see lawnmower.src.config_file.ConfigFile.mowers). They
+                    MUST be properly initialized.
+        :return: (list of tuples) (x, y, orientation) final state of each mower, in order, with the orientation as an
+                    integer value (see lawnmower.src.orientation.Orientation).
+        """
+        config_file = lawnmower.src.config_file.ConfigFile()
+        config_file.lawn_x_max = lawn_x_max
+        config_file.lawn_y_max = lawn_y_max
+        config_file.mowers = mowers_info
+
+        # A single process within each worker (i.e., no nested processes)
+        scheduler = lawnmower.src.scheduler.Scheduler(config_file=config_file, mower_overlapping=True,
+                                                      compile_programs=self.compile_programs,
+                                                      cache_programs=self.cache_programs, vectorized=self.vectorized,
+                                                      processes=1)
+        scheduler.run()
+
+        return [(mower.x, mower.y, mower.orientation.orientation) for mower in scheduler.mowers]
+
+    def run(self, lawn_x_max, lawn_y_max, mowers_info):
+        """
+            Runs the specified mowers, with mower overlapping allowed.
+
+        :param lawn_x_max: (int) Coordinate X of the upper-right corner of the lawn.
+        :param lawn_y_max: (int) Coordinate Y of the upper-right corner of the lawn.
+        :param mowers_info: (list of dict) Info of the mowers (see lawnmower.src.config_file.ConfigFile.mowers). They
+                    MUST be properly initialized.
+        :return: (list of tuples) (x, y, orientation) final state of each mower, in the order they were given (see
+                    run_chunk).
+        """
+        instruction_counts = [self.get_instruction_count(mower_info["instruction_list"]) for mower_info in mowers_info]
+        boundaries = self.get_chunks(instruction_counts)
+        chunk_count = len(boundaries) - 1
+
+        if chunk_count <= 1:
+            # Small fleets are run within this very same process
+            return self.run_chunk(lawn_x_max, lawn_y_max, mowers_info)
+
+        chunk_instruction_counts = [sum(instruction_counts[start:end])
+                                    for start, end in zip(boundaries[:-1], boundaries[1:])]
+        futures = [None] * chunk_count
+
+        with ProcessPoolExecutor(max_workers=min(self.processes, chunk_count)) as executor:
+            for index in sorted(range(chunk_count), key=chunk_instruction_counts.__getitem__, reverse=True):
+                futures[index] = executor.submit(self.run_chunk, lawn_x_max, lawn_y_max,
+                                                 mowers_info[boundaries[index]:boundaries[index + 1]])
+
+            return [state for future in futures for state in future.result()]
@@ -0,0 +1,506 @@
+import re
+
+import lawnmower.src.mower
+import lawnmower.src.program_tree
+from lawnmower.src.orientation import Orientation
+
+
+class Program:
+    """
+        Compiled instruction list of a mower (see lawnmower.src.mower.Mower.instructions).
+
+        The instruction list is validated, and normalised to upper case, only once, when compiled into an opcode
+        buffer (one opcode per byte, the same ones as lawnmower.src.orientation.Orientation.opcodes). The
+        opcodes are then run by a dedicated loop which keeps the whole mower state in local variables, instead of going
+        through lawnmower.src.mower.Mower.execute for every instruction. The result is exactly the same.
+
+        Programs mostly made up of long straight runs of forward instructions (e.g., sweep patterns) are further
+        reduced to a sequence of moves, each one being a rotation followed by a run of forward instructions (e.g.,
+        "FFLRRFFF" is [(0, 2), (1, 3)]). Every run is then applied as a single move bounded by the lawn (and by the
+        nearest occupied position, if any), no matter how long it is.
+
+        Besides, as long as no forward instruction is ignored, a program just moves the mower by a fixed displacement
+        and rotation, for a given initial orientation. Once a program has been run more than once, it is analysed to
+        get, for each initial orientation, its displacement envelope (i.e., the minimum and maximum offsets reached
+        along its whole trajectory). Mowers whose envelope fits inside the lawn (without any occupied position) then
+        get their final state in O(1). Only mowers near the lawn edges (or other mowers) are run step by step.
+
+        Long programs which are just a short pattern repeated over and over again (e.g., "LFLFLFLF...") are run
+        pattern by pattern instead. The lawn, and any occupied position, do not change while running them, so the
+        state (x, y, orientation) after each pattern only depends on the state before it. As soon as a state repeats,
+        the rest of the run is periodic, and whole cycles are skipped arithmetically. Only the remaining patterns, and
+        the trailing partial pattern, are actually run.
+
+        Programs written with repeat blocks and macros (see lawnmower.src.program_tree.ProgramTree) are never expanded:
+        when no other mower can block them, their final state is given by their transfer function. Otherwise, they are
+        run node by node, so that only the parts of them which may collide with other mowers are run step by step.
+    """
+    # Opcode of each instruction
+    rotate_left_opcode = Orientation.opcodes["L"]
+    rotate_right_opcode = Orientation.opcodes["R"]
+    forward_opcode = Orientation.opcodes["F"]
+
+    # Position modification of a forward instruction, by orientation integer value (see
+    #   lawnmower.src.orientation.Orientation.transitions)
+    forward_x, forward_y, _ = zip(*(transition[Orientation.opcodes["F"]] for transition in Orientation.transitions))
+
+    # Maximum ratio of rotations for the opcodes to be reduced to moves. Otherwise, runs are too short to pay off
+    max_rotation_ratio = 0.25
+
+    # Each move within the opcodes: rotations followed by forward instructions
+    move_pattern = re.compile(b"([%c%c]*)(%c*)" % (rotate_left_opcode, rotate_right_opcode, forward_opcode))
+
+    # Number of runs of a program before getting its displacement envelopes (i.e., programs run only once are not
+    #   worth analysing)
+    envelope_min_runs = 2
+
+    # Minimum number of repetitions of a pattern for the program to be run pattern by pattern (see get_period)
+    min_pattern_repeats = 4
+
+    # Number of opcodes looked for in order to find the candidate periods of the program (see get_period)
+    pattern_prefix_length = 16
+
+    # Maximum number of states tracked while looking for a cycle (see run_periodic)
+    max_cycle_states = 1 << 16
+
+    def __init__(self, opcodes=None, moves=None, tree=None):
+        """
+            Initializes the program. At least, either its opcodes, its moves or its tree must be specified.
+
+        :param opcodes: (bytes) The opcodes, one per byte, if compiled from a plain instruction list.
+        :param moves: (list of tuples) (<rotation>, <forward_count>) of each move, in chronological order, with:
+                        <rotation> : (int) Number of 90 degrees right rotations (0 to 3) before moving forward.
+                        <forward_count> : (int) Number of forward instructions.
+        :param tree: (lawnmower.src.program_tree.ProgramTree) The program tree, if compiled from one.
+        :return: None
+        """
+        # Opcodes of the program, one per byte (bytes). None if compiled from a run-length encoded instruction list
+        self.opcodes = opcodes
+
+        # Moves of the program (list of tuples (<rotation>, <forward_count>)). If any, they are run instead of the
+        #   opcodes
+        self.moves = moves
+
+        # Displacement envelope of the program by initial orientation integer value (list of tuples, see
+        #   get_envelopes). None if not analysed yet
+        self.envelopes = None
+
+        # Number of runs before being analysed (int)
+        self.run_count = 0
+
+        # Repeated pattern of the program (lawnmower.src.program.Program). None if not periodic
+        self.pattern = None
+
+        # Number of whole repetitions of the pattern (int)
+        self.pattern_repeats = 0
+
+        # Trailing partial pattern, run after the whole repetitions (lawnmower.src.program.Program). None if not
+        #   periodic
+        self.remainder = None
+
+        # Program tree of the program (lawnmower.src.program_tree.ProgramTree). None if compiled from an instruction
+        #   list
+        self.tree = tree
+
+    @classmethod
+    def compile(cls, instruction_list):
+        """
+            Compiles the specified instruction list, either plain (e.g., "LFRF") or run-length encoded (e.g.,
+            "F1200R L3", see lawnmower.src.mower.Mower.parse_runs), or a program tree (see
+            lawnmower.src.program_tree.ProgramTree), which is not expanded.
+
+        :param instruction_list: (str/bytes/lawnmower.src.program_tree.ProgramTree) Instructions to compile. Both upper
+                    and lower case allowed.
+        :return: (lawnmower.src.program.Program) The compiled program. Returns None if any instruction is not valid
+                    (i.e., it must be executed instruction by instruction, reporting any error found).
+        """
+        if isinstance(instruction_list, lawnmower.src.program_tree.ProgramTree):
+            return cls(tree=instruction_list)
+
+        runs = lawnmower.src.mower.Mower.parse_runs(instruction_list)
+
+        if runs is not None:
+            return cls(moves=cls.get_moves_from_runs(runs))
+
+        opcodes = cls.get_opcodes(instruction_list)
+
+        if opcodes is None:
+            return None
+
+        program = cls.from_opcodes(opcodes)
+        period = cls.get_period(opcodes)
+
+        if period is not None:
+            program.pattern = cls.from_opcodes(opcodes[:period])
+            program.pattern_repeats = len(opcodes) // period
+            program.remainder = cls.from_opcodes(opcodes[:len(opcodes) % period])
+
+        return program
+
+    @classmethod
+    def from_opcodes(cls, opcodes):
+        """
+            Gets the program of the specified opcodes, reduced to moves only if worth it (see max_rotation_ratio).
+
+        :param opcodes: (bytes) The opcodes, one per byte.
+        :return: (lawnmower.src.program.Program) The program.
+        """
+        rotation_count = len(opcodes) - opcodes.count(cls.forward_opcode)
+
+        if rotation_count > cls.max_rotation_ratio * len(opcodes):
+            return cls(opcodes=opcodes)
+
+        return cls(opcodes=opcodes, moves=cls.get_moves_from_opcodes(opcodes))
+
+    @classmethod
+    def get_period(cls, opcodes):
+        """
+            Gets the length of the shortest pattern the specified opcodes are made of (i.e., opcodes[i] is always
+            opcodes[i - period]), as long as it is repeated at least min_pattern_repeats times. The candidate periods
+            are only the positions where the first opcodes show up again.
+
+            It takes linear time: each candidate is only checked up to its first mismatch (see get_match_length), and
+            the next candidates are looked for after that mismatch. If the opcodes were periodic with a period not
+            beyond it, the failed candidate would be a period too (periodicity lemma), so none of them can be.
+
+        :param opcodes: (bytes) The opcodes, one per byte.
+        :return: (int) The period. None if the opcodes are not periodic enough.
+        """
+        max_period = len(opcodes) // cls.min_pattern_repeats
+        prefix = opcodes[:min(cls.pattern_prefix_length, len(opcodes) - max_period)]
+        period = opcodes.find(prefix, 1, max_period + len(prefix))
+
+        while period != -1:
+            match_length = cls.get_match_length(opcodes, period)
+
+            if match_length == len(opcodes) - period:
+                return period
+
+            period = opcodes.find(prefix, max(period, match_length) + 1, max_period + len(prefix))
+
+        return None
+
+    @staticmethod
+    def get_match_length(opcodes, start):
+        """
+            Gets the number of opcodes from the specified position on matching the first opcodes (i.e., the length of
+            the longest common prefix of opcodes[start:] and opcodes), in time proportional to it: matching blocks of
+            doubling size are compared at once, and then the first mismatching block is split in halves.
+
+        :param opcodes: (bytes) The opcodes, one per byte.
+        :param start: (int) The position.
+        :return: (int) The number of matching opcodes.
+        """
+        length = len(opcodes) - start
+        matched = 0
+        size = 1
+
+        while matched < length:
+            size = min(size, length - matched)
+
+            if opcodes[start + matched:start + matched + size] != opcodes[matched:matched + size]:
+                break
+
+            matched += size
+            size *= 2
+
+        else:
+            return length
+
+        # The first mismatch is within the last block
+        while size > 1:
+            half = size // 2
+
+            if opcodes[start + matched:start + matched + half] == opcodes[matched:matched + half]:
+                matched += half
+                size -= half
+
+            else:
+                size = half
+
+        return matched
+
+    @staticmethod
+    def get_opcodes(instruction_list):
+        """
+            Translates the specified plain instruction list (e.g., "LFRF") into opcodes.
+
+        :param instruction_list: (str/bytes) Instructions to translate. Both upper and lower case allowed.
+        :return: (bytes) The opcodes, one per byte. Returns None if any instruction is not valid.
+        """
+        try:
+            if isinstance(instruction_list, str):
+                instruction_list = instruction_list.encode("ascii")
+
+            if instruction_list.translate(None, b"LRFlrf"):
+                # There are invalid instructions
+                return None
+
+        except (UnicodeEncodeError, AttributeError, TypeError):
+            return None
+
+        return instruction_list.translate(Orientation.instructions_to_opcodes)
+
+    @classmethod
+    def get_moves_from_opcodes(cls, opcodes):
+        """
+            Reduces the specified opcodes to moves (see self.moves).
+
+        :param opcodes: (bytes) The opcodes, one per byte.
+        :return: (list of tuples) (<rotation>, <forward_count>) of each move.
+        """
+        right = cls.rotate_right_opcode
+        left = cls.rotate_left_opcode
+
+        return [((rotations.count(right) - rotations.count(left)) & 3, len(forwards))
+                for rotations, forwards in cls.move_pattern.findall(opcodes) if rotations or forwards]
+
+    @staticmethod
+    def get_moves_from_runs(runs):
+        """
+            Reduces the specified runs of instructions to moves (see self.moves).
+
+        :param runs: (list of tuples) (<instruction>, <count>) of each run, with the instruction in upper case (see
+                    lawnmower.src.mower.Mower.parse_runs).
+        :return: (list of tuples) (<rotation>, <forward_count>) of each move.
+        """
+        moves = []
+        rotation = 0
+
+        for instruction, count in runs:
+            if instruction == "F":
+                if count:
+                    moves.append((rotation & 3, count))
+                    rotation = 0
+
+            else:
+                rotation += count if instruction == "R" else -count
+
+        if rotation & 3:
+            moves.append((rotation & 3, 0))
+
+        return moves
+
+    def get_envelopes(self):
+        """
+            Analyses the trajectory of the program as if there were no lawn edges nor occupied positions.
+
+        :return: (list of tuples) (<min_x>, <max_x>, <min_y>, <max_y>, <x>, <y>, <rotation>) for each initial
+                    orientation integer value, with:
+                        <min_x>, <max_x> : (int) Minimum and maximum offsets in the X axis along the trajectory.
+                        <min_y>, <max_y> : (int) Minimum and maximum offsets in the Y axis along the trajectory.
+                        <x>, <y> : (int) Final offsets (i.e., displacement).
+                        <rotation> : (int) Number of 90 degrees right rotations (0 to 3) of the final orientation.
+        """
+        forward_x = self.forward_x
+        forward_y = self.forward_y
+        x = y = min_x = max_x = min_y = max_y = orientation = 0
+
+        # Trajectory from North. Extreme offsets are always reached at the end of a run of forward instructions
+        moves = self.moves if self.moves is not None else self.get_moves_from_opcodes(self.opcodes)
+
+        for rotation, count in moves:
+            orientation = (orientation + rotation) & 3
+
+            if count:
+                x += forward_x[orientation] * count
+                y += forward_y[orientation] * count
+
+                if x < min_x:
+                    min_x = x
+
+                elif x > max_x:
+                    max_x = x
+
+                if y < min_y:
+                    min_y = y
+
+                elif y > max_y:
+                    max_y = y
+
+        # From any other initial orientation the trajectory is the same one, rotated (i.e., (x, y) becomes (y, -x)
+        #   for each 90 degrees right rotation)
+        envelopes = []
+
+        for _ in range(4):
+            envelopes.append((min_x, max_x, min_y, max_y, x, y, orientation))
+            min_x, max_x, min_y, max_y, x, y = min_y, max_y, -max_x, -min_x, y, -x
+
+        return envelopes
+
+    def run(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the program from the specified mower state, which MUST be within the lawn. Forward moves leading
+            outside the lawn, or to an occupied position, are ignored (as lawnmower.src.scheduler.Scheduler does).
+
+            If the whole trajectory fits inside the lawn, without any occupied position, the final state is directly
+            obtained from the displacement envelope (see get_envelopes).
+
+        :param x: (int) Coordinate X of the initial position.
+        :param y: (int) Coordinate Y of the initial position.
+        :param orientation: (int) Initial orientation integer value (see lawnmower.src.orientation.Orientation).
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn on which the mower is located.
+        :param occupancy: (lawnmower.src.occupancy.OccupancyIndex) Positions occupied by other mowers. If not
+                    specified, no position is occupied (i.e., mower overlapping allowed).
+        :return: (tuple) (x, y, orientation) after running the program.
+        """
+        if self.tree is not None:
+            return self.run_tree(x, y, orientation, lawn, occupancy)
+
+        envelopes = self.envelopes
+
+        if envelopes is None:
+            self.run_count += 1
+
+            if self.run_count >= self.envelope_min_runs:
+                envelopes = self.envelopes = self.get_envelopes()
+
+        if envelopes is not None:
+            min_x, max_x, min_y, max_y, dx, dy, rotation = envelopes[orientation]
+
+            if lawn.x_min <= x + min_x and x + max_x <= lawn.x_max and lawn.y_min <= y + min_y and \
+                    y + max_y <= lawn.y_max and \
+                    (occupancy is None or occupancy.is_area_free(x + min_x, x + max_x, y + min_y, y + max_y)):
+                return x + dx, y + dy, (orientation + rotation) & 3
+
+        if self.pattern is not None:
+            return self.run_periodic(x, y, orientation, lawn, occupancy)
+
+        if self.moves is not None:
+            return self.run_moves(x, y, orientation, lawn, occupancy)
+
+        return self.run_opcodes(x, y, orientation, lawn, occupancy)
+
+    def run_tree(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the program tree of the program (see run), node by node only if collisions with occupied positions
+            need to be checked.
+        """
+        if occupancy is None or occupancy.is_area_free(lawn.x_min, lawn.x_max, lawn.y_min, lawn.y_max):
+            # No other mower on the lawn
+            return self.tree.get_transfer_function(lawn.x_max - lawn.x_min, lawn.y_max - lawn.y_min).apply(
+                x, y, orientation, lawn)
+
+        return self.tree.run(x, y, orientation, lawn, occupancy)
+
+    def run_periodic(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the program pattern by pattern (see run), skipping whole cycles of states once any state repeats
+            after a pattern.
+        """
+        pattern = self.pattern
+        repeats = self.pattern_repeats
+        state = (x, y, orientation)
+
+        # Number of patterns already run by state reached after them
+        seen = {state: 0}
+        index = 0
+
+        while index < repeats:
+            state = pattern.run(*state, lawn, occupancy)
+            index += 1
+
+            if state in seen:
+                # Same state, same patterns ahead: skip as many whole cycles as possible
+                cycle = index - seen[state]
+                index += (repeats - index) // cycle * cycle
+                break
+
+            if len(seen) < self.max_cycle_states:
+                seen[state] = index
+
+        while index < repeats:
+            state = pattern.run(*state, lawn, occupancy)
+            index += 1
+
+        return self.remainder.run(*state, lawn, occupancy)
+
+    def run_opcodes(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the opcodes of the program, one by one (see run).
+        """
+        x_min = lawn.x_min
+        x_max = lawn.x_max
+        y_min = lawn.y_min
+        y_max = lawn.y_max
+        forward_x = self.forward_x
+        forward_y = self.forward_y
+        forward_opcode = self.forward_opcode
+        rotate_left_opcode = self.rotate_left_opcode
+
+        if occupancy is None:
+            for opcode in self.opcodes:
+                if opcode == forward_opcode:
+                    new_x = x + forward_x[orientation]
+                    new_y = y + forward_y[orientation]
+
+                    if x_min <= new_x <= x_max and y_min <= new_y <= y_max:
+                        x = new_x
+                        y = new_y
+
+                elif opcode == rotate_left_opcode:
+                    orientation = (orientation - 1) & 3
+
+                else:
+                    orientation = (orientation + 1) & 3
+
+        else:
+            is_occupied = occupancy.is_occupied
+
+            for opcode in self.opcodes:
+                if opcode == forward_opcode:
+                    new_x = x + forward_x[orientation]
+                    new_y = y + forward_y[orientation]
+
+                    if x_min <= new_x <= x_max and y_min <= new_y <= y_max and not is_occupied(new_x, new_y):
+                        x = new_x
+                        y = new_y
+
+                elif opcode == rotate_left_opcode:
+                    orientation = (orientation - 1) & 3
+
+                else:
+                    orientation = (orientation + 1) & 3
+
+        return x, y, orientation
+
+    def run_moves(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the moves of the program, one by one (see run). Each run of forward instructions stops either at the
+            lawn edge or just before the nearest occupied position.
+        """
+        x_min = lawn.x_min
+        x_max = lawn.x_max
+        y_min = lawn.y_min
+        y_max = lawn.y_max
+        forward_x = self.forward_x
+        forward_y = self.forward_y
+
+        for rotation, count in self.moves:
+            orientation = (orientation + rotation) & 3
+
+            if count:
+                dx = forward_x[orientation]
+                dy = forward_y[orientation]
+
+                # Bound the run to the lawn
+                if dx > 0:
+                    count = min(count, x_max - x)
+
+                elif dx < 0:
+                    count = min(count, x - x_min)
+
+                elif dy > 0:
+                    count = min(count, y_max - y)
+
+                else:
+                    count = min(count, y - y_min)
+
+                if occupancy is not None and count > 0:
+                    # Bound the run to the nearest occupied position
+                    count = occupancy.get_free_steps(x, y, dx, dy, count)
+
+                x += dx * count
+                y += dy * count
+
+        return x, y, orientation
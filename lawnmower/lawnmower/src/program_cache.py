@@ -0,0 +1,169 @@
+from collections import OrderedDict
+
+import lawnmower.src.program
+
+
+class ProgramCache:
+    """
+        Compiled programs (see lawnmower.src.program.Program) and their results on a given lawn, so that mowers sharing
+        the very same instruction list do not compile nor run it over and over again.
+
+        Identical instruction lists are compiled only once (i.e., interned). Moreover, if mower overlapping is allowed,
+        the final state of a mower only depends on its program and its initial state. Therefore, the result of each
+        (program, initial state) is kept in a bounded LRU cache. On small lawns, each program gets instead a table
+        with its result from every possible initial state, so that any further mower running it costs O(1).
+
+        Tables are filled on demand: computing all of them at once only pays off when a program is shared by more
+        mowers than there are states on the lawn, while filling them on demand never runs a program twice from the
+        same initial state anyway.
+
+        All caches are bounded, evicting the least recently used entries first.
+    """
+    def __init__(self, lawn, max_programs=1024, max_results=1 << 16, max_tables=64, max_table_states=1 << 14):
+        """
+            Initializes the cache.
+
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn on which the programs are run.
+        :param max_programs: (int) Maximum number of interned programs.
+        :param max_results: (int) Maximum number of cached results (i.e., (program, initial state) pairs).
+        :param max_tables: (int) Maximum number of result tables.
+        :param max_table_states: (int) Maximum number of states (i.e., 4 orientations per lawn cell) of the lawn for
+                    result tables to be used instead of the LRU cache of results.
+        :return: None
+        """
+        # The lawn on which the programs are run (lawnmower.src.lawn.Lawn)
+        self.lawn = lawn
+
+        # Maximum number of interned programs (int)
+        self.max_programs = max_programs
+
+        # Maximum number of cached results (int)
+        self.max_results = max_results
+
+        # Maximum number of result tables (int)
+        self.max_tables = max_tables
+
+        # Width and height of the lawn (int)
+        self.width = lawn.x_max - lawn.x_min + 1
+        self.height = lawn.y_max - lawn.y_min + 1
+
+        # Number of states of the lawn (int)
+        self.state_count = 4 * self.width * self.height
+
+        # Tells if the lawn is small enough for result tables to be used (bool)
+        self.use_tables = self.state_count <= max_table_states
+
+        # Interned programs, by instruction list (OrderedDict of lawnmower.src.program.Program). None if the
+        #   instruction list can not be compiled
+        self.programs = OrderedDict()
+
+        # Final state (x, y, orientation) by (program, x, y, orientation) (OrderedDict of tuples)
+        self.results = OrderedDict()
+
+        # Final state from each initial state, by program (OrderedDict of lists of tuples, see get_state_index). None
+        #   if not computed yet
+        self.tables = OrderedDict()
+
+        # Number of runs served from the cached results or tables (int)
+        self.hits = 0
+
+        # Number of runs actually executed (int)
+        self.misses = 0
+
+    def get_program(self, instruction_list):
+        """
+            Gets the compiled program of the specified instruction list, compiling it only the first time.
+
+        :param instruction_list: (str/bytes) Instructions to compile (see lawnmower.src.program.Program.compile).
+        :return: (lawnmower.src.program.Program) The interned program. None if it can not be compiled.
+        """
+        try:
+            program = self.programs[instruction_list]
+            self.programs.move_to_end(instruction_list)
+            return program
+
+        except KeyError:
+            pass
+
+        except TypeError:
+            # Not hashable, so it can not be interned
+            return lawnmower.src.program.Program.compile(instruction_list)
+
+        program = lawnmower.src.program.Program.compile(instruction_list)
+        self.programs[instruction_list] = program
+
+        if len(self.programs) > self.max_programs:
+            _, evicted = self.programs.popitem(last=False)
+            self.tables.pop(evicted, None)
+
+        return program
+
+    def get_state_index(self, x, y, orientation):
+        """
+            Gets the index of the specified state within a result table.
+
+        :param x: (int) Coordinate X of the position.
+        :param y: (int) Coordinate Y of the position.
+        :param orientation: (int) Orientation integer value (see lawnmower.src.orientation.Orientation).
+        :return: (int) The index.
+        """
+        return ((orientation * self.height) + y - self.lawn.y_min) * self.width + x - self.lawn.x_min
+
+    def run(self, program, x, y, orientation):
+        """
+            Runs the specified program as lawnmower.src.program.Program.run does when no position is occupied (i.e.,
+            mower overlapping allowed), reusing prior results whenever possible.
+
+        :param program: (lawnmower.src.program.Program) The program, as returned by get_program.
+        :param x: (int) Coordinate X of the initial position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of the initial position. It MUST be within the lawn.
+        :param orientation: (int) Initial orientation integer value (see lawnmower.src.orientation.Orientation).
+        :return: (tuple) (x, y, orientation) after running the program.
+        """
+        if self.use_tables:
+            return self.run_with_table(program, x, y, orientation)
+
+        key = (program, x, y, orientation)
+        result = self.results.get(key)
+
+        if result is not None:
+            self.hits += 1
+            self.results.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = program.run(x, y, orientation, self.lawn)
+        self.results[key] = result
+
+        if len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+        return result
+
+    def run_with_table(self, program, x, y, orientation):
+        """
+            Runs the specified program using its result table (see run).
+        """
+        table = self.tables.get(program)
+
+        if table is None:
+            table = [None] * self.state_count
+            self.tables[program] = table
+
+            if len(self.tables) > self.max_tables:
+                self.tables.popitem(last=False)
+
+        else:
+            self.tables.move_to_end(program)
+
+        index = self.get_state_index(x, y, orientation)
+        result = table[index]
+
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = table[index] = program.run(x, y, orientation, self.lawn)
+
+        return result
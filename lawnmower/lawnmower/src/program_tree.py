@@ -0,0 +1,321 @@
+import re
+
+import lawnmower.src.program
+import lawnmower.src.transfer
+
+
+class ProgramTree:
+    """
+        Instruction list written with repeat blocks and named macros, instead of every single instruction. For example:
+
+            (FFRFF)*100000          The block FFRFF, 100000 times in a row.
+            L(F(RF)*3)*20$PATROL    Blocks may be nested, and followed by macros (see macro_pattern).
+
+        Each node of the tree is a sequence of items (either plain instructions or nested nodes) repeated a number of
+        times. Nodes are never expanded, unless explicitly requested (see expand): iterating a tree yields its
+        instructions one by one, and its length is the number of instructions it stands for.
+
+        When no other mower can block it, the effect of a node is its transfer function (see
+        lawnmower.src.transfer.TransferFunction), which is composed from those of its items. Repeating a node N times
+        is just composing its transfer function with itself, which is done by repeated squaring (i.e., log2(N)
+        compositions). In the same way, its displacement envelope (see lawnmower.src.program.Program.get_envelopes) is
+        computed without expanding it, so that mowers far enough from any other mower get their final state in O(1).
+
+        Otherwise (i.e., collisions with other mowers need to be checked step by step), the tree is run node by node,
+        rather than expanded: nodes whose envelope is free are still applied at once, and repetitions of a node are
+        skipped as soon as the state after one of them repeats (see lawnmower.src.program.Program.run_periodic).
+    """
+    # Each token of a program tree: instructions, beginning/end of a block, number of repetitions of the prior block
+    #   or macro, and macro reference
+    token_pattern = re.compile(r"\s*(?:(?P<instructions>[LRFlrf]+)|(?P<open>\()|(?P<close>\))|\*\s*(?P<count>\d+)|"
+                               r"\$(?P<macro>\w+))")
+
+    # Macro definition (e.g., "$PATROL = (FFRFF)*4")
+    macro_pattern = re.compile(r"\s*\$(\w+)\s*=(.*)")
+
+    def __init__(self, items, count=1):
+        """
+            Initializes the node.
+
+        :param items: (tuple) Items of the node, in chronological order, either plain instructions (str, in upper
+                    case) or nested nodes (lawnmower.src.program_tree.ProgramTree).
+        :param count: (int) Number of repetitions of the items.
+        :return: None
+        """
+        # Items of the node (tuple of str/lawnmower.src.program_tree.ProgramTree)
+        self.items = tuple(items)
+
+        # Number of repetitions of the items (int)
+        self.count = count
+
+        # Number of instructions the node stands for (int)
+        self.length = count * sum(len(item) for item in self.items)
+
+        # Hash of the node, computed only once (int)
+        self.hash = hash((self.items, self.count))
+
+        # Transfer functions of the node by (width, height) of the lawn (dict of
+        #   lawnmower.src.transfer.TransferFunction)
+        self.transfer_functions = {}
+
+        # Displacement envelopes of the node by initial orientation integer value (list of tuples, see
+        #   lawnmower.src.program.Program.get_envelopes). None if not computed yet
+        self.envelopes = None
+
+        # Compiled programs of the plain instructions of the node, by instructions (dict of
+        #   lawnmower.src.program.Program)
+        self.programs = {}
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for _ in range(self.count):
+            for item in self.items:
+                yield from item
+
+    def __eq__(self, other):
+        return isinstance(other, ProgramTree) and self.count == other.count and self.items == other.items
+
+    def __hash__(self):
+        return self.hash
+
+    def __str__(self):
+        source = "".join(str(item) for item in self.items)
+
+        return source if self.count == 1 else "({})*{}".format(source, self.count)
+
+    @staticmethod
+    def is_program_tree(line):
+        """
+            Tells if the specified instruction list uses repeat blocks or macros.
+
+        :param line: (str/bytes) The instruction list.
+        :return: (bool) True if it must be parsed as a program tree; False otherwise.
+        """
+        tokens = ("(", "$") if isinstance(line, str) else (b"(", b"$")
+
+        return any(token in line for token in tokens)
+
+    @classmethod
+    def parse(cls, line, macros=None):
+        """
+            Parses the specified instruction list into a program tree.
+
+        :param line: (str) The instruction list (e.g., "(FFRFF)*100000").
+        :param macros: (dict) Program trees of the macros defined so far, by name.
+        :return: (lawnmower.src.program_tree.ProgramTree) The program tree. Returns None in case of invalid syntax
+                    (e.g., unbalanced blocks or undefined macros).
+        """
+        macros = macros or {}
+
+        # Items of the blocks being parsed, from the outermost one
+        blocks = [[]]
+        position = 0
+        line = line.rstrip()
+
+        while position < len(line):
+            match = cls.token_pattern.match(line, position)
+
+            if match is None:
+                return None
+
+            position = match.end()
+            items = blocks[-1]
+
+            if match.group("instructions"):
+                items.append(match.group("instructions").upper())
+
+            elif match.group("open"):
+                blocks.append([])
+
+            elif match.group("close"):
+                if len(blocks) == 1:
+                    return None
+
+                blocks.pop()
+                blocks[-1].append(cls(items))
+
+            elif match.group("count"):
+                if not items or isinstance(items[-1], str):
+                    # Only blocks and macros can be repeated
+                    return None
+
+                items[-1] = cls(items[-1].items, items[-1].count * int(match.group("count")))
+
+            elif match.group("macro") in macros:
+                items.append(macros[match.group("macro")])
+
+            else:
+                return None
+
+        if len(blocks) != 1:
+            return None
+
+        return cls(blocks[0])
+
+    @classmethod
+    def parse_macro(cls, line, macros=None):
+        """
+            Parses the specified macro definition (see macro_pattern).
+
+        :param line: (str) The macro definition (e.g., "$PATROL = (FFRFF)*4").
+        :param macros: (dict) Program trees of the macros defined so far, by name.
+        :return: (tuple) (<name>, <program_tree>) of the macro. Returns None in case of invalid syntax.
+        """
+        match = cls.macro_pattern.fullmatch(line)
+
+        if match is None:
+            return None
+
+        program_tree = cls.parse(match.group(2), macros)
+
+        return (match.group(1), program_tree) if program_tree is not None else None
+
+    def expand(self):
+        """
+            Expands the program tree into a plain instruction list.
+
+        :return: (str) Every single instruction (e.g., "FFRFFFFRFF" for "(FFRFF)*2").
+        """
+        return "".join(item if isinstance(item, str) else item.expand() for item in self.items) * self.count
+
+    def get_transfer_function(self, width, height):
+        """
+            Gets the transfer function of the program tree (see lawnmower.src.transfer.TransferFunction.compile),
+            without expanding it.
+
+        :param width: (int) Width of the lawn, minus one (i.e., x_max - x_min).
+        :param height: (int) Height of the lawn, minus one (i.e., y_max - y_min).
+        :return: (lawnmower.src.transfer.TransferFunction) Its transfer function.
+        """
+        transfer_function = self.transfer_functions.get((width, height))
+
+        if transfer_function is None:
+            transfer_function_class = lawnmower.src.transfer.TransferFunction
+            transfer_function = transfer_function_class.compile("", width, height)
+
+            for item in self.items:
+                transfer_function = transfer_function.then(
+                    transfer_function_class.compile(item, width, height) if isinstance(item, str)
+                    else item.get_transfer_function(width, height))
+
+            transfer_function = transfer_function.power(self.count) if self.count \
+                else transfer_function_class.compile("", width, height)
+            self.transfer_functions[(width, height)] = transfer_function
+
+        return transfer_function
+
+    @staticmethod
+    def compose_envelopes(first, second):
+        """
+            Composes the specified displacement envelopes (see lawnmower.src.program.Program.get_envelopes).
+
+        :param first: (list of tuples) Envelopes of the instructions run first.
+        :param second: (list of tuples) Envelopes of the instructions run second.
+        :return: (list of tuples) Envelopes of both of them, one after the other.
+        """
+        envelopes = []
+
+        for min_x, max_x, min_y, max_y, x, y, rotation in first:
+            second_min_x, second_max_x, second_min_y, second_max_y, second_x, second_y, second_rotation = \
+                second[(len(envelopes) + rotation) & 3]
+            envelopes.append((min(min_x, x + second_min_x), max(max_x, x + second_max_x),
+                              min(min_y, y + second_min_y), max(max_y, y + second_max_y),
+                              x + second_x, y + second_y, (rotation + second_rotation) & 3))
+
+        return envelopes
+
+    def get_envelopes(self):
+        """
+            Gets the displacement envelopes of the program tree (see lawnmower.src.program.Program.get_envelopes),
+            without expanding it. Repetitions are composed by repeated squaring.
+
+        :return: (list of tuples) Its envelope by initial orientation integer value.
+        """
+        if self.envelopes is None:
+            identity = [(0, 0, 0, 0, 0, 0, 0)] * 4
+            envelopes = identity
+
+            for item in self.items:
+                envelopes = self.compose_envelopes(
+                    envelopes, lawnmower.src.program.Program.compile(item).get_envelopes() if isinstance(item, str)
+                    else item.get_envelopes())
+
+            result = identity
+            count = self.count
+
+            while count:
+                if count & 1:
+                    result = self.compose_envelopes(result, envelopes)
+
+                count >>= 1
+
+                if count:
+                    envelopes = self.compose_envelopes(envelopes, envelopes)
+
+            self.envelopes = result
+
+        return self.envelopes
+
+    def run(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the program tree from the specified mower state, as lawnmower.src.program.Program.run does, but node
+            by node (see class description).
+
+        :param x: (int) Coordinate X of the initial position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of the initial position. It MUST be within the lawn.
+        :param orientation: (int) Initial orientation integer value (see lawnmower.src.orientation.Orientation).
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn on which the mower is located.
+        :param occupancy: (lawnmower.src.occupancy.OccupancyIndex) Positions occupied by other mowers. If not
+                    specified, no position is occupied.
+        :return: (tuple) (x, y, orientation) after running the program tree.
+        """
+        min_x, max_x, min_y, max_y, dx, dy, rotation = self.get_envelopes()[orientation]
+
+        if lawn.x_min <= x + min_x and x + max_x <= lawn.x_max and lawn.y_min <= y + min_y and \
+                y + max_y <= lawn.y_max and \
+                (occupancy is None or occupancy.is_area_free(x + min_x, x + max_x, y + min_y, y + max_y)):
+            return x + dx, y + dy, (orientation + rotation) & 3
+
+        state = (x, y, orientation)
+
+        # Number of repetitions already run by state reached after them. None once a cycle has been skipped
+        seen = {state: 0}
+        index = 0
+
+        while index < self.count:
+            state = self.run_items(*state, lawn, occupancy)
+            index += 1
+
+            if seen is None:
+                continue
+
+            if state in seen:
+                # Same state, same repetitions ahead: skip as many whole cycles as possible
+                cycle = index - seen[state]
+                index += (self.count - index) // cycle * cycle
+                seen = None
+
+            elif len(seen) < lawnmower.src.program.Program.max_cycle_states:
+                seen[state] = index
+
+        return state
+
+    def run_items(self, x, y, orientation, lawn, occupancy=None):
+        """
+            Runs the items of the node once (see run).
+        """
+        for item in self.items:
+            if isinstance(item, str):
+                program = self.programs.get(item)
+
+                if program is None:
+                    program = self.programs[item] = lawnmower.src.program.Program.compile(item)
+
+                x, y, orientation = program.run(x, y, orientation, lawn, occupancy)
+
+            else:
+                x, y, orientation = item.run(x, y, orientation, lawn, occupancy)
+
+        return x, y, orientation
@@ -0,0 +1,187 @@
+import os
+import hashlib
+import contextlib
+import traceback
+
+import lawnmower.src.scenario_file
+
+
+class ScenarioCache:
+    """
+        On-disk cache of parsed configuration files (see lawnmower.src.config_file.ConfigFile).
+
+        Each parsed configuration file is stored as a binary scenario file (see
+        lawnmower.src.scenario_file.BinaryScenarioFile), which can be loaded without any parsing. Entries are keyed by
+        the size, modification time and content digest of the configuration file, so any modification of the file
+        leads to a new entry.
+
+        The total size of the cache is bounded: whenever it is exceeded, the least recently used entries are removed
+        (the modification time of each entry is updated every time it is used).
+    """
+    # Extension of the cache entries
+    extension = ".lmwb"
+
+    # Size of the blocks in which files are read when computing their digest (in bytes)
+    block_size = 1 << 20
+
+    def __init__(self, folder=None, max_size=1 << 30, min_file_size=1 << 20):
+        """
+            Initializes the cache.
+
+        :param folder: (str) Path to the folder in which the entries are stored. If not specified, the one in the
+                    environment variable LAWNMOWER_CACHE_DIR or, if not defined, ~/.cache/lawnmower.
+        :param max_size: (int) Maximum total size of the entries (in bytes).
+        :param min_file_size: (int) Configuration files smaller than this size (in bytes) are not cached, since
+                    parsing them is already fast enough.
+        :return: None
+        """
+        # Path to the folder in which the entries are stored (str)
+        self.folder = folder or os.environ.get("LAWNMOWER_CACHE_DIR") or os.path.join(os.path.expanduser("~"),
+                                                                                      ".cache", "lawnmower")
+
+        # Maximum total size of the entries, in bytes (int)
+        self.max_size = max_size
+
+        # Minimum size of the configuration files to cache, in bytes (int)
+        self.min_file_size = min_file_size
+
+        # Last computed entry (tuple (<filepath>, <size>, <modification_time>, <entry_path>))
+        self.last_entry = (None, None, None, None)
+
+    def get_entry_path(self, filepath):
+        """
+            Gets the path to the cache entry of the specified configuration file (whether it exists or not).
+
+        :throws OSError: If the file cannot be read.
+
+        :param filepath: (str) Path to the configuration file.
+        :return: (str) Path to the cache entry. Returns None if the file is not to be cached.
+        """
+        stat = os.stat(filepath)
+
+        if stat.st_size < self.min_file_size:
+            return None
+
+        if self.last_entry[:3] == (filepath, stat.st_size, stat.st_mtime_ns):
+            # No need to compute the digest again (e.g., storing just after a failed load)
+            return self.last_entry[3]
+
+        digest = hashlib.blake2b(digest_size=20)
+
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(self.block_size), b""):
+                digest.update(block)
+
+        entry_path = os.path.join(self.folder, "{}-{}-{}{}".format(stat.st_size, stat.st_mtime_ns,
+                                                                   digest.hexdigest(), self.extension))
+        self.last_entry = (filepath, stat.st_size, stat.st_mtime_ns, entry_path)
+
+        return entry_path
+
+    def load(self, config_file, filepath):
+        """
+            Loads the cached info of the specified configuration file, if any.
+
+        :param config_file: (lawnmower.src.config_file.ConfigFile) Configuration file to update.
+        :param filepath: (str) Path to the configuration file.
+        :return: (bool) True if it was loaded from the cache; False otherwise.
+        """
+        try:
+            entry_path = self.get_entry_path(filepath)
+
+            if entry_path is None or not os.path.isfile(entry_path):
+                return False
+
+            # Mark it as recently used
+            os.utime(entry_path)
+
+            return config_file.load_binary(entry_path)
+
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def store(self, config_file, filepath):
+        """
+            Stores in the cache the info of the specified, already loaded, configuration file. Configuration files
+            which cannot be represented as binary scenario files (e.g., invalid instructions) are not stored.
+
+        :param config_file: (lawnmower.src.config_file.ConfigFile) Loaded configuration file.
+        :param filepath: (str) Path to the configuration file.
+        :return: (bool) True if it was stored; False otherwise.
+        """
+        try:
+            entry_path = self.get_entry_path(filepath)
+
+            if entry_path is None:
+                return False
+
+            os.makedirs(self.folder, exist_ok=True)
+            temporary_path = "{}.{}.tmp".format(entry_path, os.getpid())
+
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                # Unsupported configurations are simply not cached (i.e., no need to report any error)
+                stored = lawnmower.src.scenario_file.BinaryScenarioFile.save(config_file.lawn_x_max,
+                                                                             config_file.lawn_y_max,
+                                                                             config_file.mowers, temporary_path)
+
+            if not stored:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+                return False
+
+            os.replace(temporary_path, entry_path)
+            self.evict()
+
+        except (OSError, TypeError, ValueError):
+            print("ERROR while storing '{}' in scenario cache '{}' :\n{}".format(filepath, self.folder,
+                                                                                 traceback.format_exc()))
+            return False
+
+        return True
+
+    def get_entries(self):
+        """
+            Gets all cache entries, from the least to the most recently used.
+
+        :return: (list of tuples) (<path>, <size>) of each entry.
+        """
+        entries = []
+
+        if os.path.isdir(self.folder):
+            for filename in os.listdir(self.folder):
+                if filename.endswith(self.extension):
+                    path = os.path.join(self.folder, filename)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime_ns, path, stat.st_size))
+
+        return [(path, size) for _, path, size in sorted(entries)]
+
+    def evict(self):
+        """
+            Removes the least recently used entries until the total size of the cache is within its bounds.
+
+        :return: None
+        """
+        entries = self.get_entries()
+        total_size = sum(size for _, size in entries)
+
+        for path, size in entries:
+            if total_size <= self.max_size:
+                break
+
+            os.remove(path)
+            total_size -= size
+
+    def clear(self):
+        """
+            Removes all cache entries.
+
+        :return: (int) Number of removed entries.
+        """
+        entries = self.get_entries()
+
+        for path, _ in entries:
+            os.remove(path)
+
+        return len(entries)
@@ -0,0 +1,352 @@
+import os
+import sys
+import mmap
+import struct
+import traceback
+
+import lawnmower.src.config_file
+from lawnmower.src.orientation import Orientation
+
+
+class BinaryMowerTable:
+    """
+        Read-only view of the mowers stored in a binary scenario file (see BinaryScenarioFile).
+
+        Nothing is copied when loading: every mower record, as well as its packed instruction list, is decoded from
+        the mapped file only when requested. It behaves like a list of mower info dicts (see
+        lawnmower.src.config_file.ConfigFile.mowers), so it can be used wherever such a list is expected.
+    """
+    def __init__(self, buffer, mower_count):
+        """
+            Initializes the view.
+
+        :param buffer: (memoryview) Contents of the binary scenario file.
+        :param mower_count: (int) Number of mowers stored in the file.
+        :return: None
+        """
+        # Contents of the binary scenario file (memoryview)
+        self.buffer = buffer
+
+        # Number of mowers (int)
+        self.mower_count = mower_count
+
+        # Offset of the packed instruction lists within the buffer (int)
+        self.instructions_start = BinaryScenarioFile.header.size + mower_count * BinaryScenarioFile.record.size
+
+    def __len__(self):
+        return self.mower_count
+
+    def __getitem__(self, index):
+        """
+            Gets the info of the specified mower, in the same format as lawnmower.src.config_file.ConfigFile.mowers
+            (but with integer coordinates).
+
+        :param index: (int) Index of the mower (negative values allowed).
+        :return: (dict) The mower info.
+        """
+        x, y, _, _, orientation = self.get_record(index)
+
+        return {"initial_position": (x, y),
+                "initial_orientation": Orientation.int_to_str[orientation],
+                "instruction_list": self.get_instruction_list(index).decode()}
+
+    def __iter__(self):
+        records = self.buffer[BinaryScenarioFile.header.size:self.instructions_start]
+        instructions_start = self.instructions_start
+
+        for x, y, offset, instruction_count, orientation in BinaryScenarioFile.record.iter_unpack(records):
+            start = instructions_start + offset
+            opcodes = BinaryScenarioFile.unpack_opcodes(self.buffer[start:start + (instruction_count + 3) // 4],
+                                                        instruction_count)
+
+            yield {"initial_position": (x, y),
+                   "initial_orientation": Orientation.int_to_str[orientation],
+                   "instruction_list": opcodes.translate(BinaryScenarioFile.opcodes_to_instructions).decode()}
+
+    def get_instructions_size(self):
+        """
+            Gets the size of the packed instruction lists referenced by the mower records (i.e., up to the end of the
+            furthest one).
+
+        :return: (int) The size, in bytes, from instructions_start.
+        """
+        records = self.buffer[BinaryScenarioFile.header.size:self.instructions_start]
+
+        return max((offset + (instruction_count + 3) // 4
+                    for _, _, offset, instruction_count, _ in BinaryScenarioFile.record.iter_unpack(records)),
+                   default=0)
+
+    def get_record(self, index):
+        """
+            Gets the raw record of the specified mower.
+
+        :param index: (int) Index of the mower (negative values allowed).
+        :return: (tuple) (x, y, instructions_offset, instruction_count, orientation)
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("BinaryMowerTable index out of range")
+
+        return BinaryScenarioFile.record.unpack_from(self.buffer, BinaryScenarioFile.header.size +
+                                                     index * BinaryScenarioFile.record.size)
+
+    def get_opcodes(self, index):
+        """
+            Gets the instruction list of the specified mower as opcodes, one per byte (see
+            BinaryScenarioFile.opcodes).
+
+        :param index: (int) Index of the mower.
+        :return: (bytes) The opcodes.
+        """
+        _, _, offset, instruction_count, _ = self.get_record(index)
+        start = self.instructions_start + offset
+        packed = self.buffer[start:start + (instruction_count + 3) // 4]
+
+        return BinaryScenarioFile.unpack_opcodes(packed, instruction_count)
+
+    def get_instruction_list(self, index):
+        """
+            Gets the instruction list of the specified mower.
+
+        :param index: (int) Index of the mower.
+        :return: (bytes) The instruction list (e.g., b"LFRF").
+        """
+        return self.get_opcodes(index).translate(BinaryScenarioFile.opcodes_to_instructions)
+
+
+class BinaryScenarioFile:
+    """
+        Binary, pre-compiled, scenario file. It stores the very same info as a configuration file (see
+        lawnmower.src.config_file.ConfigFile), but it can be loaded without parsing any text.
+
+        All integers are little-endian. The file is made up of:
+
+            * Header: magic (4 bytes), version (uint16), reserved (uint16), lawn_x_max (int64), lawn_y_max (int64) and
+                mower count (uint64).
+
+            * Mower records, one per mower, all of them of the same size (24 bytes): initial X (int32), initial Y
+                (int32), offset of its packed instructions (uint64, from the first packed instruction list),
+                instruction count (uint32), initial orientation (uint8, see lawnmower.src.orientation.Orientation) and
+                3 padding bytes.
+
+            * Packed instruction lists, one after another, each one starting at a byte boundary. Each instruction is
+                packed as a 2-bit opcode (see self.opcodes), 4 per byte, starting from the least significant bits.
+    """
+    magic = b"LMWB"
+    version = 1
+
+    header = struct.Struct("<4sHHqqQ")
+    record = struct.Struct("<iiQIB3x")
+
+    # Opcode of each instruction, the same as lawnmower.src.orientation.Orientation.opcodes (opcode 3 is not used)
+    opcodes = Orientation.opcodes
+
+    # Translation tables between instructions (either upper or lower case) and opcodes
+    instructions_to_opcodes = Orientation.instructions_to_opcodes
+    opcodes_to_instructions = bytes.maketrans(b"\x00\x01\x02", b"LRF")
+
+    # Opcodes packed in each byte value (i.e., 4 opcodes per byte)
+    unpacked_bytes = [bytes((value >> shift) & 0x03 for shift in (0, 2, 4, 6)) for value in range(256)]
+
+    def __init__(self):
+        # Coordinate X of the upper-right corner of the lawn (int)
+        self.lawn_x_max = None
+
+        # Coordinate Y of the upper-right corner of the lawn (int)
+        self.lawn_y_max = None
+
+        # Mowers stored in the file (lawnmower.src.scenario_file.BinaryMowerTable)
+        self.mowers = []
+
+    @staticmethod
+    def open_file(*args, **kwargs):
+        """
+            Opens a file (see Python built-in open in https://docs.python.org/3/library/functions.html#open)
+
+            NOTE: For improved testability reasons only.
+        """
+        return open(*args, **kwargs)
+
+    @classmethod
+    def is_binary_scenario_file(cls, filepath):
+        """
+            Tells if the specified file is a binary scenario file, according to its first bytes.
+
+        :param filepath: (str) Path to the file to check.
+        :return: (bool) True if it is a binary scenario file; False otherwise (including any error).
+        """
+        try:
+            with cls.open_file(filepath, "rb") as f:
+                return f.read(len(cls.magic)) == cls.magic
+
+        except Exception:
+            return False
+
+    @classmethod
+    def pack_opcodes(cls, instruction_list):
+        """
+            Packs the specified instructions, as 2-bit opcodes.
+
+        :param instruction_list: (str/bytes) Instructions to pack (e.g., "LFRF"). Both upper and lower case allowed.
+        :return: (bytes) The packed opcodes. Returns None if any instruction is not valid.
+        """
+        if isinstance(instruction_list, str):
+            try:
+                instruction_list = instruction_list.encode("ascii")
+
+            except UnicodeEncodeError:
+                return None
+
+        elif not isinstance(instruction_list, (bytes, bytearray)):
+            # Not a plain instruction list (e.g., a program tree, see lawnmower.src.program_tree.ProgramTree)
+            return None
+
+        if instruction_list.translate(None, b"LRFlrf"):
+            # There are invalid instructions
+            return None
+
+        opcodes = instruction_list.translate(cls.instructions_to_opcodes)
+        opcodes += bytes(-len(opcodes) % 4)
+
+        return bytes(a | (b << 2) | (c << 4) | (d << 6)
+                     for a, b, c, d in zip(opcodes[0::4], opcodes[1::4], opcodes[2::4], opcodes[3::4]))
+
+    @classmethod
+    def unpack_opcodes(cls, packed, instruction_count):
+        """
+            Unpacks the specified 2-bit opcodes.
+
+        :param packed: (bytes/memoryview) Packed opcodes.
+        :param instruction_count: (int) Number of packed opcodes.
+        :return: (bytes) The opcodes, one per byte.
+        """
+        return b"".join(map(cls.unpacked_bytes.__getitem__, packed))[:instruction_count]
+
+    @classmethod
+    def save(cls, lawn_x_max, lawn_y_max, mowers, filepath):
+        """
+            Writes a binary scenario file with the specified info.
+
+        :param lawn_x_max: (int/str) Coordinate X of the upper-right corner of the lawn.
+        :param lawn_y_max: (int/str) Coordinate Y of the upper-right corner of the lawn.
+        :param mowers: (iterable of dict) Info of the mowers (see lawnmower.src.config_file.ConfigFile.mowers).
+        :param filepath: (str) Path to the binary scenario file to write.
+        :return: (bool) True if the file was successfully written; False otherwise.
+        """
+        try:
+            records = bytearray()
+            instructions = bytearray()
+            mower_count = 0
+
+            for mower_info in mowers:
+                packed = cls.pack_opcodes(mower_info["instruction_list"])
+
+                if packed is None:
+                    print("ERROR while saving binary scenario file '{}' : Invalid instruction list of mower #{} "
+                          "'{}'".format(filepath, mower_count + 1, mower_info["instruction_list"]))
+                    return False
+
+                records += cls.record.pack(int(mower_info["initial_position"][0]),
+                                           int(mower_info["initial_position"][1]),
+                                           len(instructions), len(mower_info["instruction_list"]),
+                                           Orientation.str_to_int.get(mower_info["initial_orientation"], 0))
+                instructions += packed
+                mower_count += 1
+
+            with cls.open_file(filepath, "wb") as f:
+                f.write(cls.header.pack(cls.magic, cls.version, 0, int(lawn_x_max), int(lawn_y_max), mower_count))
+                f.write(records)
+                f.write(instructions)
+
+        except (ValueError, TypeError, struct.error):
+            print("ERROR while saving binary scenario file '{}' : Invalid scenario info".format(filepath))
+            return False
+
+        except Exception as e:
+            print("Unexpected ERROR while saving binary scenario file '{}' : {}\n{}".format(filepath, e,
+                                                                                            traceback.format_exc()))
+            return False
+
+        return True
+
+    def load(self, filepath):
+        """
+            Maps the specified binary scenario file into memory, without copying (nor parsing) its contents, and
+            updates the information accordingly.
+
+        :param filepath: (str) Path to the binary scenario file to load.
+        :return: (bool) True if the file was successfully loaded; False otherwise.
+        """
+        try:
+            with self.open_file(filepath, "rb") as f:
+                buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+            magic, version, _, lawn_x_max, lawn_y_max, mower_count = self.header.unpack_from(buffer)
+
+            if magic != self.magic or version != self.version:
+                print("ERROR while loading binary scenario file '{}' : Unsupported format".format(filepath))
+                return False
+
+            mowers = BinaryMowerTable(buffer, mower_count)
+
+            if mower_count == 0 or len(buffer) < mowers.instructions_start:
+                print("ERROR while loading binary scenario file '{}' : Missing mowers info".format(filepath))
+                return False
+
+            if len(buffer) - mowers.instructions_start < mowers.get_instructions_size():
+                # Truncated file (i.e., some instruction lists would be silently shortened)
+                print("ERROR while loading binary scenario file '{}' : Invalid file".format(filepath))
+                return False
+
+            self.lawn_x_max = lawn_x_max
+            self.lawn_y_max = lawn_y_max
+            self.mowers = mowers
+
+        except (TypeError, ValueError, struct.error):
+            print("ERROR while loading binary scenario file '{}' : Invalid file".format(filepath))
+            return False
+
+        except FileNotFoundError:
+            print("ERROR while loading binary scenario file : File not found '{}'".format(filepath))
+            return False
+
+        except Exception as e:
+            print("Unexpected ERROR while loading binary scenario file '{}' : {}\n{}".format(filepath, e,
+                                                                                             traceback.format_exc()))
+            return False
+
+        return True
+
+
+def convert(input_filepath, output_filepath):
+    """
+        Converts a configuration file (see lawnmower.src.config_file.ConfigFile) into a binary scenario file.
+
+    :param input_filepath: (str) Path to the configuration file to convert.
+    :param output_filepath: (str) Path to the binary scenario file to write.
+    :return: (bool) True if the file was successfully converted; False otherwise.
+    """
+    config_file = lawnmower.src.config_file.ConfigFile(compact=True)
+
+    return config_file.load(input_filepath) and BinaryScenarioFile.save(config_file.lawn_x_max,
+                                                                        config_file.lawn_y_max,
+                                                                        config_file.mowers, output_filepath)
+
+
+def main():
+    if len(sys.argv) > 2:
+        if convert(sys.argv[1], sys.argv[2]):
+            print("Converted '{}' into '{}' ({} bytes)".format(sys.argv[1], sys.argv[2],
+                                                               os.path.getsize(sys.argv[2])))
+
+    else:
+        print("ERROR : missing input_filepath/output_filepath")
+        print("use   : {} <input_filepath> <output_filepath>".format(sys.argv[0]))
+        print("\n <input_filepath>    : The path to the text file including all configuration details."
+              "\n <output_filepath>   : The path to the binary scenario file to write.\n")
+
+
+if __name__ == "__main__":
+    main()
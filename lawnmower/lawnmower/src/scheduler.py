@@ -1,13 +1,39 @@
+import collections.abc
+
+import lawnmower.src.fleet
 import lawnmower.src.lawn
 import lawnmower.src.mower
+import lawnmower.src.occupancy
 import lawnmower.src.orientation
+import lawnmower.src.parallel_fleet
+import lawnmower.src.program
+import lawnmower.src.program_cache
+import lawnmower.src.program_tree
+import lawnmower.src.simultaneous
+import lawnmower.src.simultaneous_fleet
+import lawnmower.src.transfer
 
 
 class Scheduler:
     """
         Schedules the execution of all mower instructions to clean the lawn.
     """
-    def __init__(self, config_file, mower_overlapping=False):
+    # Minimum number of instructions of an instruction list to be split across several processes (see processes)
+    parallel_min_instructions = 1 << 24
+
+    # Lawn area (number of cells) up to which the final positions of the prior mowers are always stored in a dense
+    #   grid (see lawnmower.src.occupancy.OccupancyGrid), no matter how many mowers there are
+    occupancy_grid_min_cells = 1 << 16
+
+    # Lawn area (number of cells) above which they are never stored in a dense grid (i.e., 2 bytes per cell)
+    occupancy_grid_max_cells = 1 << 24
+
+    # Lawn area (number of cells) per mower up to which a dense grid is smaller than hashed and indexed positions
+    #   (see lawnmower.src.occupancy.OccupancyIndex), which take about 200 bytes per mower
+    occupancy_grid_cells_per_mower = 64
+
+    def __init__(self, config_file, mower_overlapping=False, compile_programs=True, cache_programs=True,
+                 vectorized=False, processes=1, occupancy_grid=None, simultaneous=False):
         """
             Initializes the scheduler.
 
@@ -15,6 +41,26 @@ class Scheduler:
         :param mower_overlapping: (bool) If True more than one mower can be in the same cell of the lawn grid at the
             same time (big cells assumed). Otherwise, if a cell is occupied by one mower no other mower can enter that
             cell.
+        :param compile_programs: (bool) If True, when not verbose, instruction lists are compiled (see
+            lawnmower.src.program.Program) and run by a dedicated loop. Otherwise, they are always executed instruction
+            by instruction through lawnmower.src.mower.Mower.execute (same result, but much slower).
+        :param cache_programs: (bool) If True, compiled programs are interned and, if mower overlapping is allowed,
+            their results are cached (see lawnmower.src.program_cache.ProgramCache). Only relevant when compiling.
+        :param vectorized: (bool) If True, when not verbose and mower overlapping is allowed, the whole fleet is run
+            at once (see lawnmower.src.fleet.FleetSimulator). If all mowers move at once (see simultaneous), conflicts
+            are solved for the whole fleet at once too (see
+            lawnmower.src.simultaneous_fleet.SimultaneousFleetSimulator). Ignored if NumPy is not installed.
+        :param processes: (int) Number of processes among which huge instruction lists (see parallel_min_instructions)
+            are split, when not verbose and mower overlapping is allowed (see lawnmower.src.transfer.ParallelCompiler).
+            Big fleets are split among them too, in contiguous chunks of mowers (see
+            lawnmower.src.parallel_fleet.ParallelFleetRunner). If None, as many as CPUs.
+        :param occupancy_grid: (bool) If True, the final positions of the prior mowers (mower overlapping NOT allowed)
+            are stored in a dense grid of the whole lawn (see lawnmower.src.occupancy.OccupancyGrid). If False, they
+            are hashed and indexed (see lawnmower.src.occupancy.OccupancyIndex). If None, it is chosen according to the
+            lawn area and the number of mowers (see is_occupancy_grid_better).
+        :param simultaneous: (bool) If True, and mower overlapping is NOT allowed, all mowers move at once, one
+            instruction per tick, instead of one after the other (see lawnmower.src.simultaneous.SimultaneousSimulator).
+            If mower overlapping is allowed, mowers never interact, so the result would be the same anyway.
         :return: None
         """
         # Loaded configuration (lawnmower.src.config_file.ConfigFile)
@@ -23,6 +69,33 @@ class Scheduler:
         # Tells if more than one mower can be in the same lawn grid cell (bool)
         self.mower_overlapping = mower_overlapping
 
+        # Tells if instruction lists are compiled before being run (bool)
+        self.compile_programs = compile_programs
+
+        # Tells if compiled programs, and their results, are cached (bool)
+        self.cache_programs = cache_programs
+
+        # Tells if the whole fleet is run at once, whenever possible (bool)
+        self.vectorized = vectorized
+
+        # Tells if the final positions of the prior mowers are stored in a dense grid (bool). None if automatically
+        #   chosen
+        self.occupancy_grid = occupancy_grid
+
+        # Tells if all mowers move at once, one instruction per tick (bool)
+        self.simultaneous = simultaneous
+
+        # Compiler of huge instruction lists using several processes (lawnmower.src.transfer.ParallelCompiler). None if
+        #   a single process
+        self.parallel_compiler = lawnmower.src.transfer.ParallelCompiler(processes=processes) \
+            if processes != 1 else None
+
+        # Runner of big fleets using several processes (lawnmower.src.parallel_fleet.ParallelFleetRunner). None if a
+        #   single process
+        self.parallel_runner = lawnmower.src.parallel_fleet.ParallelFleetRunner(
+            processes=processes, compile_programs=compile_programs, cache_programs=cache_programs,
+            vectorized=vectorized) if processes != 1 else None
+
         # Lawn info (lawnmower.src.lawn.Lawn)
         self.lawn = None
 
@@ -30,12 +103,20 @@ class Scheduler:
         # (list of lawnmower.src.mower.Mower)
         self.mowers = []
 
+        # Final positions of the prior mowers, if mower overlapping is not allowed
+        # (lawnmower.src.occupancy.OccupancyIndex/lawnmower.src.occupancy.OccupancyGrid)
+        self.occupancy = lawnmower.src.occupancy.OccupancyIndex()
+
+        # Compiled programs, and their results, on the current lawn (lawnmower.src.program_cache.ProgramCache). None if
+        #   not cached
+        self.programs = None
+
     def __repr__(self):
         result = ""
 
         try:
             for mower in self.mowers:
-                result += "{} {} {}\n".format(mower.x, mower.y, mower.orientation.get_str())
+                result += self.get_mower_str(mower) + "\n"
 
         except (TypeError, AttributeError):
             # If no mowers simply ignore it.
@@ -43,6 +124,16 @@ class Scheduler:
 
         return result
 
+    @staticmethod
+    def get_mower_str(mower):
+        """
+            Gets the output representation of the position and orientation of a mower.
+
+        :param mower: (lawnmower.src.mower.Mower) The mower.
+        :return: (str) Its position and orientation (e.g., "1 3 N").
+        """
+        return "{} {} {}".format(mower.x, mower.y, mower.orientation.get_str())
+
     @staticmethod
     def print(message):
         """
@@ -67,123 +158,443 @@ class Scheduler:
         if verbose:
             Scheduler.print(message)
 
-    def run(self, verbose=False):
+    def init_scheduler(self, verbose=False, mower_count=None):
         """
-            Uses the loaded configuration to obtain all info, both from the lawn to be cleaned and the available mowers,
-             required to clean the lawn. Each mower moves sequentially, it means that the second mower moves only after
-             the first one executes all its instructions.
+            Initializes the lawn, according to the loaded configuration, and forgets about any previously run mower.
 
-            IMPLEMENTATION NOTE: I decided to add additional verbosity to highly increase testability, although it
-                slightly reduce code readability.
+        :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
+        :param mower_count: (int) Number of mowers to run, if known in advance.
+        :return: None
+        """
+        self.cprint("##############################################################", verbose)
+        self.cprint("STEP  1.0 - Starting scheduler ... ", verbose)
 
-            TODO: For the sake of readability, split this long method into:
-                    init_scheduler, init_mower, execute_mower_instructions
+        # Load Lawn info
+        self.lawn = lawnmower.src.lawn.Lawn(x_max=self.config_file.lawn_x_max, y_max=self.config_file.lawn_y_max)
+        self.mowers = []
+        self.occupancy = self.create_occupancy(mower_count)
+        self.programs = lawnmower.src.program_cache.ProgramCache(self.lawn) if self.cache_programs else None
 
-            TODO: For the sake of readability, parametrize cprint method to simply indicate the step
-                    (i.e., single call per step)
+        self.cprint("STEP  2.0 - Lawn initialized: {}".format(self.lawn), verbose)
+
+    def is_occupancy_grid_better(self, mower_count=None):
+        """
+            Tells if the final positions of the prior mowers are better stored in a dense grid of the whole lawn (see
+            lawnmower.src.occupancy.OccupancyGrid) than hashed and indexed (see lawnmower.src.occupancy.OccupancyIndex).
+            That is, if the lawn is small, or if it is not too big and there are enough mowers for the grid to be the
+            smaller one.
+
+        :param mower_count: (int) Number of mowers to run. If None (i.e., not known in advance), only small lawns are
+                    stored in a dense grid.
+        :return: (bool) True if a dense grid is better; False otherwise.
+        """
+        area = (self.lawn.x_max - self.lawn.x_min + 1) * (self.lawn.y_max - self.lawn.y_min + 1)
+
+        if area <= self.occupancy_grid_min_cells:
+            return True
 
+        return mower_count is not None and area <= self.occupancy_grid_max_cells and \
+            area <= mower_count * self.occupancy_grid_cells_per_mower
+
+    def create_occupancy(self, mower_count=None):
+        """
+            Creates the (empty) storage of the final positions of the prior mowers on the current lawn (see
+            self.occupancy_grid). If mower overlapping is allowed, it is never used, so no dense grid is allocated.
+
+        :param mower_count: (int) Number of mowers to run, if known in advance.
+        :return: (lawnmower.src.occupancy.OccupancyIndex/lawnmower.src.occupancy.OccupancyGrid) The storage.
+        """
+        if self.mower_overlapping:
+            use_grid = False
+
+        elif self.occupancy_grid is not None:
+            use_grid = self.occupancy_grid
+
+        else:
+            use_grid = self.is_occupancy_grid_better(mower_count)
+
+        return lawnmower.src.occupancy.OccupancyGrid(self.lawn) if use_grid \
+            else lawnmower.src.occupancy.OccupancyIndex()
+
+    def init_mower(self, mower_info, verbose=False):
+        """
+            Creates a mower, placed on the lawn, according to the specified info.
+
+        :param mower_info: (dict) Info of the mower (see lawnmower.src.config_file.ConfigFile.mowers).
+        :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
+        :return: (lawnmower.src.mower.Mower) The initialized mower.
+        """
+        self.cprint("----------------------------------------------------------------------", verbose)
+        self.cprint("----------------------------------------------------------------------", verbose)
+        self.cprint("STEP  3.0 - Initializing Mower #{}".format(len(self.mowers)), verbose)
+
+        orientation = lawnmower.src.orientation.Orientation(orientation_str=mower_info["initial_orientation"])
+        mower = lawnmower.src.mower.Mower(x=mower_info["initial_position"][0],
+                                          y=mower_info["initial_position"][1],
+                                          orientation=orientation, lawn=self.lawn)
+
+        self.cprint("STEP  4.0", verbose)
+        self.cprint("STEP  4.1 - initial position  X: {}".format(mower.x), verbose)
+        self.cprint("STEP  4.1 - initial position  Y: {}".format(mower.y), verbose)
+        self.cprint("STEP  4.1 - initial orientation: {}".format(mower.orientation.get_str()), verbose)
+
+        return mower
+
+    def is_prior_mower_position(self, x, y):
+        """
+            Tells if the specified position is the final position of any prior mower (see self.mowers), in O(1) no
+            matter how many prior mowers there are (see self.occupancy).
+
+        :param x: (int) Coordinate X of the position.
+        :param y: (int) Coordinate Y of the position.
+        :return: (bool) True if any prior mower is there; False otherwise.
+        """
+        return self.occupancy.is_occupied(x, y)
+
+    def execute_mower_instruction(self, mower, instruction, verbose=False):
+        """
+            Executes a single instruction of the specified mower. If mower overlapping is not allowed, any movement
+            leading to the final position of a prior mower (see self.mowers) is ignored.
+
+        :param mower: (lawnmower.src.mower.Mower) The mower executing the instruction.
+        :param instruction: (str) The instruction to execute.
         :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
         :return: None
         """
-        try:
-            self.cprint("##############################################################", verbose)
-            self.cprint("STEP  1.0 - Starting scheduler ... ", verbose)
+        self.cprint("----------------------------------------------------------------------", verbose)
+        self.cprint("STEP  5.0 - instruction        : {}".format(instruction), verbose)
+        self.cprint("STEP  5.0 - mower_overlapping  : {}".format(self.mower_overlapping), verbose)
+        self.cprint("STEP  5.0 - current position  X: {}".format(mower.x), verbose)
+        self.cprint("STEP  5.0 - current position  Y: {}".format(mower.y), verbose)
+        self.cprint("STEP  5.0 - current orientation: {}".format(mower.orientation.get_str()), verbose)
 
-            # Load Lawn info
-            self.lawn = lawnmower.src.lawn.Lawn(x_max=self.config_file.lawn_x_max, y_max=self.config_file.lawn_y_max)
-            self.mowers = []
+        if self.mower_overlapping:
+            # No need to care about prior mowers
+            self.cprint("STEP  6.0", verbose)
 
-            self.cprint("STEP  2.0 - Lawn initialized: {}".format(self.lawn), verbose)
+            mower.execute(instruction=instruction)
 
-            for mower_info in self.config_file.mowers:
+            self.cprint("STEP  7.0 - new           X: {}".format(mower.x), verbose)
+            self.cprint("STEP  7.0 - new           Y: {}".format(mower.y), verbose)
+            self.cprint("STEP  7.0 - new orientation: {}".format(mower.orientation.get_str()), verbose)
+
+        else:
+            # First, obtain the position after running the instruction
+            self.cprint("STEP  8.0", verbose)
+
+            next_x, next_y = mower.execute(instruction=instruction, dry_run_mode=True)
+
+            self.cprint("STEP  9.0 - next_x     : {}".format(next_x), verbose)
+            self.cprint("STEP 10.0 - next_y     : {}".format(next_y), verbose)
+            self.cprint("STEP 10.1 - orientation: {}".format(mower.orientation.get_str()), verbose)
+
+            if next_x is not None and next_y is not None:
+                self.cprint("STEP 11.0", verbose)
+
+                # There is a position modification. Check prior mowers' last position
+                mowers_collision = self.is_prior_mower_position(next_x, next_y)
+
+                self.cprint("STEP 12.0 - mowers_collision: {}".format(mowers_collision), verbose)
+
+                if not mowers_collision:
+                    # If no collision execute. Otherwise, ignore it.
+                    mower.execute(instruction=instruction)
+
+                    self.cprint("STEP 13.0 - new position   X: {}".format(mower.x), verbose)
+                    self.cprint("STEP 13.0 - new position   Y: {}".format(mower.y), verbose)
+                    self.cprint("STEP 13.0 - new orientation : {}".format(mower.orientation.get_str()),
+                                verbose)
+
+            else:
+                # There is NO position modification. Proceed to really execute the instruction
+                mower.execute(instruction=instruction)
+
+                self.cprint("STEP 14.0 - new            X: {}".format(mower.x), verbose)
+                self.cprint("STEP 14.0 - new            Y: {}".format(mower.y), verbose)
+                self.cprint("STEP 14.0 - new orientation : {}".format(mower.orientation.get_str()), verbose)
+
+    def execute_mower_run(self, mower, instruction, count, verbose=False):
+        """
+            Executes a run of a run-length encoded instruction list (see lawnmower.src.mower.Mower.parse_runs) as a
+            single move, bounded by the lawn. If mower overlapping is not allowed, the mower also stops just before
+            the final position of the first prior mower (see self.mowers) in its way, since all the remaining forward
+            instructions would be ignored.
+
+        :param mower: (lawnmower.src.mower.Mower) The mower executing the run.
+        :param instruction: (str) The instruction to execute, in upper case.
+        :param count: (int) Number of times to execute it.
+        :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
+        :return: None
+        """
+        self.cprint("----------------------------------------------------------------------", verbose)
+        self.cprint("STEP  5.0 - instruction run    : {} x {}".format(instruction, count), verbose)
+        self.cprint("STEP  5.0 - mower_overlapping  : {}".format(self.mower_overlapping), verbose)
+        self.cprint("STEP  5.0 - current position  X: {}".format(mower.x), verbose)
+        self.cprint("STEP  5.0 - current position  Y: {}".format(mower.y), verbose)
+        self.cprint("STEP  5.0 - current orientation: {}".format(mower.orientation.get_str()), verbose)
+
+        if self.mower_overlapping or instruction != "F":
+            mower.execute_run(instruction, count)
+
+        else:
+            # First, bound the run to the lawn. Then, to the nearest prior mower in its way (all the remaining forward
+            #   instructions would be ignored)
+            next_x, next_y = mower.forward_run(count, dry_run_mode=True)
+
+            if (next_x, next_y) != (mower.x, mower.y):
+                dx = (next_x > mower.x) - (next_x < mower.x)
+                dy = (next_y > mower.y) - (next_y < mower.y)
+                mower.forward_run(self.occupancy.get_free_steps(mower.x, mower.y, dx, dy,
+                                                                abs(next_x - mower.x) + abs(next_y - mower.y)))
+
+        self.cprint("STEP  7.0 - new           X: {}".format(mower.x), verbose)
+        self.cprint("STEP  7.0 - new           Y: {}".format(mower.y), verbose)
+        self.cprint("STEP  7.0 - new orientation: {}".format(mower.orientation.get_str()), verbose)
+
+    def execute_mower_instructions(self, mower, instruction_list, verbose=False):
+        """
+            Executes all the instructions of the specified mower. If mower overlapping is not allowed, any movement
+            leading to the final position of a prior mower (see self.mowers) is ignored.
+
+            When not verbose, valid instruction lists are compiled and run at once (see self.compile_programs). Mowers
+            sharing the same instruction list share the same compiled program and, if mower overlapping is allowed,
+            the same results (see self.cache_programs).
+            Run-length encoded instruction lists (e.g., "F1200R L3", see lawnmower.src.mower.Mower.parse_runs) are
+            executed run by run. Otherwise, instructions are executed one by one. Program trees (see
+            lawnmower.src.program_tree.ProgramTree) are never split across several processes, since their compiled
+            programs do not need to expand them anyway.
+
+        :param mower: (lawnmower.src.mower.Mower) The mower executing the instructions.
+        :param instruction_list: (str/lawnmower.src.program_tree.ProgramTree) The instructions to execute, in
+            chronological order.
+        :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
+        :return: None
+        """
+        self.cprint("STEP  4.2 - Starting to execute instructions: {} ...".format(instruction_list), verbose)
+
+        program = None
+        transfer_function = None
+
+        if self.parallel_compiler is not None and self.mower_overlapping and not verbose and \
+                mower.is_properly_initialized() and len(instruction_list) >= self.parallel_min_instructions and \
+                not isinstance(instruction_list, lawnmower.src.program_tree.ProgramTree):
+            # Split it across several processes
+            transfer_function = self.parallel_compiler.compile(instruction_list, mower.lawn)
+
+        if transfer_function is None and self.compile_programs and not verbose and mower.is_properly_initialized():
+            program = self.programs.get_program(instruction_list) if self.programs is not None \
+                else lawnmower.src.program.Program.compile(instruction_list)
+
+        runs = lawnmower.src.mower.Mower.parse_runs(instruction_list) \
+            if program is None and transfer_function is None else None
+
+        if transfer_function is not None:
+            mower.x, mower.y, mower.orientation.orientation = transfer_function.apply(
+                mower.x, mower.y, mower.orientation.orientation, mower.lawn)
+
+        elif program is not None and self.mower_overlapping and self.programs is not None:
+            # No intermediate steps to print out. Its final state only depends on its initial one
+            mower.x, mower.y, mower.orientation.orientation = self.programs.run(
+                program, mower.x, mower.y, mower.orientation.orientation)
+
+        elif program is not None:
+            # No intermediate steps to print out. Run the whole compiled program at once
+            mower.x, mower.y, mower.orientation.orientation = program.run(
+                mower.x, mower.y, mower.orientation.orientation, mower.lawn,
+                None if self.mower_overlapping else self.occupancy)
+
+        elif runs is None:
+            for instruction in instruction_list:
+                self.execute_mower_instruction(mower, instruction, verbose)
+
+        else:
+            for instruction, count in runs:
+                self.execute_mower_run(mower, instruction, count, verbose)
+
+        # The mower has finished executing all its instructions
+        self.cprint("----------------------------------------------------------------------", verbose)
+        self.cprint("STEP 15.0 - Mower #{} ".format(len(self.mowers)), verbose)
+        self.cprint(".......................................", verbose)
+        self.cprint("STEP 15.0 - FINAL position  X: {}".format(mower.x), verbose)
+        self.cprint("STEP 15.0 - FINAL position  Y: {}".format(mower.y), verbose)
+        self.cprint("STEP 15.0 - FINAL orientation: {}".format(mower.orientation.get_str()), verbose)
+
+    def iter_run(self, mowers_info=None, verbose=False, keep_mowers=True):
+        """
+            Generator version of run, yielding each mower as soon as it has executed all its instructions.
+
+            Combined with lawnmower.src.config_file.ConfigFile.iter_mowers it allows to run huge configuration files
+            with flat memory usage: when mower overlapping is allowed and keep_mowers is False, finished mowers are not
+            stored in self.mowers. Notice that, if mower overlapping is NOT allowed, the final position of every prior
+            mower is always needed (i.e., they are stored in self.mowers in any case).
+
+        :param mowers_info: (iterable of dict) Info of the mowers to run (see
+                    lawnmower.src.config_file.ConfigFile.mowers). If not specified, the mowers of the loaded
+                    configuration are used.
+        :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
+        :param keep_mowers: (bool) If True all finished mowers are stored in self.mowers.
+        :return: (generator of lawnmower.src.mower.Mower) Each mower, in order, after having executed its instructions.
+        """
+        try:
+            if mowers_info is None:
+                mowers_info = self.config_file.mowers
+
+            self.init_scheduler(verbose, len(mowers_info) if isinstance(mowers_info, collections.abc.Sized) else None)
+
+            for mower_info in mowers_info:
                 # Load Mower info
-                self.cprint("----------------------------------------------------------------------", verbose)
-                self.cprint("----------------------------------------------------------------------", verbose)
-                self.cprint("STEP  3.0 - Initializing Mower #{}".format(len(self.mowers)), verbose)
-
-                orientation = lawnmower.src.orientation.Orientation(orientation_str=mower_info["initial_orientation"])
-                mower = lawnmower.src.mower.Mower(x=mower_info["initial_position"][0],
-                                                  y=mower_info["initial_position"][1],
-                                                  orientation=orientation, lawn=self.lawn)
-
-                self.cprint("STEP  4.0", verbose)
-                self.cprint("STEP  4.1 - initial position  X: {}".format(mower.x), verbose)
-                self.cprint("STEP  4.1 - initial position  Y: {}".format(mower.y), verbose)
-                self.cprint("STEP  4.1 - initial orientation: {}".format(mower.orientation.get_str()), verbose)
-                self.cprint("STEP  4.2 - Starting to execute instructions: {} ...".format(
-                    mower_info["instruction_list"]), verbose)
+                mower = self.init_mower(mower_info, verbose)
 
                 # Execute current mower instructions
-                for instruction in mower_info["instruction_list"]:
+                self.execute_mower_instructions(mower, mower_info["instruction_list"], verbose)
+
+                if keep_mowers or not self.mower_overlapping:
+                    self.mowers.append(mower)
+
+                if not self.mower_overlapping and mower.is_properly_initialized():
+                    self.occupancy.add(mower.x, mower.y)
+
+                self.cprint("STEP 16.0", verbose)
+
+                yield mower
+
+        except AttributeError:
+            print("ERROR while running scheduler : Missing valid config file")
+
+        except TypeError:
+            print("ERROR while running scheduler : Config file not properly loaded")
+
+        self.cprint("STEP 17.0", verbose)
+        self.cprint("##############################################################", verbose)
 
-                    self.cprint("----------------------------------------------------------------------", verbose)
-                    self.cprint("STEP  5.0 - instruction        : {}".format(instruction), verbose)
-                    self.cprint("STEP  5.0 - mower_overlapping  : {}".format(self.mower_overlapping), verbose)
-                    self.cprint("STEP  5.0 - current position  X: {}".format(mower.x), verbose)
-                    self.cprint("STEP  5.0 - current position  Y: {}".format(mower.y), verbose)
-                    self.cprint("STEP  5.0 - current orientation: {}".format(mower.orientation.get_str()), verbose)
+    def run_fleet(self):
+        """
+            Runs all mowers at once (see lawnmower.src.fleet.FleetSimulator). Mower overlapping MUST be allowed. Mowers
+            whose instructions can not be compiled into opcodes (e.g., invalid or run-length encoded instruction lists)
+            are executed one by one, as usual.
+
+        :return: None
+        """
+        try:
+            self.init_scheduler()
+            fleet = lawnmower.src.fleet.FleetSimulator(self.lawn)
+            fleet_mowers = []
 
-                    if self.mower_overlapping:
-                        # No need to care about prior mowers
-                        self.cprint("STEP  6.0", verbose)
+            try:
+                for mower_info in self.config_file.mowers:
+                    mower = self.init_mower(mower_info)
+                    program = None
 
-                        mower.execute(instruction=instruction)
+                    if mower.is_properly_initialized():
+                        program = self.programs.get_program(mower_info["instruction_list"]) \
+                            if self.programs is not None \
+                            else lawnmower.src.program.Program.compile(mower_info["instruction_list"])
 
-                        self.cprint("STEP  7.0 - new           X: {}".format(mower.x), verbose)
-                        self.cprint("STEP  7.0 - new           Y: {}".format(mower.y), verbose)
-                        self.cprint("STEP  7.0 - new orientation: {}".format(mower.orientation.get_str()), verbose)
+                    if program is None or program.opcodes is None:
+                        self.execute_mower_instructions(mower, mower_info["instruction_list"])
 
                     else:
-                        # First, obtain the position after running the instruction
-                        self.cprint("STEP  8.0", verbose)
+                        fleet.add(mower.x, mower.y, mower.orientation.orientation, program.opcodes)
+                        fleet_mowers.append(mower)
 
-                        next_x, next_y = mower.execute(instruction=instruction, dry_run_mode=True)
+                    self.mowers.append(mower)
 
-                        self.cprint("STEP  9.0 - next_x     : {}".format(next_x), verbose)
-                        self.cprint("STEP 10.0 - next_y     : {}".format(next_y), verbose)
-                        self.cprint("STEP 10.1 - orientation: {}".format(mower.orientation.get_str()), verbose)
+            finally:
+                # Any mower may abort the run (e.g., invalid initial position): all prior mowers still get their final
+                #   states, as when running them one by one
+                if fleet_mowers:
+                    for mower, x, y, orientation in zip(fleet_mowers, *(values.tolist() for values in fleet.run())):
+                        mower.x = x
+                        mower.y = y
+                        mower.orientation.orientation = orientation
 
-                        if next_x is not None and next_y is not None:
-                            self.cprint("STEP 11.0", verbose)
+        except AttributeError:
+            print("ERROR while running scheduler : Missing valid config file")
 
-                            # There is a position modification. Check prior mowers' last position
-                            mowers_collision = False
+        except TypeError:
+            print("ERROR while running scheduler : Config file not properly loaded")
 
-                            for prior_mower in self.mowers:
-                                if next_x == prior_mower.x and next_y == prior_mower.y:
-                                    mowers_collision = True
-                                    break
+    def run_parallel(self):
+        """
+            Runs all mowers using several processes (see lawnmower.src.parallel_fleet.ParallelFleetRunner). Mower
+            overlapping MUST be allowed. Mowers not properly initialized, and huge instruction lists (already split
+            across several processes, see parallel_min_instructions), are executed within this very same process, as
+            usual.
 
-                            self.cprint("STEP 12.0 - mowers_collision: {}".format(mowers_collision), verbose)
+        :return: None
+        """
+        try:
+            self.init_scheduler()
+            parallel_mowers = []
+            parallel_mowers_info = []
 
-                            if not mowers_collision:
-                                # If no collision execute. Otherwise, ignore it.
-                                mower.execute(instruction=instruction)
+            try:
+                for mower_info in self.config_file.mowers:
+                    mower = self.init_mower(mower_info)
+                    instruction_list = mower_info["instruction_list"]
 
-                                self.cprint("STEP 13.0 - new position   X: {}".format(mower.x), verbose)
-                                self.cprint("STEP 13.0 - new position   Y: {}".format(mower.y), verbose)
-                                self.cprint("STEP 13.0 - new orientation : {}".format(mower.orientation.get_str()),
-                                            verbose)
+                    if mower.is_properly_initialized() and (len(instruction_list) < self.parallel_min_instructions or
+                                                            isinstance(instruction_list,
+                                                                       lawnmower.src.program_tree.ProgramTree)):
+                        parallel_mowers.append(mower)
+                        parallel_mowers_info.append(mower_info)
 
-                        else:
-                            # There is NO position modification. Proceed to really execute the instruction
-                            mower.execute(instruction=instruction)
+                    else:
+                        self.execute_mower_instructions(mower, instruction_list)
 
-                            self.cprint("STEP 14.0 - new            X: {}".format(mower.x), verbose)
-                            self.cprint("STEP 14.0 - new            Y: {}".format(mower.y), verbose)
-                            self.cprint("STEP 14.0 - new orientation : {}".format(mower.orientation.get_str()), verbose)
+                    self.mowers.append(mower)
 
-                # The mower has finished executing all its instructions
-                self.cprint("----------------------------------------------------------------------", verbose)
-                self.cprint("STEP 15.0 - Mower #{} ".format(len(self.mowers)), verbose)
-                self.cprint(".......................................", verbose)
-                self.cprint("STEP 15.0 - FINAL position  X: {}".format(mower.x), verbose)
-                self.cprint("STEP 15.0 - FINAL position  Y: {}".format(mower.y), verbose)
-                self.cprint("STEP 15.0 - FINAL orientation: {}".format(mower.orientation.get_str()), verbose)
+            finally:
+                # Any mower may abort the run (e.g., invalid initial position): all prior mowers still get their final
+                #   states, as when running them one by one
+                if parallel_mowers:
+                    for mower, (x, y, orientation) in zip(parallel_mowers, self.parallel_runner.run(
+                            self.config_file.lawn_x_max, self.config_file.lawn_y_max, parallel_mowers_info)):
+                        mower.x = x
+                        mower.y = y
+                        mower.orientation.orientation = orientation
+
+        except AttributeError:
+            print("ERROR while running scheduler : Missing valid config file")
+
+        except TypeError:
+            print("ERROR while running scheduler : Config file not properly loaded")
+
+    def run_simultaneous(self):
+        """
+            Runs all mowers at once, one instruction per tick (see lawnmower.src.simultaneous.SimultaneousSimulator),
+            either mower by mower or, if vectorized, for the whole fleet at once (see
+            lawnmower.src.simultaneous_fleet.SimultaneousFleetSimulator). Mower overlapping MUST NOT be allowed. Mowers
+            not properly initialized do not take part in it.
+
+        :return: None
+        """
+        try:
+            self.init_scheduler()
+            simulator = lawnmower.src.simultaneous_fleet.SimultaneousFleetSimulator(self.lawn) \
+                if self.vectorized and lawnmower.src.simultaneous_fleet.SimultaneousFleetSimulator.is_available() \
+                else lawnmower.src.simultaneous.SimultaneousSimulator(self.lawn)
+            simulated_mowers = []
+
+            for mower_info in self.config_file.mowers:
+                mower = self.init_mower(mower_info)
+
+                if mower.is_properly_initialized():
+                    simulator.add(mower.x, mower.y, mower.orientation.orientation,
+                                  simulator.get_opcodes(mower_info["instruction_list"]))
+                    simulated_mowers.append(mower)
 
                 self.mowers.append(mower)
 
-                self.cprint("STEP 16.0", verbose)
+            states = simulator.run()
+
+            if isinstance(simulator, lawnmower.src.simultaneous_fleet.SimultaneousFleetSimulator):
+                states = [values.tolist() for values in states]
+
+            for mower, x, y, orientation in zip(simulated_mowers, *states):
+                mower.x = x
+                mower.y = y
+                mower.orientation.orientation = orientation
 
         except AttributeError:
             print("ERROR while running scheduler : Missing valid config file")
@@ -191,5 +602,35 @@ class Scheduler:
         except TypeError:
             print("ERROR while running scheduler : Config file not properly loaded")
 
-        self.cprint("STEP 17.0", verbose)
-        self.cprint("##############################################################", verbose)
+    def run(self, verbose=False):
+        """
+            Uses the loaded configuration to obtain all info, both from the lawn to be cleaned and the available mowers,
+            required to clean the lawn. Each mower moves sequentially, it means that the second mower moves only after
+            the first one executes all its instructions. Unless all mowers move at once (see self.simultaneous), in
+            which case no intermediate step is printed out. If mower overlapping is allowed, mowers never interact, so
+            when not verbose they may be run by several processes at once (see self.parallel_runner).
+
+            IMPLEMENTATION NOTE: I decided to add additional verbosity to highly increase testability, although it
+                slightly reduce code readability.
+
+            TODO: For the sake of readability, parametrize cprint method to simply indicate the step
+                    (i.e., single call per step)
+
+        :param verbose: (bool) If True prints out intermediate steps in order to better visualize the whole process.
+        :return: None
+        """
+        if self.simultaneous and not self.mower_overlapping:
+            self.run_simultaneous()
+            return
+
+        if self.vectorized and self.compile_programs and self.mower_overlapping and not verbose and \
+                lawnmower.src.fleet.FleetSimulator.is_available():
+            self.run_fleet()
+            return
+
+        if self.parallel_runner is not None and self.mower_overlapping and not verbose:
+            self.run_parallel()
+            return
+
+        for _ in self.iter_run(verbose=verbose):
+            pass
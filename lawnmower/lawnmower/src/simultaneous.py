@@ -0,0 +1,256 @@
+import collections
+
+import lawnmower.src.mower
+import lawnmower.src.orientation
+import lawnmower.src.program
+import lawnmower.src.program_tree
+
+
+class SimultaneousSimulator:
+    """
+        Time-stepped simulation of a whole fleet of mowers moving all at once, when mower overlapping is NOT allowed:
+        at tick i, every mower runs its i-th instruction. Mowers whose instructions have all been run just stay where
+        they are, still occupying their cell.
+
+        Rotations always succeed. Forward moves leading outside the lawn are ignored, as usual. Otherwise, conflicts
+        among forward moves of the same tick are solved by the following deterministic rules:
+
+            1. Two or more mowers targeting the same cell: only the first one (i.e., the lowest index, that is, the
+               order in the configuration file) may enter it. The other ones stay where they are.
+            2. A mower may enter a cell occupied at the beginning of the tick only if every mower there leaves it
+               within that very same tick (e.g., a line of mowers moving forward together).
+            3. Two mowers swapping their cells would go through each other, so neither of them moves.
+            4. A closed loop of three or more mowers, each one entering the cell of the next one, does move.
+
+        Each tick only costs O(number of active mowers), no matter how close they are: the cells occupied at the
+        beginning of the tick, and the cells targeted by forward moves (i.e., the winner of rule 1), are hashed by cell
+        id, so that no pair of mowers is ever compared. Rules 2 and 3 are then solved by propagating each blocked mower
+        to the one targeting its cell, which is unique because of rule 1.
+    """
+    # Opcode of an invalid instruction, which takes a tick without doing anything (as lawnmower.src.mower.Mower.execute
+    #   does, ignoring it)
+    no_operation_opcode = 3
+
+    # Translation table from instructions to opcodes (see lawnmower.src.program.Program.get_opcodes), invalid ones
+    #   included
+    instructions_to_opcodes = bytes(lawnmower.src.orientation.Orientation.instructions_to_opcodes[byte]
+                                    if byte in b"LRFlrf" else 3 for byte in range(256))
+
+    def __init__(self, lawn):
+        """
+            Initializes an empty fleet.
+
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn on which the mowers are located.
+        :return: None
+        """
+        # The lawn on which the mowers are located (lawnmower.src.lawn.Lawn)
+        self.lawn = lawn
+
+        # Coordinate X of the initial position of each mower (list of int)
+        self.x = []
+
+        # Coordinate Y of the initial position of each mower (list of int)
+        self.y = []
+
+        # Initial orientation integer value of each mower (list of int)
+        self.orientation = []
+
+        # Opcodes of each mower, one per tick (list of bytes)
+        self.opcodes = []
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    @classmethod
+    def get_opcodes(cls, instruction_list):
+        """
+            Translates the specified instruction list into opcodes, one per tick. Run-length encoded instruction lists
+            (see lawnmower.src.mower.Mower.parse_runs) and program trees (see lawnmower.src.program_tree.ProgramTree)
+            are expanded, since each instruction takes its own tick anyway.
+
+        :param instruction_list: (str/bytes/lawnmower.src.program_tree.ProgramTree) The instructions.
+        :return: (bytes) The opcodes. Invalid instructions are translated into no_operation_opcode.
+        """
+        if isinstance(instruction_list, lawnmower.src.program_tree.ProgramTree):
+            instruction_list = instruction_list.expand()
+
+        runs = lawnmower.src.mower.Mower.parse_runs(instruction_list)
+
+        if runs is not None:
+            instruction_list = "".join(instruction * count for instruction, count in runs)
+
+        if isinstance(instruction_list, str):
+            instruction_list = instruction_list.encode("ascii", errors="replace")
+
+        if not isinstance(instruction_list, (bytes, bytearray)):
+            print("ERROR while translating instruction list : Invalid instruction list '{}'".format(instruction_list))
+            return b""
+
+        return bytes(instruction_list).translate(cls.instructions_to_opcodes)
+
+    def add(self, x, y, orientation, opcodes):
+        """
+            Adds a mower to the fleet. Mowers MUST be added in the order of the configuration file (see rule 1).
+
+        :param x: (int) Coordinate X of its initial position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of its initial position. It MUST be within the lawn.
+        :param orientation: (int) Initial orientation integer value (see lawnmower.src.orientation.Orientation).
+        :param opcodes: (bytes) Its opcodes, one per tick (see get_opcodes).
+        :return: (int) Index of the mower within the fleet.
+        """
+        self.x.append(x)
+        self.y.append(y)
+        self.orientation.append(orientation)
+        self.opcodes.append(opcodes)
+
+        return len(self.opcodes) - 1
+
+    def run(self):
+        """
+            Runs the opcodes of all mowers of the fleet, tick by tick.
+
+        :return: (tuple) (<x>, <y>, <orientation>) final state of every mower, in the order they were added, with:
+                        <x> : (list of int) Coordinate X of the final position of each mower.
+                        <y> : (list of int) Coordinate Y of the final position of each mower.
+                        <orientation> : (list of int) Final orientation integer value of each mower.
+        """
+        lawn = self.lawn
+        x_min = lawn.x_min
+        x_max = lawn.x_max
+        y_min = lawn.y_min
+        y_max = lawn.y_max
+        width = x_max - x_min + 1
+
+        program = lawnmower.src.program.Program
+        forward_x = program.forward_x
+        forward_y = program.forward_y
+        forward_opcode = program.forward_opcode
+        rotate_left_opcode = program.rotate_left_opcode
+        rotate_right_opcode = program.rotate_right_opcode
+
+        # Cell id modification of a forward move, by orientation integer value
+        forward_cell = [forward_x[orientation] + forward_y[orientation] * width for orientation in range(4)]
+
+        x = list(self.x)
+        y = list(self.y)
+        orientation = list(self.orientation)
+        opcodes = self.opcodes
+        lengths = [len(mower_opcodes) for mower_opcodes in opcodes]
+
+        # Cell id of the position of each mower
+        cells = [(mower_y - y_min) * width + mower_x - x_min for mower_x, mower_y in zip(x, y)]
+
+        # Cell ids of the occupied cells
+        occupied = set(cells)
+
+        # Number of mowers within each cell occupied by several of them (i.e., sharing their initial cell), by cell id
+        shared = {cell: count for cell, count in collections.Counter(cells).items() if count > 1} \
+            if len(occupied) < len(cells) else {}
+
+        # Mowers with instructions still to run, in order (see rule 1). Ticks at which any of them runs out of them
+        active = [index for index, length in enumerate(lengths) if length]
+        ends = set(lengths)
+
+        for tick in range(max(lengths, default=0)):
+            if tick in ends:
+                active = [index for index in active if lengths[index] > tick]
+
+            # First mower targeting each cell (see rule 1), by cell id
+            claims = {}
+
+            for index in active:
+                opcode = opcodes[index][tick]
+
+                if opcode == forward_opcode:
+                    mower_orientation = orientation[index]
+                    new_x = x[index] + forward_x[mower_orientation]
+                    new_y = y[index] + forward_y[mower_orientation]
+
+                    if x_min <= new_x <= x_max and y_min <= new_y <= y_max:
+                        target = cells[index] + forward_cell[mower_orientation]
+
+                        if target not in claims:
+                            claims[target] = index
+
+                elif opcode == rotate_left_opcode:
+                    orientation[index] = (orientation[index] - 1) & 3
+
+                elif opcode == rotate_right_opcode:
+                    orientation[index] = (orientation[index] + 1) & 3
+
+            if claims:
+                self.move(claims, x, y, orientation, cells, occupied, shared)
+
+        return x, y, orientation
+
+    @staticmethod
+    def move(claims, x, y, orientation, cells, occupied, shared):
+        """
+            Moves, within a tick, the mowers which are not blocked by any other one (see rules 2 to 4).
+
+        :param claims: (dict) Index of the first mower targeting each cell, by cell id (see rule 1).
+        :param x: (list of int) Coordinate X of the position of each mower. Updated.
+        :param y: (list of int) Coordinate Y of the position of each mower. Updated.
+        :param orientation: (list of int) Orientation integer value of each mower.
+        :param cells: (list of int) Cell id of the position of each mower. Updated.
+        :param occupied: (set of int) Cell ids of the occupied cells. Updated.
+        :param shared: (dict) Number of mowers within each cell occupied by several of them, by cell id. Updated.
+        :return: None
+        """
+        get_cell = cells.__getitem__
+        origins = list(map(get_cell, claims.values()))
+        origin_set = set(origins)
+
+        # Number of mowers leaving each cell occupied by several of them, by cell id
+        leaving = collections.Counter(cell for cell in origins if cell in shared) if shared else {}
+
+        # Mowers that can not move: either some mower stays within their target cell (see rule 2) or they would swap
+        #   their cells (see rule 3). Free target cells need no check at all
+        blocked = []
+
+        for target in claims.keys() & occupied:
+            index = claims[target]
+            other_index = claims.get(cells[index])
+
+            if target not in origin_set or (target in shared and leaving[target] < shared[target]) or \
+                    (other_index is not None and cells[other_index] == target):
+                blocked.append(index)
+
+        # A blocked mower stays within its cell, so the mower targeting that cell (if any) is blocked too
+        stopped = set()
+
+        while blocked:
+            index = blocked.pop()
+
+            if index not in stopped:
+                stopped.add(index)
+                other_index = claims.get(cells[index])
+
+                if other_index is not None:
+                    blocked.append(other_index)
+
+        if stopped:
+            claims = {target: index for target, index in claims.items() if index not in stopped}
+            origins = list(map(get_cell, claims.values()))
+
+        occupied.difference_update(origins)
+        occupied.update(claims)
+
+        if shared:
+            # Cells still occupied by some of their mowers
+            for cell, count in collections.Counter(cell for cell in origins if cell in shared).items():
+                count = shared.pop(cell) - count
+
+                if count:
+                    occupied.add(cell)
+
+                    if count > 1:
+                        shared[cell] = count
+
+        forward_x = lawnmower.src.program.Program.forward_x
+        forward_y = lawnmower.src.program.Program.forward_y
+
+        for target, index in claims.items():
+            cells[index] = target
+            x[index] += forward_x[orientation[index]]
+            y[index] += forward_y[orientation[index]]
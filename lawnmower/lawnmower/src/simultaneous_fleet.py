@@ -0,0 +1,207 @@
+try:
+    import numpy
+except ImportError:
+    # Optional dependency: without it, lawnmower.src.scheduler.Scheduler solves each tick mower by mower (see
+    #   lawnmower.src.simultaneous.SimultaneousSimulator)
+    numpy = None
+
+import lawnmower.src.program
+import lawnmower.src.simultaneous
+
+
+class SimultaneousFleetSimulator(lawnmower.src.simultaneous.SimultaneousSimulator):
+    """
+        Vectorized version of lawnmower.src.simultaneous.SimultaneousSimulator (i.e., all mowers moving at once, one
+        instruction per tick, mower overlapping NOT allowed), following the very same rules. Requires NumPy (see
+        is_available).
+
+        The state of all mowers is kept in arrays, and each position is packed into a single cell id. At each tick, the
+        i-th opcode of every mower is applied at once: rotations through a transition table, and forward moves are
+        turned into target cell ids, leaving out those leading outside the lawn. Conflicts are then solved for the
+        whole fleet with array operations only:
+
+            1. Sorting the target cell ids (unique) gives the first mower targeting each cell.
+            2. Occupant counts at the targets, against the number of mowers leaving them, give the targets where some
+               mower stays.
+            3. The mower entering the cell left by each mower (i.e., targeting it) gives the swaps.
+
+        Counts and entering mowers are kept in dense arrays of the whole lawn, indexed by cell id (see
+        dense_max_cells). For huge lawns, they are searched among the sorted cell ids instead.
+
+        Blocked mowers are propagated to the mowers entering their cells, all of them at once, as many times as the
+        longest line of mowers blocking each other (i.e., a Python-level loop per step of the propagation, but never
+        per mower).
+    """
+    # New orientation integer value, by <orientation> * 4 + <opcode> (see
+    #   lawnmower.src.simultaneous.SimultaneousSimulator.get_opcodes)
+    transition_orientation = tuple(new_orientation for orientation in range(4)
+                                   for new_orientation in ((orientation - 1) & 3, (orientation + 1) & 3, orientation,
+                                                           orientation))
+
+    # Lawn area (number of cells) up to which occupant counts, and entering mowers, are kept in dense arrays of the
+    #   whole lawn (i.e., 24 bytes per cell)
+    dense_max_cells = 1 << 24
+
+    # Number of ticks whose opcodes are gathered at once, tick by tick (i.e., contiguous opcodes of all mowers)
+    block_size = 256
+
+    @staticmethod
+    def is_available():
+        """
+            Tells if the vectorized simulation can be used (i.e., NumPy installed).
+
+        :return: (bool) True if available; False otherwise.
+        """
+        return numpy is not None
+
+    def get_opcode_blocks(self, tick_count):
+        """
+            Gathers the opcodes of all mowers, block by block of ticks (see block_size). Mowers whose instructions have
+            all been run get no-operation opcodes (i.e., they stay where they are).
+
+        :param tick_count: (int) Number of ticks.
+        :return: (generator of numpy.ndarray) Opcodes of each block, with shape (<ticks>, <mowers>).
+        """
+        padding = bytes([self.no_operation_opcode])
+
+        for start in range(0, tick_count, self.block_size):
+            size = min(self.block_size, tick_count - start)
+            block = b"".join([opcodes[start:start + size].ljust(size, padding) for opcodes in self.opcodes])
+
+            yield numpy.frombuffer(block, dtype=numpy.uint8).reshape(len(self.opcodes), size).T.copy()
+
+    def run(self):
+        """
+            Runs the opcodes of all mowers of the fleet, tick by tick.
+
+        :return: (tuple) (<x>, <y>, <orientation>) final state of every mower, in the order they were added, with:
+                        <x> : (numpy.ndarray of int) Coordinate X of the final position of each mower.
+                        <y> : (numpy.ndarray of int) Coordinate Y of the final position of each mower.
+                        <orientation> : (numpy.ndarray of int) Final orientation integer value of each mower.
+        """
+        lawn = self.lawn
+        width = lawn.x_max - lawn.x_min + 1
+        height = lawn.y_max - lawn.y_min + 1
+
+        program = lawnmower.src.program.Program
+        forward_x = numpy.array(program.forward_x, dtype=numpy.int64)
+        forward_y = numpy.array(program.forward_y, dtype=numpy.int64)
+        forward_cell = forward_x + forward_y * width
+        transition_orientation = numpy.array(self.transition_orientation, dtype=numpy.int64)
+
+        x = numpy.array(self.x, dtype=numpy.int64)
+        y = numpy.array(self.y, dtype=numpy.int64)
+        orientation = numpy.array(self.orientation, dtype=numpy.int64)
+        cells = (y - lawn.y_min) * width + x - lawn.x_min
+
+        # Number of mowers within each cell, number of them leaving it, and mover entering it (-1 if none), by cell id
+        #   (see get_moves). None if not dense
+        grids = None
+
+        if width * height <= self.dense_max_cells:
+            grids = (numpy.bincount(cells, minlength=width * height), numpy.zeros(width * height, dtype=numpy.int64),
+                     numpy.full(width * height, -1, dtype=numpy.int64))
+
+        tick_count = max(map(len, self.opcodes), default=0)
+
+        for block in self.get_opcode_blocks(tick_count):
+            for opcodes in block:
+                orientation = transition_orientation[orientation * 4 + opcodes]
+
+                # Forward moves within the lawn
+                candidates = opcodes == program.forward_opcode
+                new_x = x + forward_x[orientation]
+                new_y = y + forward_y[orientation]
+                candidates &= (lawn.x_min <= new_x) & (new_x <= lawn.x_max) & (lawn.y_min <= new_y) & \
+                    (new_y <= lawn.y_max)
+                candidates = numpy.flatnonzero(candidates)
+
+                if candidates.size:
+                    movers, targets = self.get_moves(
+                        candidates, cells[candidates] + forward_cell[orientation[candidates]], cells, grids)
+
+                    if grids is not None:
+                        # Several mowers may leave the same cell (i.e., sharing their initial cell)
+                        numpy.subtract.at(grids[0], cells[movers], 1)
+                        grids[0][targets] += 1
+
+                    cells[movers] = targets
+                    x[movers] += forward_x[orientation[movers]]
+                    y[movers] += forward_y[orientation[movers]]
+
+        return x, y, orientation
+
+    @staticmethod
+    def get_moves(candidates, targets, cells, grids=None):
+        """
+            Gets, within a tick, the mowers which are not blocked by any other one (see
+            lawnmower.src.simultaneous.SimultaneousSimulator rules).
+
+        :param candidates: (numpy.ndarray of int) Indexes of the mowers moving forward within the lawn, sorted.
+        :param targets: (numpy.ndarray of int) Cell id targeted by each of them.
+        :param cells: (numpy.ndarray of int) Cell id of the position of each mower.
+        :param grids: (tuple) (<counts>, <leaving>, <entering>) dense arrays of the whole lawn, by cell id, with:
+                        <counts> : (numpy.ndarray of int) Number of mowers within each cell.
+                        <leaving> : (numpy.ndarray of int) All 0. Only used within the tick.
+                        <entering> : (numpy.ndarray of int) All -1. Only used within the tick.
+                    If None, they are searched among the sorted cell ids instead.
+        :return: (tuple) (<movers>, <targets>) of the mowers actually moving, with:
+                        <movers> : (numpy.ndarray of int) Their indexes.
+                        <targets> : (numpy.ndarray of int) Cell id each one enters.
+        """
+        # Rule 1: first mower targeting each cell, sorted by target. Target and index are packed into a single key,
+        #   unless it might overflow (i.e., huge lawns)
+        if targets.max() < numpy.iinfo(numpy.int64).max // (cells.size + 1):
+            keys = numpy.sort(targets * cells.size + candidates)
+            targets = keys // cells.size
+            first = numpy.empty(keys.size, dtype=bool)
+            first[0] = True
+            numpy.not_equal(targets[1:], targets[:-1], out=first[1:])
+            targets = targets[first]
+            movers = keys[first] - targets * cells.size
+
+        else:
+            targets, first = numpy.unique(targets, return_index=True)
+            movers = candidates[first]
+
+        origins = cells[movers]
+
+        if grids is not None:
+            counts, leaving, entering_grid = grids
+
+            # Rule 2: number of mowers within each target cell, against number of them leaving it
+            numpy.add.at(leaving, origins, 1)
+            blocked = counts[targets] > leaving[targets]
+            leaving[origins] = 0
+
+            # Mover entering the cell left by each mover (i.e., targeting its origin). -1 if none
+            entering_grid[targets] = numpy.arange(targets.size)
+            entering = entering_grid[origins]
+            entering_grid[targets] = -1
+
+        else:
+            sorted_cells = numpy.sort(cells)
+            sorted_origins = numpy.sort(origins)
+            blocked = numpy.searchsorted(sorted_cells, targets, side="right") - \
+                numpy.searchsorted(sorted_cells, targets, side="left") > \
+                numpy.searchsorted(sorted_origins, targets, side="right") - \
+                numpy.searchsorted(sorted_origins, targets, side="left")
+
+            entering = numpy.minimum(numpy.searchsorted(targets, origins), targets.size - 1)
+            entering = numpy.where(targets[entering] == origins, entering, -1)
+
+        # Rule 3: swaps
+        blocked |= (entering >= 0) & (origins[entering] == targets)
+
+        # Blocked movers stay within their cells, so the movers entering them are blocked too
+        frontier = entering[blocked]
+
+        while frontier.size:
+            frontier = frontier[frontier >= 0]
+            frontier = frontier[~blocked[frontier]]
+            blocked[frontier] = True
+            frontier = entering[frontier]
+
+        moved = ~blocked
+
+        return movers[moved], targets[moved]
@@ -0,0 +1,303 @@
+try:
+    import numpy
+except ImportError:
+    # Optional dependency: without it, mowers are run instruction by instruction (see lawnmower.src.mower.Mower)
+    numpy = None
+
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.program import Program
+
+
+class TrajectorySimulator:
+    """
+        Vectorized trajectory of a single mower running a very long instruction list (e.g., 10^8 instructions), with
+        no other mowers around (i.e., as if mower overlapping were allowed). Requires NumPy (see is_available).
+
+        The orientation after each instruction never depends on the lawn edges, so it is just the cumulative sum of
+        the rotations (-1 for left, +1 for right), modulo 4. The move along each axis of every instruction is then
+        known, and the position along that axis after each instruction is a saturating (i.e., clamped to the lawn)
+        prefix sum of those moves.
+
+        Every instruction is a clamp map x -> min(max(x + a, low), high) (i.e., (a, low, high)), and so is any
+        composition of them:
+
+            (a2, low2, high2) after (a1, low1, high1) = (a1 + a2, clamp(low1 + a2, low2, high2),
+                                                         clamp(high1 + a2, low2, high2))
+
+        Therefore, prefix maps are computed by a blocked parallel scan, and the final state alone by a parallel
+        reduction, without any Python-level loop per instruction. Only the instructions actually moving along each
+        axis are taken into account for it. Instructions are processed in chunks, so that memory usage does not
+        depend on the length of the instruction list.
+    """
+    # Rotation of each opcode (see lawnmower.src.program.Program.opcodes): -1 (left), +1 (right) or 0 (forward)
+    rotations = (-1, 1, 0)
+
+    # Opcode of the forward instruction
+    forward_opcode = Orientation.opcodes["F"]
+
+    # Position modification of a forward instruction, by orientation integer value
+    forward_x, forward_y, _ = zip(*(transition[Orientation.opcodes["F"]] for transition in Orientation.transitions))
+
+    # Number of maps scanned at once within each block (see scan)
+    block_size = 32
+
+    def __init__(self, mower, instruction_list, chunk_size=1 << 20):
+        """
+            Initializes the simulator.
+
+        :param mower: (lawnmower.src.mower.Mower) The mower, properly initialized (i.e., within its lawn).
+        :param instruction_list: (str/bytes) Its plain instruction list (e.g., "LFRF"). Both upper and lower case
+                    allowed.
+        :param chunk_size: (int) Number of instructions processed at once.
+        :return: None
+        """
+        # The mower (lawnmower.src.mower.Mower)
+        self.mower = mower
+
+        # Number of instructions processed at once (int)
+        self.chunk_size = chunk_size
+
+        # Opcodes of the instruction list, one per byte (bytes). None if not valid
+        self.opcodes = Program.get_opcodes(instruction_list)
+
+        if self.opcodes is None:
+            print("ERROR while initializing TrajectorySimulator : Invalid instruction list")
+
+    @staticmethod
+    def is_available():
+        """
+            Tells if the vectorized trajectory can be computed (i.e., NumPy installed).
+
+        :return: (bool) True if available; False otherwise.
+        """
+        return numpy is not None
+
+    def is_properly_initialized(self):
+        """
+            Tells if the simulator can be run (i.e., valid instruction list and mower within its lawn).
+
+        :return: (bool) True if properly initialized; False otherwise.
+        """
+        return self.opcodes is not None and self.mower.is_properly_initialized()
+
+    @staticmethod
+    def compose(first, second):
+        """
+            Composes the specified clamp maps (see class description), either single ones or arrays of them.
+
+        :param first: (tuple) (a, low, high) of the map applied first.
+        :param second: (tuple) (a, low, high) of the map applied second.
+        :return: (tuple) (a, low, high) of the composition.
+        """
+        a1, low1, high1 = first
+        a2, low2, high2 = second
+
+        return a1 + a2, numpy.clip(low1 + a2, low2, high2), numpy.clip(high1 + a2, low2, high2)
+
+    @classmethod
+    def scan(cls, a, low, high):
+        """
+            Computes the inclusive prefix compositions of the specified clamp maps (i.e., the i-th one is the
+            composition of maps 0 to i). The maps are split into blocks, which are scanned all at once in
+            log2(block_size) steps. Then, the prefix of each block is scanned in the same way, recursively.
+
+        :param a: (numpy.ndarray of int) Displacement of each map.
+        :param low: (numpy.ndarray of int) Lower bound of each map.
+        :param high: (numpy.ndarray of int) Upper bound of each map.
+        :return: (tuple) (a, low, high) arrays of the prefix maps.
+        """
+        count = len(a)
+        block_size = cls.block_size
+        block_count = -(-count // block_size)
+
+        # Pad with identity maps (within the bounds) up to whole blocks
+        padding = block_count * block_size - count
+        a = numpy.concatenate((a, numpy.zeros(padding, dtype=a.dtype))).reshape(block_count, block_size)
+        low = numpy.concatenate((low, numpy.full(padding, low[-1], dtype=low.dtype))).reshape(block_count, block_size)
+        high = numpy.concatenate((high, numpy.full(padding, high[-1], dtype=high.dtype))).reshape(block_count,
+                                                                                                  block_size)
+
+        shift = 1
+
+        while shift < block_size:
+            a[:, shift:], low[:, shift:], high[:, shift:] = cls.compose(
+                (a[:, :-shift], low[:, :-shift], high[:, :-shift]), (a[:, shift:], low[:, shift:], high[:, shift:]))
+            shift *= 2
+
+        if block_count > 1:
+            # Prefix of all prior blocks, applied first to each block (but the first one)
+            prefix_a, prefix_low, prefix_high = cls.scan(a[:-1, -1].copy(), low[:-1, -1].copy(), high[:-1, -1].copy())
+            a[1:], low[1:], high[1:] = cls.compose((prefix_a[:, None], prefix_low[:, None], prefix_high[:, None]),
+                                                   (a[1:], low[1:], high[1:]))
+
+        return a.reshape(-1)[:count], low.reshape(-1)[:count], high.reshape(-1)[:count]
+
+    @classmethod
+    def reduce(cls, a, low, high):
+        """
+            Computes the composition of all the specified clamp maps, by composing pairs of them at once until only
+            one is left.
+
+        :param a: (numpy.ndarray of int) Displacement of each map.
+        :param low: (numpy.ndarray of int) Lower bound of each map.
+        :param high: (numpy.ndarray of int) Upper bound of each map.
+        :return: (tuple) (a, low, high) of the composition, as int.
+        """
+        while len(a) > 1:
+            if len(a) % 2:
+                # The last map is left as is
+                last = (a[-1:], low[-1:], high[-1:])
+                a, low, high = cls.compose((a[:-1:2], low[:-1:2], high[:-1:2]), (a[1::2], low[1::2], high[1::2]))
+                a, low, high = (numpy.concatenate(values) for values in zip((a, low, high), last))
+
+            else:
+                a, low, high = cls.compose((a[::2], low[::2], high[::2]), (a[1::2], low[1::2], high[1::2]))
+
+        return int(a[0]), int(low[0]), int(high[0])
+
+    @classmethod
+    def get_positions(cls, start, moves, lower, upper):
+        """
+            Computes the position along an axis after each move, clamped to the specified bounds.
+
+        :param start: (int) Initial position, within the bounds.
+        :param moves: (numpy.ndarray of int) Position modification of each move (-1, 0 or 1).
+        :param lower: (int) Lower bound.
+        :param upper: (int) Upper bound.
+        :return: (numpy.ndarray of int) Position after each move.
+        """
+        moving = moves != 0
+        indexes = numpy.cumsum(moving) - 1
+        moves = moves[moving].astype(numpy.int64)
+
+        if not len(moves):
+            return numpy.full(len(indexes), start, dtype=numpy.int64)
+
+        a, low, high = cls.scan(moves, numpy.full(len(moves), lower), numpy.full(len(moves), upper))
+        positions = numpy.clip(a + start, low, high)
+
+        # Not moving keeps the prior position
+        return numpy.where(indexes >= 0, positions[indexes], start)
+
+    @classmethod
+    def get_final_position(cls, start, moves, lower, upper):
+        """
+            Computes only the position along an axis after all moves (see get_positions).
+
+        :return: (int) Final position.
+        """
+        moves = moves[moves != 0].astype(numpy.int64)
+
+        if not len(moves):
+            return start
+
+        a, low, high = cls.reduce(moves, numpy.full(len(moves), lower), numpy.full(len(moves), upper))
+
+        return min(max(start + a, low), high)
+
+    def iter_chunks(self):
+        """
+            Splits the instruction list into chunks, getting the orientation and the moves along each axis.
+
+        :return: (generator of tuples) (<orientation>, <dx>, <dy>) of each chunk, with:
+                        <orientation> : (numpy.ndarray of int) Orientation integer value after each instruction.
+                        <dx> : (numpy.ndarray of int) Position modification in the X axis of each instruction.
+                        <dy> : (numpy.ndarray of int) Position modification in the Y axis of each instruction.
+        """
+        # Orientations wrap around modulo 256 (i.e., a multiple of 4)
+        rotations = numpy.array(self.rotations, dtype=numpy.int8)
+        forward_x = numpy.array(self.forward_x, dtype=numpy.int8)
+        forward_y = numpy.array(self.forward_y, dtype=numpy.int8)
+        orientation = self.mower.orientation.orientation
+
+        for start in range(0, len(self.opcodes), self.chunk_size):
+            opcodes = numpy.frombuffer(self.opcodes, dtype=numpy.uint8, count=min(self.chunk_size,
+                                                                                  len(self.opcodes) - start),
+                                       offset=start)
+            orientations = numpy.cumsum(rotations[opcodes], dtype=numpy.int8)
+            orientations += numpy.int8(orientation)
+            orientations &= 3
+            orientation = int(orientations[-1])
+
+            forward = opcodes == self.forward_opcode
+
+            yield orientations, forward_x[orientations] * forward, forward_y[orientations] * forward
+
+    def iter_states(self):
+        """
+            Computes the state of the mower after each instruction, chunk by chunk. The mower itself is not modified.
+
+        :return: (generator of tuples) (<x>, <y>, <orientation>) of each chunk, with:
+                        <x> : (numpy.ndarray of int) Coordinate X of the position after each instruction.
+                        <y> : (numpy.ndarray of int) Coordinate Y of the position after each instruction.
+                        <orientation> : (numpy.ndarray of int) Orientation integer value after each instruction.
+        """
+        if not self.is_properly_initialized():
+            return
+
+        lawn = self.mower.lawn
+        x = self.mower.x
+        y = self.mower.y
+
+        for orientations, dx, dy in self.iter_chunks():
+            chunk_x = self.get_positions(x, dx, lawn.x_min, lawn.x_max)
+            chunk_y = self.get_positions(y, dy, lawn.y_min, lawn.y_max)
+
+            x = int(chunk_x[-1])
+            y = int(chunk_y[-1])
+
+            yield chunk_x, chunk_y, orientations
+
+    def get_states(self):
+        """
+            Computes the state of the mower after each instruction (see iter_states), all at once.
+
+        :return: (tuple) (<x>, <y>, <orientation>) arrays (see iter_states). None if not properly initialized.
+        """
+        if not self.is_properly_initialized():
+            return None
+
+        chunks = list(self.iter_states())
+
+        if not chunks:
+            return numpy.array([], dtype=numpy.int64), numpy.array([], dtype=numpy.int64), \
+                numpy.array([], dtype=numpy.int64)
+
+        return tuple(numpy.concatenate(values) for values in zip(*chunks))
+
+    def get_final_state(self):
+        """
+            Computes only the final state of the mower, without any intermediate one. The mower itself is not modified.
+
+        :return: (tuple) (x, y, orientation) after running all its instructions. None if not properly initialized.
+        """
+        if not self.is_properly_initialized():
+            return None
+
+        lawn = self.mower.lawn
+        x = self.mower.x
+        y = self.mower.y
+        orientation = self.mower.orientation.orientation
+
+        for orientations, dx, dy in self.iter_chunks():
+            x = self.get_final_position(x, dx, lawn.x_min, lawn.x_max)
+            y = self.get_final_position(y, dy, lawn.y_min, lawn.y_max)
+
+            orientation = int(orientations[-1])
+
+        return x, y, orientation
+
+    def run(self):
+        """
+            Moves the mower to its final state (see get_final_state).
+
+        :return: (bool) True if successfully run; False otherwise.
+        """
+        state = self.get_final_state()
+
+        if state is None:
+            return False
+
+        self.mower.x, self.mower.y, self.mower.orientation.orientation = state
+
+        return True
@@ -0,0 +1,331 @@
+import os
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+import lawnmower.src.program
+
+
+class TransferFunction:
+    """
+        Effect of an instruction list (or a chunk of it) on the state (x, y, orientation) of a mower, over the whole
+        lawn, when mower overlapping is allowed (i.e., no other mower can block it).
+
+        For a given initial orientation, the moves along each axis are fixed, and the position along each axis after
+        them is a clamp map x -> min(max(x + a, l), h) of the initial one (i.e., (a, l, h), see
+        lawnmower.src.trajectory.TrajectorySimulator), relative to the lawn origin. Therefore, the function from every
+        initial state to its final state is just the net rotation plus two clamp maps per initial orientation, no
+        matter how long the instruction list is nor how big the lawn is.
+
+        Transfer functions of consecutive chunks of an instruction list are composed into the transfer function of the
+        whole instruction list. Hence, the chunks of a huge instruction list can be analysed in parallel (see
+        ParallelCompiler).
+    """
+    def __init__(self, rotation, maps):
+        """
+            Initializes the transfer function.
+
+        :param rotation: (int) Net number of 90 degrees right rotations (0 to 3).
+        :param maps: (list of tuples) (<x_map>, <y_map>) by initial orientation integer value, with:
+                        <x_map> : (tuple) (a, l, h) clamp map of the coordinate X, relative to the lawn origin.
+                        <y_map> : (tuple) (a, l, h) clamp map of the coordinate Y, relative to the lawn origin.
+        :return: None
+        """
+        # Net number of 90 degrees right rotations (int)
+        self.rotation = rotation
+
+        # Clamp maps of the coordinates X and Y by initial orientation integer value (list of tuples)
+        self.maps = maps
+
+    @staticmethod
+    def compose_maps(first, second):
+        """
+            Composes the specified clamp maps.
+
+        :param first: (tuple) (a, l, h) of the map applied first.
+        :param second: (tuple) (a, l, h) of the map applied second.
+        :return: (tuple) (a, l, h) of the composition.
+        """
+        a1, l1, h1 = first
+        a2, l2, h2 = second
+
+        return a1 + a2, min(max(l1 + a2, l2), h2), min(max(h1 + a2, l2), h2)
+
+    @classmethod
+    def compile(cls, instruction_list, width, height):
+        """
+            Gets the transfer function of the specified plain instruction list.
+
+        :param instruction_list: (str/bytes) Instructions (e.g., "LFRF"). Both upper and lower case allowed.
+        :param width: (int) Width of the lawn, minus one (i.e., x_max - x_min).
+        :param height: (int) Height of the lawn, minus one (i.e., y_max - y_min).
+        :return: (lawnmower.src.transfer.TransferFunction) Its transfer function. None if any instruction is not valid.
+        """
+        program = lawnmower.src.program.Program
+        opcodes = program.get_opcodes(instruction_list)
+
+        if opcodes is None:
+            return None
+
+        # Clamp maps, starting North, of the moves along the X axis (u) and the Y axis (v), bounded by both the width
+        #   and the height (i.e., the very same moves end up along the other axis for initial orientations East and
+        #   West)
+        if len(opcodes) - opcodes.count(program.forward_opcode) <= program.max_rotation_ratio * len(opcodes):
+            # Mostly long runs of forward instructions
+            orientation, u_width, u_height, v_width, v_height = cls.get_maps_from_moves(
+                program.get_moves_from_opcodes(opcodes), width, height)
+
+        else:
+            orientation, u_width, u_height, v_width, v_height = cls.get_maps_from_opcodes(opcodes, width, height)
+
+        # Each 90 degrees right rotation of the initial orientation turns (u, v) moves into (v, -u). Negated moves
+        #   within [0, w] are the reflection of the original ones: x -> w - f(w - x)
+        maps = [(u_width, v_height),
+                (v_width, cls.negate_map(u_height, height)),
+                (cls.negate_map(u_width, width), cls.negate_map(v_height, height)),
+                (cls.negate_map(v_width, width), u_height)]
+
+        return cls(orientation, maps)
+
+    @classmethod
+    def get_maps_from_moves(cls, moves, width, height):
+        """
+            Gets the clamp maps of the specified moves, starting North (see compile).
+
+        :param moves: (list of tuples) (<rotation>, <forward_count>) of each move (see
+                    lawnmower.src.program.Program.moves).
+        :param width: (int) Width of the lawn, minus one.
+        :param height: (int) Height of the lawn, minus one.
+        :return: (tuple) (<rotation>, <u_width>, <u_height>, <v_width>, <v_height>) net rotation and clamp maps of
+                    the moves along the X axis (u) and the Y axis (v), bounded by the width and by the height.
+        """
+        forward_x = lawnmower.src.program.Program.forward_x
+        forward_y = lawnmower.src.program.Program.forward_y
+        u_width = v_width = (0, 0, width)
+        u_height = v_height = (0, 0, height)
+        orientation = 0
+
+        for rotation, count in moves:
+            orientation = (orientation + rotation) & 3
+
+            if count:
+                dx = forward_x[orientation] * count
+                dy = forward_y[orientation] * count
+
+                if dx:
+                    u_width = cls.compose_maps(u_width, (dx, 0, width))
+                    u_height = cls.compose_maps(u_height, (dx, 0, height))
+
+                else:
+                    v_width = cls.compose_maps(v_width, (dy, 0, width))
+                    v_height = cls.compose_maps(v_height, (dy, 0, height))
+
+        return orientation, u_width, u_height, v_width, v_height
+
+    @staticmethod
+    def get_maps_from_opcodes(opcodes, width, height):
+        """
+            Gets the clamp maps of the specified opcodes, one by one, starting North (see get_maps_from_moves).
+
+            Each clamp map (a, l, h) within [0, bound] is tracked as its displacement (a) and the positions reached
+            from both bounds (l from 0, h from bound), so that every forward instruction is just a few increments.
+        """
+        forward_opcode = lawnmower.src.program.Program.forward_opcode
+        rotate_left_opcode = lawnmower.src.program.Program.rotate_left_opcode
+        u = u_width_low = u_height_low = v = v_width_low = v_height_low = 0
+        u_width_high = v_width_high = width
+        u_height_high = v_height_high = height
+        orientation = 0
+
+        for opcode in opcodes:
+            if opcode == forward_opcode:
+                if orientation == 0:
+                    # North
+                    v += 1
+
+                    if v_width_low < width:
+                        v_width_low += 1
+
+                    if v_width_high < width:
+                        v_width_high += 1
+
+                    if v_height_low < height:
+                        v_height_low += 1
+
+                    if v_height_high < height:
+                        v_height_high += 1
+
+                elif orientation == 1:
+                    # East
+                    u += 1
+
+                    if u_width_low < width:
+                        u_width_low += 1
+
+                    if u_width_high < width:
+                        u_width_high += 1
+
+                    if u_height_low < height:
+                        u_height_low += 1
+
+                    if u_height_high < height:
+                        u_height_high += 1
+
+                elif orientation == 2:
+                    # South
+                    v -= 1
+
+                    if v_width_low:
+                        v_width_low -= 1
+
+                    if v_width_high:
+                        v_width_high -= 1
+
+                    if v_height_low:
+                        v_height_low -= 1
+
+                    if v_height_high:
+                        v_height_high -= 1
+
+                else:
+                    # West
+                    u -= 1
+
+                    if u_width_low:
+                        u_width_low -= 1
+
+                    if u_width_high:
+                        u_width_high -= 1
+
+                    if u_height_low:
+                        u_height_low -= 1
+
+                    if u_height_high:
+                        u_height_high -= 1
+
+            elif opcode == rotate_left_opcode:
+                orientation = (orientation - 1) & 3
+
+            else:
+                orientation = (orientation + 1) & 3
+
+        return orientation, (u, u_width_low, u_width_high), (u, u_height_low, u_height_high), \
+            (v, v_width_low, v_width_high), (v, v_height_low, v_height_high)
+
+    @staticmethod
+    def negate_map(clamp_map, bound):
+        """
+            Gets the clamp map of the very same moves, but in the opposite direction, within [0, bound].
+
+        :param clamp_map: (tuple) (a, l, h) of the original moves.
+        :param bound: (int) Upper bound (the lower one is 0).
+        :return: (tuple) (a, l, h) of the opposite moves.
+        """
+        a, l, h = clamp_map
+
+        return -a, bound - h, bound - l
+
+    def then(self, other):
+        """
+            Composes this transfer function with the specified one (i.e., the instructions of other run after these
+            ones).
+
+        :param other: (lawnmower.src.transfer.TransferFunction) Transfer function applied second.
+        :return: (lawnmower.src.transfer.TransferFunction) The composition.
+        """
+        maps = []
+
+        for orientation, (x_map, y_map) in enumerate(self.maps):
+            other_x_map, other_y_map = other.maps[(orientation + self.rotation) & 3]
+            maps.append((self.compose_maps(x_map, other_x_map), self.compose_maps(y_map, other_y_map)))
+
+        return TransferFunction((self.rotation + other.rotation) & 3, maps)
+
+    def power(self, count):
+        """
+            Composes this transfer function with itself (i.e., the same instructions run several times in a row), by
+            repeated squaring, so that only log2(count) compositions are needed.
+
+        :param count: (int) Number of times the instructions are run. It MUST be, at least, 1.
+        :return: (lawnmower.src.transfer.TransferFunction) The composition.
+        """
+        result = None
+        square = self
+
+        while True:
+            if count & 1:
+                result = square if result is None else result.then(square)
+
+            count >>= 1
+
+            if not count:
+                return result
+
+            square = square.then(square)
+
+    def apply(self, x, y, orientation, lawn):
+        """
+            Gets the final state from the specified initial one.
+
+        :param x: (int) Coordinate X of the initial position. It MUST be within the lawn.
+        :param y: (int) Coordinate Y of the initial position. It MUST be within the lawn.
+        :param orientation: (int) Initial orientation integer value (see lawnmower.src.orientation.Orientation).
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn the transfer function was compiled for.
+        :return: (tuple) (x, y, orientation) final state.
+        """
+        (a, l, h), (b, m, k) = self.maps[orientation]
+
+        return lawn.x_min + min(max(x - lawn.x_min + a, l), h), lawn.y_min + min(max(y - lawn.y_min + b, m), k), \
+            (orientation + self.rotation) & 3
+
+
+class ParallelCompiler:
+    """
+        Gets the transfer function (see TransferFunction) of a huge instruction list using several processes: the
+        instruction list is split into chunks, whose transfer functions are computed in parallel and then composed in
+        order.
+    """
+    def __init__(self, processes=None, chunk_size=1 << 22):
+        """
+            Initializes the compiler.
+
+        :param processes: (int) Number of processes to use. If not specified, as many as CPUs.
+        :param chunk_size: (int) Number of instructions of each chunk.
+        :return: None
+        """
+        # Number of processes to use (int)
+        self.processes = processes or os.cpu_count() or 1
+
+        # Number of instructions of each chunk (int)
+        self.chunk_size = chunk_size
+
+    def compile(self, instruction_list, lawn):
+        """
+            Gets the transfer function of the specified instruction list.
+
+        :param instruction_list: (str/bytes) Plain instructions (e.g., "LFRF"). Both upper and lower case allowed.
+        :param lawn: (lawnmower.src.lawn.Lawn) The lawn on which it is run.
+        :return: (lawnmower.src.transfer.TransferFunction) Its transfer function. None if any instruction is not valid.
+        """
+        compile_chunk = functools.partial(TransferFunction.compile, width=lawn.x_max - lawn.x_min,
+                                          height=lawn.y_max - lawn.y_min)
+        starts = range(0, len(instruction_list), self.chunk_size)
+
+        if self.processes <= 1 or len(starts) <= 1:
+            return compile_chunk(instruction_list)
+
+        result = TransferFunction.compile("", width=lawn.x_max - lawn.x_min, height=lawn.y_max - lawn.y_min)
+
+        with ProcessPoolExecutor(max_workers=min(self.processes, len(starts))) as executor:
+            # Only a few chunks per process at once, so that the instruction list is not copied all at once
+            for window in range(0, len(starts), 2 * self.processes):
+                chunks = (instruction_list[start:start + self.chunk_size]
+                          for start in starts[window:window + 2 * self.processes])
+
+                for transfer_function in executor.map(compile_chunk, chunks):
+                    if transfer_function is None:
+                        # Any invalid instruction
+                        return None
+
+                    result = result.then(transfer_function)
+
+        return result
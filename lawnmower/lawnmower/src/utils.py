@@ -11,3 +11,18 @@ def get_bool_from_str(input_str):
         result = True
 
     return result
+
+
+def get_int_from_str(input_str, default=None):
+    """
+        Translates the input string into an integer variable, returning its value.
+
+    :param input_str: (str) The string to convert to integer.
+    :param default: (int) Value to return if the string is not a valid integer.
+    :return: (int) The translation of the string to integer value.
+    """
+    try:
+        return int(input_str)
+
+    except (ValueError, TypeError):
+        return default
@@ -0,0 +1,112 @@
+import shutil
+import tempfile
+from os.path import join
+from unittest import TestCase
+
+from lawnmower.src.batch import BatchRunner
+from lawnmower.tests.testutils import captured_output, get_fixtures_path
+
+
+class TestBatchRunner(TestCase):
+
+    def setUp(self):
+        self.fixture_path = join(get_fixtures_path(), "config_file")
+        self.temporary_folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def write_file(self, filename, lines):
+        filepath = join(self.temporary_folder.name, filename)
+
+        with open(filepath, "w") as f:
+            f.writelines(lines)
+
+        return filepath
+
+    def test__given_folder__when_get_filepaths__then_all_files_sorted(self):
+
+        # Given
+        filepaths = [self.write_file(filename, ["5 5\n"]) for filename in ["b.txt", "a.txt", "c.dat"]]
+
+        # When
+        result = BatchRunner.get_filepaths(self.temporary_folder.name)
+
+        # Then
+        self.assertListEqual(result, sorted(filepaths))
+
+    def test__given_glob_pattern__when_get_filepaths__then_matching_files_sorted(self):
+
+        # Given
+        filepaths = [self.write_file(filename, ["5 5\n"]) for filename in ["b.txt", "a.txt", "c.dat"]]
+
+        # When
+        result = BatchRunner.get_filepaths(join(self.temporary_folder.name, "*.txt"))
+
+        # Then
+        self.assertListEqual(result, sorted(filepaths[:2]))
+
+    def test__given_valid_config_file__when_run_scenario__then_success_and_final_positions(self):
+
+        # Given
+        filepath = join(self.fixture_path, "single_mower_info_file.txt")
+
+        # When
+        success, output = BatchRunner().run_scenario(filepath)
+
+        # Then
+        self.assertTrue(success)
+        self.assertEqual(output, "1 3 N\n\n")
+
+    def test__given_invalid_config_file__when_run_scenario__then_failure_and_error(self):
+
+        # Given
+        filepath = join(self.fixture_path, "only_first_line_file.txt")
+
+        # When
+        success, output = BatchRunner().run_scenario(filepath)
+
+        # Then
+        self.assertFalse(success)
+        self.assertIn("ERROR", output)
+
+    def test__given_no_matching_files__when_run__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # When
+            result = BatchRunner().run(join(self.temporary_folder.name, "*.txt"))
+
+            # Then
+            self.assertFalse(result)
+            self.assertIn("ERROR while running batch", out.getvalue())
+
+    def test__given_folder_with_failing_scenario__when_run__then_all_scenarios_in_order(self):
+
+        for processes in [1, 2]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepaths = []
+
+                for index, fixture in enumerate(["single_mower_info_file.txt", "empty_file.txt",
+                                                 "single_mower_info_file.txt"]):
+                    filepath = join(self.temporary_folder.name, "{}.txt".format(index))
+                    shutil.copyfile(join(self.fixture_path, fixture), filepath)
+                    filepaths.append(filepath)
+
+                batch_runner = BatchRunner(processes=processes)
+
+                # When
+                result = batch_runner.run(self.temporary_folder.name)
+
+                # Then
+                self.assertFalse(result)
+                self.assertEqual(batch_runner.scenario_count, 3)
+                self.assertListEqual(batch_runner.failed, [filepaths[1]])
+
+                output = out.getvalue()
+                positions = [output.index(BatchRunner.block_header.format(filepath)) for filepath in filepaths]
+                self.assertListEqual(positions, sorted(positions))
+                self.assertEqual(output.count("1 3 N\n"), 2)
+                self.assertIn("3 scenarios : 2 OK, 1 FAILED", output)
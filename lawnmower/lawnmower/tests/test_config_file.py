@@ -1,8 +1,15 @@
 from unittest import TestCase
 from unittest.mock import patch
+import os
+import bz2
+import gzip
+import lzma
+import tempfile
 from os.path import join
 
 from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.mower_table import MowerTable
+from lawnmower.src.scenario_file import BinaryScenarioFile
 from lawnmower.tests.testutils import captured_output, get_fixtures_path
 
 
@@ -249,3 +256,388 @@ class TestConfigFile(TestCase):
             self.assertEqual(len(self.config_file.mowers), 2)
             self.assertDictEqual(self.config_file.mowers[0], expected_mower_1_info)
             self.assertDictEqual(self.config_file.mowers[1], expected_mower_2_info)
+
+    def test__given_missing_file__when_iter_mowers__then_return_none(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "missing_file.txt")
+
+            # When
+            result = self.config_file.iter_mowers(filepath)
+
+            # Then
+            self.assertIsNone(result)
+            self.assertIsNone(self.config_file.lawn_x_max)
+            self.assertIsNone(self.config_file.lawn_y_max)
+
+    def test__given_incomplete_first_line__when_iter_mowers__then_return_none(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "only_x_max_file.txt")
+
+            # When
+            result = self.config_file.iter_mowers(filepath)
+
+            # Then
+            self.assertIsNone(result)
+            self.assertIsNone(self.config_file.lawn_x_max)
+            self.assertIsNone(self.config_file.lawn_y_max)
+
+    def test__given_multi_mower_info_second_mower_position_error__when_iter_mowers__then_stop_at_error(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "multi_mower_info_error_in_second_mower_position_file.txt")
+
+            # When
+            result = list(self.config_file.iter_mowers(filepath))
+
+            # Then
+            expected_mower_info = {
+                "initial_position": ("1", "2"),
+                "initial_orientation": "N",
+                "instruction_list": "LFLFLFLFF"
+            }
+            self.assertEqual(self.config_file.lawn_x_max, '5')
+            self.assertEqual(self.config_file.lawn_y_max, '6')
+            self.assertListEqual(result, [expected_mower_info])
+            self.assertFalse(self.config_file.stream_ok)
+            self.assertIn("Invalid format in line 4", out.getvalue())
+
+            # Check that the mowers were NOT stored
+            self.assertListEqual(self.config_file.mowers, [])
+
+    def test__given_multi_mower_info__when_iter_mowers__then_same_mowers_as_load(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "multi_mower_info_error_in_second_mower_instructions_file.txt")
+            loaded_config_file = ConfigFile()
+            loaded_config_file.load(filepath)
+
+            # When
+            mowers = self.config_file.iter_mowers(filepath)
+
+            # Then
+            self.assertEqual(self.config_file.lawn_x_max, '5')
+            self.assertEqual(self.config_file.lawn_y_max, '6')
+            self.assertListEqual(list(mowers), loaded_config_file.mowers)
+            self.assertTrue(self.config_file.stream_ok)
+            self.assertListEqual(self.config_file.mowers, [])
+
+    def test__given_missing_file__when_load_mmap__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "missing_file.txt")
+
+            # When
+            result = self.config_file.load_mmap(filepath)
+
+            # Then
+            self.assertFalse(result)
+
+            # Check that it was NOT updated
+            self.assertIsNone(self.config_file.lawn_x_max)
+            self.assertIsNone(self.config_file.lawn_y_max)
+            self.assertListEqual(self.config_file.mowers, [])
+
+    def test__given_every_fixture__when_load_mmap__then_same_result_and_errors_as_load(self):
+
+        for filename in sorted(os.listdir(self.fixture_path)):
+            filepath = join(self.fixture_path, filename)
+
+            # Given
+            with captured_output() as (expected_out, err):
+                expected_config_file = ConfigFile()
+                expected_result = expected_config_file.load(filepath)
+
+            # When
+            with captured_output() as (out, err):
+                config_file = ConfigFile()
+                result = config_file.load_mmap(filepath)
+
+            # Then
+            self.assertEqual(result, expected_result, filename)
+            self.assertEqual(out.getvalue(), expected_out.getvalue(), filename)
+            self.assertEqual(config_file.lawn_x_max, expected_config_file.lawn_x_max, filename)
+            self.assertEqual(config_file.lawn_y_max, expected_config_file.lawn_y_max, filename)
+            self.assertListEqual(config_file.mowers, expected_config_file.mowers, filename)
+
+    def test__given_compact_and_multi_mower_info__when_load__then_mower_table_with_same_info(self):
+
+        for load_method_name in ["load", "load_mmap"]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepath = join(self.fixture_path, "multi_mower_info_error_in_second_mower_instructions_file.txt")
+                self.config_file = ConfigFile(compact=True)
+
+                # When
+                result = getattr(self.config_file, load_method_name)(filepath)
+
+                # Then
+                self.assertTrue(result)
+                self.assertIsInstance(self.config_file.mowers, MowerTable)
+                self.assertEqual(self.config_file.lawn_x_max, '5')
+                self.assertEqual(self.config_file.lawn_y_max, '6')
+                self.assertListEqual(list(self.config_file.mowers), [
+                    {"initial_position": (1, 2), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"},
+                    {"initial_position": (3, 3), "initial_orientation": "E", "instruction_list": "LFLFL 2 3 E RRFFFLLR"}
+                ])
+
+    def test__given_compact_and_non_integer_coordinates__when_load__then_return_false(self):
+
+        for load_method_name in ["load", "load_mmap"]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepath = join(self.fixture_path, "non_integer_coordinates_file.txt")
+                self.config_file = ConfigFile(compact=True)
+
+                # When
+                result = getattr(self.config_file, load_method_name)(filepath)
+
+                # Then
+                self.assertFalse(result)
+                self.assertIn("Invalid format in line 4", out.getvalue())
+
+                # Check that it was NOT updated
+                self.assertIsNone(self.config_file.lawn_x_max)
+                self.assertIsNone(self.config_file.lawn_y_max)
+                self.assertListEqual(self.config_file.mowers, [])
+
+    def test__given_compact_and_coordinates_too_big__when_load__then_return_false(self):
+
+        for load_method_name in ["load", "load_mmap"]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepath = join(self.fixture_path, "huge_coordinates_file.txt")
+                self.config_file = ConfigFile(compact=True)
+
+                # When
+                result = getattr(self.config_file, load_method_name)(filepath)
+
+                # Then
+                self.assertFalse(result)
+                self.assertIn("Invalid format in line 4", out.getvalue())
+                self.assertNotIn("Unexpected ERROR", out.getvalue())
+
+                # Check that it was NOT updated
+                self.assertIsNone(self.config_file.lawn_x_max)
+                self.assertIsNone(self.config_file.lawn_y_max)
+                self.assertListEqual(self.config_file.mowers, [])
+
+    def test__given_compressed_files__when_load__then_same_result_as_uncompressed(self):
+
+        for compression_module in [gzip, bz2, lzma]:
+            for filename in ["single_mower_info_file.txt", "multi_mower_info_error_in_second_mower_position_file.txt"]:
+                with tempfile.TemporaryDirectory() as folder, captured_output() as (out, err):
+
+                    # Given
+                    uncompressed_filepath = join(self.fixture_path, filename)
+                    filepath = join(folder, filename + ".compressed")
+
+                    with open(uncompressed_filepath, "rb") as f, compression_module.open(filepath, "wb") as g:
+                        g.write(f.read())
+
+                    expected_config_file = ConfigFile()
+                    expected_result = expected_config_file.load(uncompressed_filepath)
+
+                    for load_method_name in ["load", "load_mmap"]:
+
+                        # When
+                        config_file = ConfigFile()
+                        result = getattr(config_file, load_method_name)(filepath)
+
+                        # Then
+                        self.assertIs(ConfigFile.get_compression(filepath), compression_module)
+                        self.assertEqual(result, expected_result)
+                        self.assertEqual(config_file.lawn_x_max, expected_config_file.lawn_x_max)
+                        self.assertEqual(config_file.lawn_y_max, expected_config_file.lawn_y_max)
+                        self.assertListEqual(config_file.mowers, expected_config_file.mowers)
+
+                    # When
+                    config_file = ConfigFile()
+                    mowers = list(config_file.iter_mowers(filepath))
+
+                    # Then
+                    self.assertEqual(config_file.stream_ok, expected_result)
+                    self.assertListEqual(mowers, list(ConfigFile().iter_mowers(uncompressed_filepath)))
+
+    def test__given_uncompressed_file__when_get_compression__then_none(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "single_mower_info_file.txt")
+
+            # When
+            result = ConfigFile.get_compression(filepath)
+
+            # Then
+            self.assertIsNone(result)
+
+    def test__given_stdin_filepath__when_iter_mowers__then_mowers_read_from_stdin(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "multi_mower_info_error_in_second_mower_instructions_file.txt")
+            loaded_config_file = ConfigFile()
+            loaded_config_file.load(filepath)
+
+            with open(filepath) as stdin, patch("sys.stdin", stdin):
+
+                # When
+                mowers = list(self.config_file.iter_mowers(ConfigFile.stdin_filepath))
+
+                # Then
+                self.assertFalse(stdin.closed)
+
+            self.assertEqual(self.config_file.lawn_x_max, '5')
+            self.assertEqual(self.config_file.lawn_y_max, '6')
+            self.assertListEqual(mowers, loaded_config_file.mowers)
+            self.assertTrue(self.config_file.stream_ok)
+
+    def test__given_compressed_stdin__when_iter_mowers__then_decompressed_while_read(self):
+
+        for compression_module in [gzip, bz2, lzma]:
+            with tempfile.TemporaryDirectory() as folder, captured_output() as (out, err):
+
+                # Given
+                filename = "multi_mower_info_error_in_second_mower_instructions_file.txt"
+                uncompressed_filepath = join(self.fixture_path, filename)
+                filepath = join(folder, filename + ".compressed")
+
+                with open(uncompressed_filepath, "rb") as f, compression_module.open(filepath, "wb") as g:
+                    g.write(f.read())
+
+                config_file = ConfigFile()
+
+                with open(filepath, "rb") as stdin, patch("sys.stdin", stdin):
+
+                    # When
+                    mowers = list(config_file.iter_mowers(ConfigFile.stdin_filepath))
+
+                # Then
+                self.assertListEqual(mowers, list(ConfigFile().iter_mowers(uncompressed_filepath)))
+                self.assertTrue(config_file.stream_ok)
+
+    def test__given_binary_scenario_stdin__when_iter_mowers__then_invalid_format(self):
+
+        with tempfile.TemporaryDirectory() as folder, captured_output() as (out, err):
+
+            # Given
+            filepath = join(folder, "scenario.lmwb")
+            mowers_info = [{"initial_position": ("1", "2"), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"},
+                           {"initial_position": ("3", "3"), "initial_orientation": "E",
+                            "instruction_list": "FFRFFRFRRF"}]
+            self.assertTrue(BinaryScenarioFile.save("5", "5", mowers_info, filepath))
+
+            with open(filepath, "rb") as stdin, patch("sys.stdin", stdin):
+
+                # When
+                result = self.config_file.iter_mowers(ConfigFile.stdin_filepath)
+                mowers = [] if result is None else list(result)
+
+            # Then
+            self.assertListEqual(mowers, [])
+            self.assertFalse(self.config_file.stream_ok)
+            self.assertIn("Invalid format", out.getvalue())
+            self.assertNotIn("Unexpected ERROR", out.getvalue())
+
+    def test__given_run_length_encoded_file__when_load__then_instruction_lists_not_expanded(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "run_length_encoded_file.txt")
+
+            # When
+            result = self.config_file.load(filepath)
+
+            # Then
+            self.assertTrue(result)
+            self.assertListEqual([mower_info["instruction_list"] for mower_info in self.config_file.mowers],
+                                 ["LFLFLFLF2", "F2 R F2 R F R2 F"])
+
+    def test__given_program_tree_file__when_load__then_program_trees_not_expanded(self):
+
+        for load_method_name in ["load", "load_mmap"]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepath = join(self.fixture_path, "program_tree_file.txt")
+                self.config_file = ConfigFile()
+
+                # When
+                result = getattr(self.config_file, load_method_name)(filepath)
+
+                # Then
+                self.assertTrue(result)
+                self.assertListEqual(sorted(self.config_file.macros), ["PATROL", "SQUARE"])
+                self.assertListEqual([str(mower_info["instruction_list"]) for mower_info in self.config_file.mowers],
+                                     ["L((FFRFF)*4)*100000", "(FR)*3F"])
+                self.assertEqual(len(self.config_file.mowers[0]["instruction_list"]), 1 + 20 * 100000)
+                self.assertIs(self.config_file.mowers[0]["instruction_list"].items[1],
+                              self.config_file.macros["PATROL"])
+
+    def test__given_program_tree_file__when_iter_mowers__then_same_mowers_and_macros_as_load(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "program_tree_file.txt")
+            self.config_file.load(filepath)
+            config_file = ConfigFile()
+
+            # When
+            result = list(config_file.iter_mowers(filepath))
+
+            # Then
+            self.assertTrue(config_file.stream_ok)
+            self.assertListEqual(result, self.config_file.mowers)
+            self.assertDictEqual(config_file.macros, self.config_file.macros)
+
+    def test__given_undefined_macro__when_load__then_return_false(self):
+
+        for load_method_name in ["load", "load_mmap"]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepath = join(self.fixture_path, "undefined_macro_file.txt")
+                self.config_file = ConfigFile()
+
+                # When
+                result = getattr(self.config_file, load_method_name)(filepath)
+
+                # Then
+                self.assertFalse(result)
+                self.assertIn("Invalid format in line 6", out.getvalue())
+                self.assertDictEqual(self.config_file.macros, {})
+                self.assertListEqual(self.config_file.mowers, [])
+
+    def test__given_compact_and_program_tree_file__when_load__then_return_false(self):
+
+        for load_method_name in ["load", "load_mmap"]:
+            with captured_output() as (out, err):
+
+                # Given
+                filepath = join(self.fixture_path, "program_tree_file.txt")
+                self.config_file = ConfigFile(compact=True)
+
+                # When
+                result = getattr(self.config_file, load_method_name)(filepath)
+
+                # Then
+                self.assertFalse(result)
+                self.assertIn("Invalid format in line 4", out.getvalue())
@@ -0,0 +1,141 @@
+import os
+import gzip
+import tempfile
+from os.path import join
+from unittest import TestCase
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.config_file_validator import ConfigFileValidator
+from lawnmower.tests.testutils import captured_output, get_fixtures_path
+
+
+class TestConfigFileValidator(TestCase):
+
+    def setUp(self):
+        self.validator = ConfigFileValidator(processes=2)
+        self.fixture_path = join(get_fixtures_path(), "config_file")
+        self.temporary_folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def write_file(self, lines):
+        filepath = join(self.temporary_folder.name, "input.txt")
+
+        with open(filepath, "w") as f:
+            f.writelines(lines)
+
+        return filepath
+
+    def test__given_missing_file__when_validate__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "missing_file.txt")
+
+            # When
+            result = self.validator.validate(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertEqual(len(self.validator.errors), 1)
+            self.assertIn("File not found", self.validator.errors[0][1])
+
+    def test__given_every_fixture__when_validate__then_same_validity_and_first_error_as_load(self):
+
+        for filename in sorted(os.listdir(self.fixture_path)):
+            filepath = join(self.fixture_path, filename)
+
+            # Given
+            with captured_output() as (expected_out, err):
+                expected_result = ConfigFile().load(filepath)
+
+            # When
+            with captured_output() as (out, err):
+                result = self.validator.validate(filepath)
+
+            # Then
+            self.assertEqual(result, expected_result, filename)
+
+            if not expected_result:
+                self.assertEqual(self.validator.errors[0][1], expected_out.getvalue().splitlines()[0], filename)
+
+    def test__given_several_errors__when_validate__then_all_of_them_reported(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = self.write_file(["5 5\n",
+                                        "1 2 N\n", "LFLFLFLFF\n",
+                                        "1 2\n", "LFLFLFLFF\n",             # Invalid position (line 4)
+                                        "3 3 E\n", "\n",                    # Missing instructions (line 7)
+                                        "3 3 E\n", "FFRFFRFRRF\n",
+                                        "\n",                               # End of mowers info
+                                        "1\n", "\n"])                       # Ignored
+
+            # When
+            result = self.validator.validate(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertEqual(self.validator.mower_count, 4)
+            self.assertListEqual(self.validator.errors, [
+                (4, ConfigFile.invalid_format_error.format(filepath, 4)),
+                (7, ConfigFile.missing_instructions_error.format(filepath, 3, 7))])
+
+    def test__given_huge_file_split_into_chunks__when_validate__then_global_line_numbers(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lines = ["50 50\n"]
+            expected_errors = []
+
+            for index in range(2000):
+                line_number = len(lines) + 1
+
+                if index % 97 == 13:
+                    lines += ["1 N\n", "FFRFF\n"]
+                    expected_errors.append((line_number, ConfigFile.invalid_format_error.format("{}",
+                                                                                                line_number)))
+
+                elif index % 89 == 5:
+                    lines += ["2 3 S\n", "\n"]
+                    expected_errors.append((line_number + 1, ConfigFile.missing_instructions_error.format(
+                        "{}", index + 1, line_number + 1)))
+
+                else:
+                    lines += ["{} {} E\n".format(index % 50, index % 49), "LFRF" * (index % 7 + 1) + "\n"]
+
+            filepath = self.write_file(lines)
+            expected_errors = [(line_number, message.format(filepath)) for line_number, message in expected_errors]
+            self.validator.min_chunk_size = 512
+
+            # When
+            result = self.validator.validate(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertEqual(self.validator.mower_count, 2000)
+            self.assertListEqual(self.validator.errors, expected_errors)
+
+    def test__given_compressed_file__when_validate__then_all_errors_reported(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.temporary_folder.name, "input.txt.gz")
+
+            with gzip.open(filepath, "wt") as f:
+                f.writelines(["5 5\n", "1 2 N\n", "LFLFLFLFF\n", "1 2\n", "LFLFLFLFF\n", "3 3 E\n"])
+
+            # When
+            result = self.validator.validate(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertEqual(self.validator.mower_count, 3)
+            self.assertListEqual(self.validator.errors, [
+                (4, ConfigFile.invalid_format_error.format(filepath, 4)),
+                (7, ConfigFile.missing_instructions_error.format(filepath, 3, 7))])
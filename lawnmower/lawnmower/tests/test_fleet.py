@@ -0,0 +1,75 @@
+import random
+from unittest import TestCase, skipUnless
+
+from lawnmower.src.fleet import FleetSimulator
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.program import Program
+from lawnmower.tests.testutils import captured_output
+
+
+@skipUnless(FleetSimulator.is_available(), "NumPy not installed")
+class TestFleetSimulator(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+
+    def tearDown(self):
+        pass
+
+    def test__given_empty_fleet__when_run__then_empty_result(self):
+
+        # Given
+        fleet = FleetSimulator(Lawn(x_max=5, y_max=5))
+
+        # When
+        x, y, orientation = fleet.run()
+
+        # Then
+        self.assertListEqual(x.tolist(), [])
+        self.assertListEqual(y.tolist(), [])
+        self.assertListEqual(orientation.tolist(), [])
+
+    def test__given_valid_fleet__when_run__then_final_states_in_order(self):
+
+        # Given
+        fleet = FleetSimulator(Lawn(x_max=5, y_max=5))
+        fleet.add(1, 2, Orientation.str_to_int["N"], Program.compile("LFLFLFLFF").opcodes)
+        fleet.add(3, 3, Orientation.str_to_int["E"], Program.compile("FFRFFRFRRF").opcodes)
+        fleet.add(0, 0, Orientation.str_to_int["S"], Program.compile("").opcodes)
+
+        # When
+        x, y, orientation = fleet.run()
+
+        # Then
+        self.assertListEqual(x.tolist(), [1, 5, 0])
+        self.assertListEqual(y.tolist(), [3, 1, 0])
+        self.assertListEqual(orientation.tolist(), [Orientation.str_to_int[value] for value in "NES"])
+
+    def test__given_random_fleet__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=9, y_max=6)
+            fleet = FleetSimulator(lawn)
+            expected = []
+
+            for _ in range(300):
+                instruction_list = "".join(self.random_generator.choices("LRFFF",
+                                                                         k=self.random_generator.randint(0, 60)))
+                mower = Mower(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6),
+                              Orientation(self.random_generator.choice("NESW")), lawn)
+                fleet.add(mower.x, mower.y, mower.orientation.orientation, Program.compile(instruction_list).opcodes)
+
+                for instruction in instruction_list:
+                    mower.execute(instruction)
+
+                expected.append((mower.x, mower.y, mower.orientation.orientation))
+
+            # When
+            result = list(zip(*(values.tolist() for values in fleet.run())))
+
+            # Then
+            self.assertListEqual(result, expected)
@@ -0,0 +1,31 @@
+import os
+import sys
+from subprocess import Popen, PIPE
+from unittest import TestCase
+
+
+class TestImports(TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test__given_src_modules__when_imported_in_fresh_interpreter__then_no_import_cycle(self):
+
+        # Given
+        src_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+        module_names = sorted(filename[:-len(".py")] for filename in os.listdir(src_folder)
+                              if filename.endswith(".py") and filename != "__init__.py")
+
+        for module_name in module_names:
+
+            # When
+            with Popen([sys.executable, "-c", "import lawnmower.src.{}".format(module_name)], stdout=PIPE,
+                       stderr=PIPE, env=env, text=True) as process:
+                out, err = process.communicate(timeout=60)
+
+            # Then
+            self.assertEqual(process.returncode, 0, "{}: {}".format(module_name, err))
@@ -172,3 +172,18 @@ class TestLawn(TestCase):
             expected_result = "((Xmin={},Ymin={}), (Xmax={},Ymax={})".format(self.lawn.x_min, self.lawn.y_min,
                                                                              self.lawn.x_max, self.lawn.y_max)
             self.assertEqual(result, expected_result)
+
+    def test__given_integer_x_and_y__when_is_within__then_same_as_string_x_and_y(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for x in range(-1, 7):
+                for y in range(-1, 7):
+
+                    # When
+                    result = self.lawn.is_within(x, y)
+
+                    # Then
+                    self.assertEqual(result, self.lawn.is_within(str(x), str(y)))
+                    self.assertEqual(result, 0 <= x <= 5 and 0 <= y <= 5)
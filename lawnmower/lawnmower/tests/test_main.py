@@ -1,9 +1,13 @@
+import os
 import sys
+import gzip
 from copy import deepcopy
+from subprocess import Popen, PIPE
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
 import lawnmower.src.config_file
+from lawnmower.src.scenario_cache import ScenarioCache
 from lawnmower.src.main import main
 from lawnmower.tests.testutils import captured_output, Any
 
@@ -86,7 +90,7 @@ class TestMain(TestCase):
             # Then
             config_file_load_mock.assert_called_once_with(input_filepath)
             scheduler_mock.assert_called_once_with(config_file=Any(lawnmower.src.config_file.ConfigFile),
-                                                   mower_overlapping=False)
+                                                   mower_overlapping=False, processes=1, simultaneous=False)
             mocked_scheduler.run.assert_called_once_with(verbose=False)
 
     @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
@@ -118,7 +122,7 @@ class TestMain(TestCase):
             # Then
             config_file_load_mock.assert_called_once_with(input_filepath)
             scheduler_mock.assert_called_once_with(config_file=Any(lawnmower.src.config_file.ConfigFile),
-                                                   mower_overlapping=False)
+                                                   mower_overlapping=False, processes=1, simultaneous=False)
             mocked_scheduler.run.assert_called_once_with(verbose=True)
 
     @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
@@ -153,5 +157,226 @@ class TestMain(TestCase):
             # Then
             config_file_load_mock.assert_called_once_with(input_filepath)
             scheduler_mock.assert_called_once_with(config_file=Any(lawnmower.src.config_file.ConfigFile),
-                                                   mower_overlapping=True)
+                                                   mower_overlapping=True, processes=1, simultaneous=False)
             mocked_scheduler.run.assert_called_once_with(verbose=True)
+
+    @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_compact_option__when_main__then_compact_config_file(self, config_file_mock, scheduler_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+
+            input_filepath = "path/to/whatever_config_file.txt"
+            sys.argv.append("--compact")
+            sys.argv.append(input_filepath)
+
+            # When
+            main()
+
+            # Then
+            config_file_mock.assert_called_once_with(compact=True, cache=Any(ScenarioCache))
+            config_file_mock.return_value.load.assert_called_once_with(input_filepath)
+            scheduler_mock.assert_called_once_with(config_file=config_file_mock.return_value, mower_overlapping=False,
+                                                   processes=1, simultaneous=False)
+
+    @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_simultaneous_option__when_main__then_simultaneous_scheduler(self, config_file_mock,
+                                                                                scheduler_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+
+            input_filepath = "path/to/whatever_config_file.txt"
+            sys.argv += ["--simultaneous", input_filepath]
+
+            # When
+            main()
+
+            # Then
+            config_file_mock.return_value.load.assert_called_once_with(input_filepath)
+            scheduler_mock.assert_called_once_with(config_file=config_file_mock.return_value, mower_overlapping=False,
+                                                   processes=1, simultaneous=True)
+            scheduler_mock.return_value.run.assert_called_once_with(verbose=False)
+
+    @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_processes_option__when_main__then_scheduler_with_several_processes(self, config_file_mock,
+                                                                                       scheduler_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+
+            input_filepath = "path/to/whatever_config_file.txt"
+            sys.argv += ["--processes=4", input_filepath, "False", "True"]
+
+            # When
+            main()
+
+            # Then
+            scheduler_mock.assert_called_once_with(config_file=config_file_mock.return_value, mower_overlapping=True,
+                                                   processes=4, simultaneous=False)
+
+    @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    @patch("lawnmower.src.config_file_validator.ConfigFileValidator", autospec=True)
+    def test__given_check_option__when_main__then_only_validate(self, validator_mock, config_file_mock,
+                                                                scheduler_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+
+            input_filepath = "path/to/whatever_config_file.txt"
+            sys.argv += ["--check", "--processes=3", input_filepath]
+
+            validator_mock.return_value.errors = [(4, "ERROR in line 4")]
+            validator_mock.return_value.mower_count = 2
+            validator_mock.return_value.validate.return_value = False
+
+            # When
+            main()
+
+            # Then
+            validator_mock.assert_called_once_with(processes=3)
+            validator_mock.return_value.validate.assert_called_once_with(input_filepath)
+            config_file_mock.assert_not_called()
+            scheduler_mock.assert_not_called()
+            self.assertIn("ERROR in line 4", out.getvalue())
+            self.assertIn("INVALID (2 mowers, 1 errors)", out.getvalue())
+
+    @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_no_cache_option__when_main__then_config_file_without_cache(self, config_file_mock,
+                                                                               scheduler_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+
+            input_filepath = "path/to/whatever_config_file.txt"
+            sys.argv += ["--no-cache", input_filepath]
+
+            # When
+            main()
+
+            # Then
+            config_file_mock.assert_called_once_with(compact=False, cache=None)
+            config_file_mock.return_value.load.assert_called_once_with(input_filepath)
+
+    @patch("lawnmower.src.scenario_cache.ScenarioCache.clear")
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_only_clear_cache_option__when_main__then_cache_cleared(self, config_file_mock, clear_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+            sys.argv.append("--clear-cache")
+            clear_mock.return_value = 3
+
+            # When
+            main()
+
+            # Then
+            clear_mock.assert_called_once_with()
+            config_file_mock.assert_not_called()
+            self.assertIn("Removed 3 entries", out.getvalue())
+            self.assertNotIn("ERROR", out.getvalue())
+
+    @patch("lawnmower.src.batch.BatchRunner", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_batch_option__when_main__then_batch_run(self, config_file_mock, batch_runner_mock):
+
+        with captured_output() as (out, err):
+
+            # Given
+            # Mock command line arguments
+            sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+
+            input_pattern = "path/to/configs/*.txt"
+            sys.argv += ["--batch", "--processes=2", "--no-cache", input_pattern, "True"]
+
+            # When
+            main()
+
+            # Then
+            batch_runner_mock.assert_called_once_with(processes=2, verbose=True, mower_overlapping=False,
+                                                      compact=False, cache=None)
+            batch_runner_mock.return_value.run.assert_called_once_with(input_pattern)
+            config_file_mock.assert_not_called()
+
+    def test__given_stdin_input_filepath__when_main__then_each_mower_printed_as_soon_as_finished(self):
+
+        # Given
+        main_filepath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "main.py")
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+        with Popen([sys.executable, main_filepath, "-"], stdin=PIPE, stdout=PIPE, env=env, text=True) as process:
+
+            # When
+            process.stdin.write("5 5\n1 2 N\nLFLFLFLFF\n")
+            process.stdin.flush()
+
+            # Then
+            # The first mower is printed even though the standard input is still open
+            self.assertEqual(process.stdout.readline(), "1 3 N\n")
+
+            # When
+            process.stdin.write("3 3 E\nFFRFFRFRRF\n")
+            process.stdin.close()
+
+            # Then
+            self.assertEqual(process.stdout.read(), "5 1 E\n")
+            self.assertEqual(process.wait(timeout=10), 0)
+
+    def test__given_compressed_stdin_input_filepath__when_main__then_decompressed_while_read(self):
+
+        # Given
+        main_filepath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "main.py")
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+        with Popen([sys.executable, main_filepath, "-"], stdin=PIPE, stdout=PIPE, env=env) as process:
+
+            # When
+            out, _ = process.communicate(gzip.compress(b"5 5\n1 2 N\nLFLFLFLFF\n3 3 E\nFFRFFRFRRF\n"), timeout=10)
+
+            # Then
+            self.assertEqual(out.decode(), "1 3 N\n5 1 E\n")
+            self.assertEqual(process.returncode, 0)
+
+    @patch("lawnmower.src.scheduler.Scheduler", autospec=True)
+    @patch("lawnmower.src.config_file.ConfigFile", autospec=True)
+    def test__given_stdin_input_filepath_and_fleet_options__when_main__then_usage_error(self, config_file_mock,
+                                                                                        scheduler_mock):
+
+        for option in ["--compact", "--processes=2", "--simultaneous"]:
+            with captured_output() as (out, err):
+
+                # Given
+                # Mock command line arguments
+                sys.argv = sys.argv[:1]     # RECALL that the first position always the name of the program
+                sys.argv += [option, "-"]
+
+                # When
+                main()
+
+                # Then
+                config_file_mock.assert_not_called()
+                scheduler_mock.assert_not_called()
+                self.assertIn("cannot be used when reading from the standard input", out.getvalue())
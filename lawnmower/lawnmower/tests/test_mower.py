@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import patch, Mock
 
 import lawnmower.src.lawn
+import lawnmower.src.orientation
 from lawnmower.src.mower import Mower
 from lawnmower.tests.testutils import captured_output
 from lawnmower.tests.mocks.lawn_mock import LawnMock
@@ -1039,3 +1040,99 @@ class TestMower(TestCase):
             rotate_left_mock.assert_not_called()
             rotate_right_mock.assert_not_called()
             forward_mock.assert_called_once_with(dry_run_mode=dry_run_mode)
+
+    def test__given_plain_instruction_lists__when_parse_runs__then_return_none(self):
+
+        # Given
+        for instruction_list in ["LFRF", "", "LFLFL 2 3 E RRFFFLLR", "F12X", "12F", None, 12]:
+
+            # When
+            result = Mower.parse_runs(instruction_list)
+
+            # Then
+            self.assertIsNone(result, instruction_list)
+
+    def test__given_run_length_encoded_instruction_list__when_parse_runs__then_runs(self):
+
+        # Given
+        instruction_list = " F1200R L3 f02r\n"
+
+        # When
+        result = Mower.parse_runs(instruction_list)
+
+        # Then
+        self.assertListEqual(result, [("F", 1200), ("R", 1), ("L", 3), ("F", 2), ("R", 1)])
+
+    def test__given_forward_runs__when_execute_run__then_bounded_by_lawn(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = lawnmower.src.lawn.Lawn(x_max=5, y_max=5)
+
+            for orientation, count, expected_position in [("N", 2, (3, 4)), ("N", 1200, (3, 5)), ("E", 1200, (5, 2)),
+                                                          ("S", 1, (3, 1)), ("S", 1200, (3, 0)), ("W", 1200, (0, 2)),
+                                                          ("W", 0, (3, 2))]:
+                mower = Mower(3, 2, lawnmower.src.orientation.Orientation(orientation), lawn)
+
+                # When
+                result = mower.execute_run("F", count)
+
+                # Then
+                self.assertTupleEqual(result, expected_position)
+                self.assertTupleEqual((mower.x, mower.y), expected_position)
+                self.assertEqual(mower.orientation.get_str(), orientation)
+
+    def test__given_forward_run_and_dry_run_mode__when_execute_run__then_position_not_modified(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = lawnmower.src.lawn.Lawn(x_max=5, y_max=5)
+            mower = Mower(3, 2, lawnmower.src.orientation.Orientation("N"), lawn)
+
+            # When
+            result = mower.execute_run("F", 1200, dry_run_mode=True)
+
+            # Then
+            self.assertTupleEqual(result, (3, 5))
+            self.assertTupleEqual((mower.x, mower.y), (3, 2))
+
+    def test__given_rotation_runs__when_execute_run__then_same_as_one_by_one(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = lawnmower.src.lawn.Lawn(x_max=5, y_max=5)
+
+            for instruction in ["L", "R"]:
+                for count in range(10):
+                    mower = Mower(3, 2, lawnmower.src.orientation.Orientation("N"), lawn)
+                    expected_orientation = lawnmower.src.orientation.Orientation("N")
+
+                    for _ in range(count):
+                        expected_orientation.rotate(right=instruction == "R")
+
+                    # When
+                    mower.execute_run(instruction, count)
+
+                    # Then
+                    self.assertEqual(mower.orientation.get_str(), expected_orientation.get_str())
+                    self.assertTupleEqual((mower.x, mower.y), (3, 2))
+
+    def test__given_real_orientations__when_get_forward_position_modification__then_ok(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            self.mower.x = 3
+            self.mower.y = 2
+
+            for orientation_str, expected_result in [("N", (3, 3)), ("E", (4, 2)), ("S", (3, 1)), ("W", (2, 2))]:
+                self.mower.orientation = lawnmower.src.orientation.Orientation(orientation_str)
+
+                # When
+                result = self.mower.get_forward_position_modification()
+
+                # Then
+                self.assertTupleEqual(result, expected_result)
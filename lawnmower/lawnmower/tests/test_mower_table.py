@@ -0,0 +1,106 @@
+from unittest import TestCase
+
+from lawnmower.src.mower_table import MowerTable
+from lawnmower.tests.testutils import captured_output
+
+
+class TestMowerTable(TestCase):
+
+    def setUp(self):
+        self.mower_table = MowerTable()
+
+    def tearDown(self):
+        pass
+
+    def test__given_whatever__when_init__then_empty(self):
+
+        with captured_output() as (out, err):
+
+            # When
+            self.mower_table = MowerTable()
+
+            # Then
+            self.assertEqual(len(self.mower_table), 0)
+            self.assertListEqual(list(self.mower_table), [])
+            self.assertListEqual(list(self.mower_table.offsets), [0])
+
+    def test__given_mower_info__when_append__then_stored_in_columns(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            mower1_info = {"initial_position": ("1", "2"), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"}
+            mower2_info = {"initial_position": ("3", "3"), "initial_orientation": "E", "instruction_list": "FFRFFRFRRF"}
+
+            # When
+            self.mower_table.append(mower1_info)
+            self.mower_table.append(mower2_info)
+
+            # Then
+            self.assertEqual(len(self.mower_table), 2)
+            self.assertListEqual(list(self.mower_table.x), [1, 3])
+            self.assertListEqual(list(self.mower_table.y), [2, 3])
+            self.assertListEqual(list(self.mower_table.orientation), [0, 1])
+            self.assertEqual(bytes(self.mower_table.instructions), b"LFLFLFLFFFFRFFRFRRF")
+            self.assertListEqual(list(self.mower_table.offsets), [0, 9, 19])
+            self.assertEqual(self.mower_table.get_instruction_list(1), b"FFRFFRFRRF")
+
+    def test__given_appended_mowers__when_getitem__then_mower_info_with_int_coordinates(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            self.mower_table.append_values(b"1", b"2", b"W", b"LFLFLFLFF")
+            self.mower_table.append_values(3, 4, "S", "FFRFFRFRRF")
+
+            # When
+            result = [self.mower_table[0], self.mower_table[-1]]
+
+            # Then
+            self.assertListEqual(result, [
+                {"initial_position": (1, 2), "initial_orientation": "W", "instruction_list": "LFLFLFLFF"},
+                {"initial_position": (3, 4), "initial_orientation": "S", "instruction_list": "FFRFFRFRRF"}])
+            self.assertListEqual(list(self.mower_table), result)
+
+    def test__given_invalid_orientation__when_append_values__then_north(self):
+
+        with captured_output() as (out, err):
+
+            # When
+            self.mower_table.append_values(1, 2, "X", "F")
+
+            # Then
+            self.assertEqual(self.mower_table[0]["initial_orientation"], "N")
+
+    def test__given_invalid_coordinates__when_append_values__then_value_error_and_not_updated(self):
+
+        with captured_output() as (out, err):
+
+            # When + Then
+            with self.assertRaises(ValueError):
+                self.mower_table.append_values("1", "two", "N", "F")
+
+            self.assertEqual(len(self.mower_table), 0)
+            self.assertEqual(len(self.mower_table.y), 0)
+
+    def test__given_coordinates_too_big__when_append_values__then_overflow_error_and_not_updated(self):
+
+        with captured_output() as (out, err):
+
+            # When + Then
+            with self.assertRaises(OverflowError):
+                self.mower_table.append_values("1", str(1 << 63), "N", "F")
+
+            self.assertEqual(len(self.mower_table), 0)
+            self.assertEqual(len(self.mower_table.x), 0)
+
+    def test__given_index_out_of_range__when_getitem__then_index_error(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            self.mower_table.append_values(1, 2, "N", "F")
+
+            # When + Then
+            with self.assertRaises(IndexError):
+                self.mower_table[1]
@@ -0,0 +1,154 @@
+import random
+from unittest import TestCase
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.occupancy import OccupancyIndex, OccupancyGrid
+
+
+class TestOccupancyIndex(TestCase):
+
+    def setUp(self):
+        self.occupancy = OccupancyIndex()
+
+    def tearDown(self):
+        pass
+
+    def test__given_empty_index__when_is_occupied__then_false(self):
+
+        # When
+        result = self.occupancy.is_occupied(1, 2)
+
+        # Then
+        self.assertFalse(result)
+
+    def test__given_added_positions__when_is_occupied__then_only_added_ones(self):
+
+        # Given
+        for x, y in [(1, 2), (3, 2), (1, 2)]:
+            self.occupancy.add(x, y)
+
+        # When + Then
+        self.assertTrue(self.occupancy.is_occupied(1, 2))
+        self.assertTrue(self.occupancy.is_occupied(3, 2))
+        self.assertFalse(self.occupancy.is_occupied(2, 2))
+        self.assertFalse(self.occupancy.is_occupied(2, 1))
+
+    def test__given_no_occupied_position_in_the_way__when_get_free_steps__then_all_steps(self):
+
+        # Given
+        self.occupancy.add(5, 5)
+
+        # When
+        result = self.occupancy.get_free_steps(5, 2, 1, 0, 100)
+
+        # Then
+        self.assertEqual(result, 100)
+
+    def test__given_occupied_positions__when_get_free_steps__then_stop_just_before_nearest_one(self):
+
+        # Given
+        for x, y in [(5, 5), (5, 9), (5, 1), (2, 5), (8, 5)]:
+            self.occupancy.add(x, y)
+
+        # When + Then
+        self.assertEqual(self.occupancy.get_free_steps(5, 3, 0, 1, 100), 1)       # North, up to (5, 4)
+        self.assertEqual(self.occupancy.get_free_steps(5, 3, 0, -1, 100), 1)      # South, up to (5, 2)
+        self.assertEqual(self.occupancy.get_free_steps(5, 5, 0, 1, 100), 3)       # North, from an occupied position
+        self.assertEqual(self.occupancy.get_free_steps(4, 5, 1, 0, 100), 0)       # East, just in front of (5, 5)
+        self.assertEqual(self.occupancy.get_free_steps(7, 5, -1, 0, 100), 1)      # West, up to (6, 5)
+        self.assertEqual(self.occupancy.get_free_steps(5, 3, 0, 1, 0), 0)         # No steps at all
+
+    def test__given_random_occupied_positions__when_get_free_steps__then_same_as_step_by_step(self):
+
+        # Given
+        random_generator = random.Random(0)
+
+        for _ in range(50):
+            occupied = {(random_generator.randint(0, 10), random_generator.randint(0, 10)) for _ in range(15)}
+            occupancy = OccupancyIndex()
+
+            for x, y in occupied:
+                occupancy.add(x, y)
+
+            for _ in range(20):
+                x, y = random_generator.randint(0, 10), random_generator.randint(0, 10)
+                dx, dy = random_generator.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+                count = random_generator.randint(0, 12)
+
+                expected_result = 0
+
+                while expected_result < count and \
+                        (x + dx * (expected_result + 1), y + dy * (expected_result + 1)) not in occupied:
+                    expected_result += 1
+
+                # When
+                result = occupancy.get_free_steps(x, y, dx, dy, count)
+
+                # Then
+                self.assertEqual(result, expected_result)
+
+    def test__given_occupied_positions__when_is_area_free__then_only_areas_without_them(self):
+
+        # Given
+        for x, y in [(1, 2), (6, 2), (4, 9)]:
+            self.occupancy.add(x, y)
+
+        # When + Then
+        self.assertTrue(self.occupancy.is_area_free(2, 5, 0, 8))
+        self.assertTrue(self.occupancy.is_area_free(0, 9, 3, 8))
+        self.assertFalse(self.occupancy.is_area_free(4, 6, 2, 2))
+        self.assertFalse(self.occupancy.is_area_free(0, 1, 0, 100))
+        self.assertFalse(self.occupancy.is_area_free(4, 4, 9, 9))
+
+
+class TestOccupancyGrid(TestCase):
+
+    def setUp(self):
+        self.lawn = Lawn(x_max=12, y_max=9, x_min=2, y_min=1)
+        self.occupancy = OccupancyGrid(self.lawn)
+
+    def tearDown(self):
+        pass
+
+    def test__given_added_positions__when_is_occupied__then_only_added_ones(self):
+
+        # Given
+        for x, y in [(2, 1), (12, 9), (5, 3), (5, 3)]:
+            self.occupancy.add(x, y)
+
+        # When + Then
+        self.assertTrue(self.occupancy.is_occupied(2, 1))
+        self.assertTrue(self.occupancy.is_occupied(12, 9))
+        self.assertTrue(self.occupancy.is_occupied(5, 3))
+        self.assertFalse(self.occupancy.is_occupied(3, 5))
+        self.assertFalse(self.occupancy.is_occupied(13, 0))
+        self.assertFalse(self.occupancy.is_occupied(1, 2))
+        self.assertEqual(self.occupancy.count, 3)
+
+    def test__given_random_occupied_positions__when_queried__then_same_as_occupancy_index(self):
+
+        # Given
+        random_generator = random.Random(0)
+
+        for _ in range(30):
+            occupancy_grid = OccupancyGrid(self.lawn)
+            occupancy_index = OccupancyIndex()
+
+            for _ in range(random_generator.randint(0, 20)):
+                x, y = random_generator.randint(2, 12), random_generator.randint(1, 9)
+                occupancy_grid.add(x, y)
+                occupancy_index.add(x, y)
+
+            for _ in range(30):
+                x, y = random_generator.randint(2, 12), random_generator.randint(1, 9)
+                dx, dy = random_generator.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+                count = random_generator.randint(0, 12)
+                x_min, x_max = sorted([random_generator.randint(0, 14), random_generator.randint(0, 14)])
+                y_min, y_max = sorted([random_generator.randint(0, 11), random_generator.randint(0, 11)])
+
+                # When + Then
+                self.assertEqual(occupancy_grid.is_occupied(x, y), occupancy_index.is_occupied(x, y))
+                self.assertEqual(occupancy_grid.get_free_steps(x, y, dx, dy, count),
+                                 occupancy_index.get_free_steps(x, y, dx, dy, count))
+                self.assertEqual(occupancy_grid.is_area_free(x_min, x_max, y_min, y_max),
+                                 occupancy_index.is_area_free(x_min, x_max, y_min, y_max))
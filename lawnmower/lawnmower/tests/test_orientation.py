@@ -439,3 +439,23 @@ class TestOrientation(TestCase):
 
             # Then
             rotate_mock.assert_called_once_with(right=False)
+
+    def test__given_transitions__when_whenever__then_rotations_and_forward_moves_as_expected(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            expected_forward_moves = {"N": (0, 1), "E": (1, 0), "S": (0, -1), "W": (-1, 0)}
+            expected_left = {"N": "W", "E": "N", "S": "E", "W": "S"}
+            expected_right = {"N": "E", "E": "S", "S": "W", "W": "N"}
+
+            for orientation_str, orientation in Orientation.str_to_int.items():
+
+                # When
+                rotate_left, rotate_right, forward = Orientation.transitions[orientation]
+
+                # Then
+                self.assertTupleEqual(rotate_left, (0, 0, Orientation.str_to_int[expected_left[orientation_str]]))
+                self.assertTupleEqual(rotate_right, (0, 0, Orientation.str_to_int[expected_right[orientation_str]]))
+                self.assertTupleEqual(forward, expected_forward_moves[orientation_str] + (orientation,))
+                self.assertEqual(Orientation.opcodes, {"L": 0, "R": 1, "F": 2})
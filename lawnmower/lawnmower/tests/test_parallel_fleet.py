@@ -0,0 +1,85 @@
+import random
+from unittest import TestCase
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.parallel_fleet import ParallelFleetRunner
+from lawnmower.src.program_tree import ProgramTree
+from lawnmower.tests.testutils import captured_output
+
+
+class TestParallelFleetRunner(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+        self.runner = ParallelFleetRunner(processes=2)
+        self.runner.min_chunk_instructions = 64
+
+    def tearDown(self):
+        pass
+
+    def test__given_instruction_lists__when_get_instruction_count__then_program_trees_not_expanded(self):
+
+        # When + Then
+        self.assertEqual(ParallelFleetRunner.get_instruction_count("LFFRF"), 5)
+        self.assertEqual(ParallelFleetRunner.get_instruction_count(b"F3R"), 3)
+        self.assertEqual(ParallelFleetRunner.get_instruction_count(ProgramTree.parse("L(FFRFF)*100000")), 2)
+
+    def test__given_fleet__when_get_chunks__then_contiguous_and_balanced_by_instructions(self):
+
+        # Given
+        for instruction_counts, expected_boundaries in [
+                ([], [0, 0]),
+                ([10], [0, 1]),
+                ([63] * 16, [0, 2, 4, 6, 8, 10, 12, 14, 16]),
+                ([100] * 4 + [10000] + [100] * 8, [0, 4, 5, 13]),
+                ([10000] + [0] * 100, [0, 1, 101])]:
+
+            # When
+            boundaries = self.runner.get_chunks(instruction_counts)
+
+            # Then
+            self.assertListEqual(boundaries, expected_boundaries)
+
+    def test__given_small_fleet__when_get_chunks__then_single_chunk(self):
+
+        # Given
+        self.runner.min_chunk_instructions = ParallelFleetRunner.min_chunk_instructions
+
+        # When
+        boundaries = self.runner.get_chunks([1000] * 100)
+
+        # Then
+        self.assertListEqual(boundaries, [0, 100])
+
+    def test__given_random_fleet__when_run__then_same_as_mower_execute_in_order(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=9, y_max=6)
+            mowers_info = []
+            expected = []
+
+            for index in range(100):
+                instruction_list = "".join(self.random_generator.choices(
+                    "LRFFF", k=2000 if index == 30 else self.random_generator.randint(0, 60)))
+                mower = Mower(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6),
+                              Orientation(self.random_generator.choice("NESW")), lawn)
+                mowers_info.append({"initial_position": (str(mower.x), str(mower.y)),
+                                    "initial_orientation": mower.orientation.get_str(),
+                                    "instruction_list": instruction_list})
+
+                for instruction in instruction_list:
+                    mower.execute(instruction)
+
+                expected.append((mower.x, mower.y, mower.orientation.orientation))
+
+            # When
+            result = self.runner.run(lawn.x_max, lawn.y_max, mowers_info)
+
+            # Then
+            self.assertGreater(len(self.runner.get_chunks([len(mower_info["instruction_list"])
+                                                           for mower_info in mowers_info])), 2)
+            self.assertListEqual(result, expected)
@@ -0,0 +1,362 @@
+import random
+from unittest import TestCase
+from unittest.mock import patch, call
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.occupancy import OccupancyIndex
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.program import Program
+from lawnmower.src.program_tree import ProgramTree
+from lawnmower.tests.testutils import captured_output
+
+
+class TestProgram(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+
+    def tearDown(self):
+        pass
+
+    def test__given_valid_instruction_list__when_compile__then_opcodes(self):
+
+        # Given
+        for instruction_list in ["LRFlrf", b"LRFlrf"]:
+
+            # When
+            result = Program.compile(instruction_list)
+
+            # Then
+            self.assertEqual(result.opcodes, b"\x00\x01\x02\x00\x01\x02")
+
+            # Too many rotations to be reduced to moves
+            self.assertIsNone(result.moves)
+
+    def test__given_empty_instruction_list__when_compile__then_empty_program(self):
+
+        # When
+        result = Program.compile("")
+
+        # Then
+        self.assertEqual(result.opcodes, b"")
+
+    def test__given_opcodes_with_rotations_and_forward_runs__when_get_moves_from_opcodes__then_moves(self):
+
+        # Given
+        opcodes = Program.compile("FFLRRFFFRRLLLLR").opcodes
+
+        # When
+        result = Program.get_moves_from_opcodes(opcodes)
+
+        # Then
+        self.assertListEqual(result, [(0, 2), (1, 3), (3, 0)])
+
+    def test__given_run_length_encoded_instruction_list__when_compile__then_moves(self):
+
+        # When
+        result = Program.compile("F2 L R2 F3 R2 L4 R")
+
+        # Then
+        self.assertIsNone(result.opcodes)
+        self.assertListEqual(result.moves, [(0, 2), (1, 3), (3, 0)])
+
+    def test__given_instruction_list_mostly_made_up_of_forward_runs__when_compile__then_opcodes_and_moves(self):
+
+        # When
+        result = Program.compile("F" * 100 + "R" + "F" * 100 + "LL")
+
+        # Then
+        self.assertEqual(len(result.opcodes), 203)
+        self.assertListEqual(result.moves, [(0, 100), (1, 100), (2, 0)])
+
+    def test__given_invalid_instruction_list__when_compile__then_return_none(self):
+
+        # Given
+        for instruction_list in ["LFLFL 2 3 E RRFFFLLR", "F12X", "LFñ", None, 12]:
+
+            # When
+            result = Program.compile(instruction_list)
+
+            # Then
+            self.assertIsNone(result, instruction_list)
+
+    def test__given_random_instruction_lists__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=6, y_max=4)
+
+            for _ in range(200):
+                instruction_count = self.random_generator.randint(0, 60)
+                instruction_list = "".join(self.random_generator.choices("LRFlrfFF", k=instruction_count))
+                orientation_str = self.random_generator.choice("NESW")
+                mower = Mower(self.random_generator.randint(0, 6), self.random_generator.randint(0, 4),
+                              Orientation(orientation_str), lawn)
+                initial_state = (mower.x, mower.y, mower.orientation.orientation)
+
+                for instruction in instruction_list:
+                    mower.execute(instruction)
+
+                opcodes = Program.compile(instruction_list).opcodes
+
+                for program in [Program(opcodes=opcodes), Program(moves=Program.get_moves_from_opcodes(opcodes))]:
+
+                    # When
+                    result = program.run(*initial_state, lawn)
+
+                    # Then
+                    self.assertTupleEqual(result, (mower.x, mower.y, mower.orientation.orientation))
+
+    def test__given_occupied_positions__when_run__then_forward_moves_to_them_ignored(self):
+
+        # Given
+        lawn = Lawn(x_max=5, y_max=5)
+        occupancy = OccupancyIndex()
+        occupancy.add(1, 4)
+        occupancy.add(3, 2)
+        program = Program.compile("FFRFFRF")
+
+        # When
+        result = program.run(1, 2, Orientation.str_to_int["N"], lawn, occupancy)
+
+        # Then
+        # (1, 4) blocks the second forward move, (3, 2) blocks the last one
+        self.assertTupleEqual(result, (3, 3, Orientation.str_to_int["S"]))
+
+    def test__given_random_instruction_lists_and_occupied_positions__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=9, y_max=6)
+
+            for _ in range(200):
+                occupied = {(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6))
+                            for _ in range(self.random_generator.randint(0, 12))}
+                occupancy = OccupancyIndex()
+
+                for x, y in occupied:
+                    occupancy.add(x, y)
+
+                instruction_count = self.random_generator.randint(0, 80)
+                instruction_list = "".join(self.random_generator.choices("LRFFFFFF", k=instruction_count))
+                mower = Mower(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6),
+                              Orientation(self.random_generator.choice("NESW")), lawn)
+                initial_state = (mower.x, mower.y, mower.orientation.orientation)
+
+                for instruction in instruction_list:
+                    if mower.execute(instruction, dry_run_mode=True) not in occupied:
+                        mower.execute(instruction)
+
+                opcodes = Program.compile(instruction_list).opcodes
+
+                for program in [Program(opcodes=opcodes), Program(moves=Program.get_moves_from_opcodes(opcodes))]:
+
+                    # When
+                    result = program.run(*initial_state, lawn, occupancy)
+
+                    # Then
+                    self.assertTupleEqual(result, (mower.x, mower.y, mower.orientation.orientation))
+
+    def test__given_instruction_list__when_get_envelopes__then_envelope_of_each_initial_orientation(self):
+
+        # Given
+        program = Program.compile("FFRFFFLLFFFFF")
+
+        # When
+        result = program.get_envelopes()
+
+        # Then
+        self.assertListEqual(result, [(-2, 3, 0, 2, -2, 2, 3),
+                                      (0, 2, -3, 2, 2, 2, 3),
+                                      (-3, 2, -2, 0, 2, -2, 3),
+                                      (-2, 0, -2, 3, -2, -2, 3)])
+
+    def test__given_program_run_several_times__when_run__then_analysed_once(self):
+
+        # Given
+        lawn = Lawn(x_max=9, y_max=6)
+        program = Program.compile("FFRFF")
+        program.run(0, 0, 0, lawn)
+        envelopes = program.get_envelopes()
+
+        # When
+        result = program.run(0, 0, 0, lawn)
+        program.run(0, 0, 0, lawn)
+
+        # Then
+        self.assertTupleEqual(result, (2, 2, 1))
+        self.assertListEqual(program.envelopes, envelopes)
+        self.assertEqual(program.run_count, Program.envelope_min_runs)
+
+    def test__given_analysed_programs_and_occupied_positions__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=29, y_max=19)
+
+            for _ in range(300):
+                occupied = {(self.random_generator.randint(0, 29), self.random_generator.randint(0, 19))
+                            for _ in range(self.random_generator.randint(0, 4))}
+                occupancy = OccupancyIndex()
+
+                for x, y in occupied:
+                    occupancy.add(x, y)
+
+                instruction_count = self.random_generator.randint(0, 30)
+                instruction_list = "".join(self.random_generator.choices("LRFFFFFF", k=instruction_count))
+                mower = Mower(self.random_generator.randint(0, 29), self.random_generator.randint(0, 19),
+                              Orientation(self.random_generator.choice("NESW")), lawn)
+                initial_state = (mower.x, mower.y, mower.orientation.orientation)
+
+                for instruction in instruction_list:
+                    if mower.execute(instruction, dry_run_mode=True) not in occupied:
+                        mower.execute(instruction)
+
+                program = Program.compile(instruction_list)
+                program.envelopes = program.get_envelopes()
+
+                for program_occupancy in [occupancy] if occupied else [occupancy, None]:
+
+                    # When
+                    result = program.run(*initial_state, lawn, program_occupancy)
+
+                    # Then
+                    self.assertTupleEqual(result, (mower.x, mower.y, mower.orientation.orientation))
+
+    def test__given_opcodes__when_get_period__then_shortest_pattern_repeated_enough(self):
+
+        # Given
+        for instruction_list, expected in [("LF" * 40, 2), ("FFRFF" * 10 + "FFR", 5), ("LFFRFRFFF" * 3, None),
+                                           ("F" * 100, 1), ("LFFRFRFFFL" * 8, 10), ("", None), ("LFRF", None)]:
+            opcodes = Program.get_opcodes(instruction_list)
+
+            # When
+            result = Program.get_period(opcodes)
+
+            # Then
+            self.assertEqual(result, expected)
+
+    def test__given_long_run_followed_by_differing_opcode__when_get_period__then_single_candidate_checked(self):
+
+        # Given
+        for instruction_list, periods, expected_match_length in [("F" * 10 ** 6 + "L", [1], 10 ** 6 - 1),
+                                                                 (("F" * 50 + "R") * 6000 + "L", [1, 51], 306000 - 51)]:
+            opcodes = Program.get_opcodes(instruction_list)
+
+            with patch.object(Program, "get_match_length", wraps=Program.get_match_length) as get_match_length_mock:
+
+                # When
+                result = Program.get_period(opcodes)
+
+                # Then
+                # Candidates up to the mismatch at the end are skipped (i.e., linear time)
+                self.assertIsNone(result)
+                self.assertListEqual(get_match_length_mock.call_args_list,
+                                     [call(opcodes, period) for period in periods])
+                self.assertEqual(Program.get_match_length(opcodes, periods[-1]), expected_match_length)
+
+    def test__given_periodic_instruction_list__when_compile__then_pattern_and_remainder(self):
+
+        # Given
+        instruction_list = "FFRFF" * 10 + "FFR"
+
+        # When
+        result = Program.compile(instruction_list)
+
+        # Then
+        self.assertEqual(result.pattern.opcodes, Program.get_opcodes("FFRFF"))
+        self.assertEqual(result.pattern_repeats, 10)
+        self.assertEqual(result.remainder.opcodes, Program.get_opcodes("FFR"))
+
+    def test__given_periodic_instruction_lists_and_occupied_positions__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=9, y_max=6)
+
+            for _ in range(200):
+                occupied = {(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6))
+                            for _ in range(self.random_generator.randint(0, 6))}
+                occupancy = OccupancyIndex()
+
+                for x, y in occupied:
+                    occupancy.add(x, y)
+
+                pattern = "".join(self.random_generator.choices("LRFFF", k=self.random_generator.randint(1, 8)))
+                instruction_list = (pattern * 200)[:self.random_generator.randint(4 * len(pattern), 200 * len(pattern))]
+                mower = Mower(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6),
+                              Orientation(self.random_generator.choice("NESW")), lawn)
+                initial_state = (mower.x, mower.y, mower.orientation.orientation)
+
+                for instruction in instruction_list:
+                    if mower.execute(instruction, dry_run_mode=True) not in occupied:
+                        mower.execute(instruction)
+
+                program = Program.compile(instruction_list)
+
+                for program_occupancy in [occupancy] if occupied else [occupancy, None]:
+
+                    # When
+                    result = program.run(*initial_state, lawn, program_occupancy)
+
+                    # Then
+                    self.assertIsNotNone(program.pattern)
+                    self.assertTupleEqual(result, (mower.x, mower.y, mower.orientation.orientation))
+
+    def test__given_program_tree__when_compile__then_not_expanded(self):
+
+        # Given
+        program_tree = ProgramTree.parse("(FFRFF)*100000")
+
+        # When
+        result = Program.compile(program_tree)
+
+        # Then
+        self.assertIs(result.tree, program_tree)
+        self.assertIsNone(result.opcodes)
+        self.assertIsNone(result.moves)
+        self.assertTupleEqual(result.run(0, 0, 0, Lawn(x_max=9, y_max=6)), (0, 2, 0))
+
+    def test__given_program_trees_and_occupied_positions__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=29, y_max=19)
+
+            for _ in range(200):
+                occupied = {(self.random_generator.randint(0, 29), self.random_generator.randint(0, 19))
+                            for _ in range(self.random_generator.randint(0, 4))}
+                occupancy = OccupancyIndex()
+
+                for x, y in occupied:
+                    occupancy.add(x, y)
+
+                program_tree = ProgramTree.parse("{}(({})*{}{})*{}".format(
+                    "".join(self.random_generator.choices("LRF", k=self.random_generator.randint(0, 3))),
+                    "".join(self.random_generator.choices("LRFFF", k=self.random_generator.randint(1, 6))),
+                    self.random_generator.randint(0, 4),
+                    "".join(self.random_generator.choices("LRF", k=self.random_generator.randint(1, 3))),
+                    self.random_generator.randint(0, 12)))
+                mower = Mower(self.random_generator.randint(0, 29), self.random_generator.randint(0, 19),
+                              Orientation(self.random_generator.choice("NESW")), lawn)
+                initial_state = (mower.x, mower.y, mower.orientation.orientation)
+
+                for instruction in program_tree:
+                    if mower.execute(instruction, dry_run_mode=True) not in occupied:
+                        mower.execute(instruction)
+
+                program = Program.compile(program_tree)
+
+                for program_occupancy in [occupancy] if occupied else [occupancy, None]:
+
+                    # When
+                    result = program.run(*initial_state, lawn, program_occupancy)
+
+                    # Then
+                    self.assertTupleEqual(result, (mower.x, mower.y, mower.orientation.orientation))
@@ -0,0 +1,150 @@
+import random
+from unittest import TestCase
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.program_cache import ProgramCache
+
+
+class TestProgramCache(TestCase):
+
+    def setUp(self):
+        self.lawn = Lawn(x_max=5, y_max=4)
+
+    def tearDown(self):
+        pass
+
+    def test__given_same_instruction_list__when_get_program__then_same_program(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn)
+        program = program_cache.get_program("FFRFF")
+
+        # When
+        result = program_cache.get_program("".join(["FFR", "FF"]))
+
+        # Then
+        self.assertIs(result, program)
+        self.assertIsNot(program_cache.get_program("FFRF"), program)
+
+    def test__given_invalid_instruction_list__when_get_program__then_none(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn)
+
+        for instruction_list in ["FFX", None, ["F"]]:
+
+            # When
+            result = program_cache.get_program(instruction_list)
+
+            # Then
+            self.assertIsNone(result)
+
+    def test__given_more_programs_than_max_programs__when_get_program__then_least_recently_used_evicted(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn, max_programs=2)
+        program = program_cache.get_program("F")
+        program_cache.get_program("R")
+        program_cache.get_program("F")
+
+        # When
+        program_cache.get_program("L")
+
+        # Then
+        self.assertListEqual(list(program_cache.programs), ["F", "L"])
+        self.assertIs(program_cache.get_program("F"), program)
+
+    def test__given_same_initial_state__when_run__then_result_cached(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn, max_table_states=0)
+        program = program_cache.get_program("FFRFF")
+        expected = program.run(1, 2, 0, self.lawn)
+
+        for _ in range(3):
+
+            # When
+            result = program_cache.run(program, 1, 2, 0)
+
+            # Then
+            self.assertTupleEqual(result, expected)
+
+        self.assertEqual(program_cache.misses, 1)
+        self.assertEqual(program_cache.hits, 2)
+        self.assertDictEqual(program_cache.tables, {})
+
+    def test__given_more_results_than_max_results__when_run__then_least_recently_used_evicted(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn, max_results=2, max_table_states=0)
+        program = program_cache.get_program("FFRFF")
+
+        # When
+        for x in range(3):
+            program_cache.run(program, x, 0, 0)
+
+        # Then
+        self.assertListEqual(list(program_cache.results), [(program, 1, 0, 0), (program, 2, 0, 0)])
+
+    def test__given_small_lawn__when_run__then_results_from_table(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn)
+        random_generator = random.Random(0)
+        program = program_cache.get_program("".join(random_generator.choices("LRFFF", k=50)))
+
+        for _ in range(2):
+
+            # When
+            for x in range(self.lawn.x_max + 1):
+                for y in range(self.lawn.y_max + 1):
+                    for orientation in range(4):
+                        result = program_cache.run(program, x, y, orientation)
+
+                        # Then
+                        self.assertTupleEqual(result, program.run(x, y, orientation, self.lawn))
+
+        self.assertEqual(program_cache.misses, program_cache.state_count)
+        self.assertEqual(program_cache.hits, program_cache.state_count)
+        self.assertNotIn(None, program_cache.tables[program])
+        self.assertDictEqual(program_cache.results, {})
+
+    def test__given_more_tables_than_max_tables__when_run__then_least_recently_used_evicted(self):
+
+        # Given
+        program_cache = ProgramCache(self.lawn, max_tables=1)
+        program_cache.run(program_cache.get_program("F"), 0, 0, 0)
+        program = program_cache.get_program("R")
+
+        # When
+        program_cache.run(program, 0, 0, 0)
+
+        # Then
+        self.assertListEqual(list(program_cache.tables), [program])
+
+    def test__given_big_lawn__when_init__then_no_tables(self):
+
+        # When
+        program_cache = ProgramCache(Lawn(x_max=1000, y_max=1000))
+
+        # Then
+        self.assertFalse(program_cache.use_tables)
+
+    def test__given_lawn_not_starting_at_origin__when_run__then_same_as_program_run(self):
+
+        # Given
+        lawn = Lawn(x_max=4, y_max=3, x_min=2, y_min=1)
+        program_cache = ProgramCache(lawn)
+        program = program_cache.get_program("FFLFFRRFFFLF")
+
+        for x in range(2, 5):
+            for y in range(1, 4):
+                for orientation in range(4):
+
+                    # When
+                    result = program_cache.run(program, x, y, orientation)
+
+                    # Then
+                    self.assertTupleEqual(result, program.run(x, y, orientation, lawn))
+
+        self.assertNotIn(None, program_cache.tables[program])
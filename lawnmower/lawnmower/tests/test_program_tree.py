@@ -0,0 +1,125 @@
+import random
+from unittest import TestCase
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.program import Program
+from lawnmower.src.program_tree import ProgramTree
+from lawnmower.tests.testutils import captured_output
+
+
+class TestProgramTree(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+        self.lawn = Lawn(x_max=6, y_max=4, x_min=2, y_min=1)
+
+    def tearDown(self):
+        pass
+
+    def get_random_source(self, depth=2):
+        items = []
+
+        for _ in range(self.random_generator.randint(1, 3)):
+            if depth and self.random_generator.random() < 0.5:
+                items.append("({})*{}".format(self.get_random_source(depth - 1), self.random_generator.randint(0, 9)))
+
+            else:
+                items.append("".join(self.random_generator.choices("LRFFf", k=self.random_generator.randint(1, 6))))
+
+        return "".join(items)
+
+    def test__given_valid_source__when_parse__then_program_tree(self):
+
+        # Given
+        macros = {"P": ProgramTree.parse("(FFRFF)*3")}
+
+        for source, expected_str, expected_instructions in [
+                ("(FFRFF)*2", "(FFRFF)*2", "FFRFFFFRFF"),
+                ("l ( f r ) * 2", "L(FR)*2", "LFRFR"),
+                ("L(F(RF)*2)*2", "L(F(RF)*2)*2", "LFRFRFFRFRF"),
+                ("$P*2F", "((FFRFF)*3)*2F", "FFRFF" * 6 + "F"),
+                ("()*5F", "()*5F", "F")]:
+
+            # When
+            result = ProgramTree.parse(source, macros)
+
+            # Then
+            self.assertEqual(str(result), expected_str)
+            self.assertEqual(len(result), len(expected_instructions))
+            self.assertEqual("".join(result), expected_instructions)
+            self.assertEqual(result.expand(), expected_instructions)
+
+    def test__given_invalid_source__when_parse__then_none(self):
+
+        # Given
+        for source in ["(F", "F)", "F*2", "*2", "(F)*", "(X)*2", "$UNDEFINED", "(F)*-1"]:
+
+            # When
+            result = ProgramTree.parse(source, {})
+
+            # Then
+            self.assertIsNone(result, source)
+
+    def test__given_macro_definition__when_parse_macro__then_name_and_program_tree(self):
+
+        # Given
+        macros = {"A": ProgramTree.parse("FR")}
+
+        # When
+        name, program_tree = ProgramTree.parse_macro("$B = ($A)*2L", macros)
+
+        # Then
+        self.assertEqual(name, "B")
+        self.assertEqual(program_tree.expand(), "FRFRL")
+        self.assertIs(program_tree.items[0].items[0], macros["A"])
+        self.assertIsNone(ProgramTree.parse_macro("$B (FR)*2", macros))
+        self.assertIsNone(ProgramTree.parse_macro("$B = $C", macros))
+
+    def test__given_equal_sources__when_parse__then_equal_program_trees(self):
+
+        # When
+        first = ProgramTree.parse("(F(LF)*2)*3")
+        second = ProgramTree.parse("(F(LF)*2)*3")
+
+        # Then
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, ProgramTree.parse("(F(LF)*2)*4"))
+
+    def test__given_random_program_trees__when_get_transfer_function__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for _ in range(20):
+                program_tree = ProgramTree.parse(self.get_random_source())
+                instruction_list = program_tree.expand()
+
+                # When
+                transfer_function = program_tree.get_transfer_function(4, 3)
+
+                # Then
+                for x in range(self.lawn.x_min, self.lawn.x_max + 1):
+                    for y in range(self.lawn.y_min, self.lawn.y_max + 1):
+                        for orientation in range(4):
+                            mower = Mower(x, y, Orientation(Orientation.int_to_str[orientation]), self.lawn)
+
+                            for instruction in instruction_list:
+                                mower.execute(instruction)
+
+                            self.assertTupleEqual(transfer_function.apply(x, y, orientation, self.lawn),
+                                                  (mower.x, mower.y, mower.orientation.orientation))
+
+    def test__given_random_program_trees__when_get_envelopes__then_same_as_expanded_program(self):
+
+        # Given
+        for _ in range(50):
+            program_tree = ProgramTree.parse(self.get_random_source(depth=3))
+
+            # When
+            result = program_tree.get_envelopes()
+
+            # Then
+            self.assertListEqual(result, Program.compile(program_tree.expand()).get_envelopes())
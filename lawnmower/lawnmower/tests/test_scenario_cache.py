@@ -0,0 +1,162 @@
+import os
+import tempfile
+from os.path import join
+from unittest import TestCase
+from unittest.mock import patch
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.scenario_cache import ScenarioCache
+from lawnmower.tests.testutils import captured_output, get_fixtures_path
+
+
+class TestScenarioCache(TestCase):
+
+    def setUp(self):
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.fixture_path = join(get_fixtures_path(), "config_file")
+        self.scenario_cache = ScenarioCache(folder=join(self.temporary_folder.name, "cache"), min_file_size=0)
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def write_file(self, filename, lines):
+        filepath = join(self.temporary_folder.name, filename)
+
+        with open(filepath, "w") as f:
+            f.writelines(lines)
+
+        return filepath
+
+    def test__given_empty_cache__when_load__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "single_mower_info_file.txt")
+
+            # When
+            result = self.scenario_cache.load(ConfigFile(), filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertListEqual(self.scenario_cache.get_entries(), [])
+
+    def test__given_loaded_config_file_with_cache__when_load_again__then_not_parsed_and_same_mowers(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "single_mower_info_file.txt")
+            self.assertTrue(ConfigFile(cache=self.scenario_cache).load(filepath))
+            self.assertEqual(len(self.scenario_cache.get_entries()), 1)
+
+            config_file = ConfigFile(cache=ScenarioCache(folder=self.scenario_cache.folder, min_file_size=0))
+
+            # When
+            with patch("lawnmower.src.config_file.ConfigFile.read_mowers") as read_mowers_mock:
+                result = config_file.load(filepath)
+
+            # Then
+            read_mowers_mock.assert_not_called()
+            self.assertTrue(result)
+            self.assertEqual(config_file.lawn_x_max, 5)
+            self.assertEqual(config_file.lawn_y_max, 6)
+            self.assertListEqual(list(config_file.mowers), [
+                {"initial_position": (1, 2), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"}])
+
+    def test__given_modified_config_file__when_load__then_new_entry(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = self.write_file("input.txt", ["5 5\n", "1 2 N\n", "LFLFLFLFF\n"])
+            ConfigFile(cache=self.scenario_cache).load(filepath)
+
+            self.write_file("input.txt", ["5 5\n", "1 2 N\n", "LFLFLFLFR\n"])
+            config_file = ConfigFile(cache=self.scenario_cache)
+
+            # When
+            result = config_file.load(filepath)
+
+            # Then
+            self.assertTrue(result)
+            self.assertEqual(len(self.scenario_cache.get_entries()), 2)
+            self.assertEqual(config_file.mowers[0]["instruction_list"], "LFLFLFLFR")
+
+    def test__given_invalid_instructions__when_store__then_not_stored(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "multi_mower_info_error_in_second_mower_instructions_file.txt")
+            config_file = ConfigFile()
+            config_file.load(filepath)
+
+            # When
+            result = self.scenario_cache.store(config_file, filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertListEqual(self.scenario_cache.get_entries(), [])
+            self.assertListEqual(os.listdir(self.scenario_cache.folder), [])
+
+    def test__given_small_config_file__when_store__then_not_stored(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "single_mower_info_file.txt")
+            config_file = ConfigFile()
+            config_file.load(filepath)
+            self.scenario_cache.min_file_size = 1 << 20
+
+            # When
+            result = self.scenario_cache.store(config_file, filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertListEqual(self.scenario_cache.get_entries(), [])
+
+    def test__given_cache_full__when_store__then_least_recently_used_entries_evicted(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepaths = [self.write_file("input{}.txt".format(index), ["5 5\n", "1 2 N\n", "F" * (index + 1) + "\n"])
+                         for index in range(3)]
+
+            for filepath in filepaths[:2]:
+                ConfigFile(cache=self.scenario_cache).load(filepath)
+
+            entry_size = self.scenario_cache.get_entries()[0][1]
+            self.scenario_cache.max_size = 2 * entry_size
+
+            # Use the first one again, so that the second one becomes the least recently used
+            os.utime(self.scenario_cache.get_entry_path(filepaths[0]), ns=(1, 1))
+            os.utime(self.scenario_cache.get_entry_path(filepaths[1]), ns=(0, 0))
+            ConfigFile(cache=self.scenario_cache).load(filepaths[0])
+
+            # When
+            result = ConfigFile(cache=self.scenario_cache).load(filepaths[2])
+
+            # Then
+            self.assertTrue(result)
+            self.assertListEqual(sorted(path for path, _ in self.scenario_cache.get_entries()),
+                                 sorted([self.scenario_cache.get_entry_path(filepaths[0]),
+                                         self.scenario_cache.get_entry_path(filepaths[2])]))
+
+    def test__given_several_entries__when_clear__then_all_removed(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for index in range(3):
+                filepath = self.write_file("input{}.txt".format(index), ["5 5\n", "1 2 N\n", "F" * index + "L\n"])
+                ConfigFile(cache=self.scenario_cache).load(filepath)
+
+            # When
+            result = self.scenario_cache.clear()
+
+            # Then
+            self.assertEqual(result, 3)
+            self.assertListEqual(self.scenario_cache.get_entries(), [])
@@ -0,0 +1,159 @@
+import os
+import tempfile
+from os.path import join
+from unittest import TestCase
+
+from lawnmower.src.config_file import ConfigFile
+from lawnmower.src.scenario_file import BinaryScenarioFile, convert
+from lawnmower.tests.testutils import captured_output, get_fixtures_path
+
+
+class TestBinaryScenarioFile(TestCase):
+
+    def setUp(self):
+        self.binary_scenario_file = BinaryScenarioFile()
+        self.fixture_path = join(get_fixtures_path(), "config_file")
+        self.temporary_folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test__given_instruction_list__when_pack_and_unpack_opcodes__then_same_opcodes(self):
+
+        with captured_output() as (out, err):
+
+            for instruction_list in ["", "F", "LR", "LFR", "LFRF", "lfrfF", "FFRFFRFRRFLLLF" * 37]:
+
+                # When
+                packed = BinaryScenarioFile.pack_opcodes(instruction_list)
+                result = BinaryScenarioFile.unpack_opcodes(packed, len(instruction_list))
+
+                # Then
+                self.assertEqual(len(packed), (len(instruction_list) + 3) // 4)
+                self.assertEqual(result.translate(BinaryScenarioFile.opcodes_to_instructions),
+                                 instruction_list.upper().encode())
+
+    def test__given_invalid_instructions__when_pack_opcodes__then_return_none(self):
+
+        with captured_output() as (out, err):
+
+            for instruction_list in ["LFX", "LF RF", "F2", "Fñ"]:
+
+                # When + Then
+                self.assertIsNone(BinaryScenarioFile.pack_opcodes(instruction_list))
+
+    def test__given_invalid_instructions__when_save__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.temporary_folder.name, "scenario.lmwb")
+            mowers = [{"initial_position": ("1", "2"), "initial_orientation": "N", "instruction_list": "LF RF"}]
+
+            # When
+            result = BinaryScenarioFile.save("5", "5", mowers, filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertFalse(os.path.exists(filepath))
+
+    def test__given_saved_scenario__when_load__then_same_info(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.temporary_folder.name, "scenario.lmwb")
+            mowers = [{"initial_position": ("1", "2"), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"},
+                      {"initial_position": ("3", "3"), "initial_orientation": "E", "instruction_list": "ffrFFRFRRF"}]
+            self.assertTrue(BinaryScenarioFile.save("5", "6", mowers, filepath))
+
+            # When
+            result = self.binary_scenario_file.load(filepath)
+
+            # Then
+            self.assertTrue(result)
+            self.assertTrue(BinaryScenarioFile.is_binary_scenario_file(filepath))
+            self.assertEqual(self.binary_scenario_file.lawn_x_max, 5)
+            self.assertEqual(self.binary_scenario_file.lawn_y_max, 6)
+            self.assertEqual(len(self.binary_scenario_file.mowers), 2)
+            self.assertListEqual(list(self.binary_scenario_file.mowers), [
+                {"initial_position": (1, 2), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"},
+                {"initial_position": (3, 3), "initial_orientation": "E", "instruction_list": "FFRFFRFRRF"}])
+            self.assertEqual(self.binary_scenario_file.mowers.get_opcodes(-1), b"\x02\x02\x01\x02\x02\x01\x02\x01"
+                                                                               b"\x01\x02")
+
+    def test__given_text_file__when_load__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.fixture_path, "single_mower_info_file.txt")
+
+            # When
+            result = self.binary_scenario_file.load(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertFalse(BinaryScenarioFile.is_binary_scenario_file(filepath))
+            self.assertIsNone(self.binary_scenario_file.lawn_x_max)
+            self.assertIsNone(self.binary_scenario_file.lawn_y_max)
+            self.assertListEqual(self.binary_scenario_file.mowers, [])
+
+    def test__given_truncated_file__when_load__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.temporary_folder.name, "scenario.lmwb")
+            mowers = [{"initial_position": ("1", "2"), "initial_orientation": "N", "instruction_list": "LFLFLFLFF"},
+                      {"initial_position": ("3", "3"), "initial_orientation": "E", "instruction_list": "FFRFFRFRRF"}]
+            self.assertTrue(BinaryScenarioFile.save("5", "6", mowers, filepath))
+
+            with open(filepath, "r+b") as f:
+                f.truncate(os.path.getsize(filepath) - 1)
+
+            # When
+            result = self.binary_scenario_file.load(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertIn("Invalid file", out.getvalue())
+            self.assertIsNone(self.binary_scenario_file.lawn_x_max)
+            self.assertIsNone(self.binary_scenario_file.lawn_y_max)
+            self.assertListEqual(self.binary_scenario_file.mowers, [])
+
+    def test__given_missing_file__when_load__then_return_false(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            filepath = join(self.temporary_folder.name, "missing_file.lmwb")
+
+            # When
+            result = self.binary_scenario_file.load(filepath)
+
+            # Then
+            self.assertFalse(result)
+            self.assertFalse(BinaryScenarioFile.is_binary_scenario_file(filepath))
+
+    def test__given_converted_text_file__when_config_file_load__then_binary_detected_and_same_mowers(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            text_filepath = join(self.fixture_path, "single_mower_info_file.txt")
+            filepath = join(self.temporary_folder.name, "scenario.lmwb")
+            self.assertTrue(convert(text_filepath, filepath))
+
+            expected_config_file = ConfigFile(compact=True)
+            expected_config_file.load(text_filepath)
+            config_file = ConfigFile()
+
+            # When
+            result = config_file.load(filepath)
+
+            # Then
+            self.assertTrue(result)
+            self.assertEqual(config_file.lawn_x_max, 5)
+            self.assertEqual(config_file.lawn_y_max, 6)
+            self.assertListEqual(list(config_file.mowers), list(expected_config_file.mowers))
@@ -1,7 +1,11 @@
-from unittest import TestCase
+import random
+from unittest import TestCase, skipUnless
 from unittest.mock import patch, call, Mock
 
+from lawnmower.src.fleet import FleetSimulator
+from lawnmower.src.program_tree import ProgramTree
 from lawnmower.src.scheduler import Scheduler
+from lawnmower.src.simultaneous_fleet import SimultaneousFleetSimulator
 from lawnmower.tests.testutils import captured_output
 
 
@@ -329,3 +333,471 @@ class TestScheduler(TestCase):
             self.assertEqual(self.scheduler.mowers[1].orientation.get_str(), "E")
 
             print_mock.assert_called()
+
+    def test__given_mowers_info_generator_and_mower_overlapping_and_not_keep_mowers__when_iter_run__then_ok(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock()
+            config_file_mock.lawn_x_max = "5"
+            config_file_mock.lawn_y_max = "5"
+            config_file_mock.mowers = []
+
+            mowers_info = (mower_info for mower_info in [
+                {"initial_orientation": "N", "initial_position": ("1", "2"), "instruction_list": "LFLFLFLFF"},
+                {"initial_orientation": "E", "initial_position": ("3", "3"), "instruction_list": "FFRFFRFRRF"}
+            ])
+
+            self.scheduler.config_file = config_file_mock
+            self.scheduler.mower_overlapping = True
+
+            # When
+            result = [(mower.x, mower.y, mower.orientation.get_str())
+                      for mower in self.scheduler.iter_run(mowers_info=mowers_info, keep_mowers=False)]
+
+            # Then
+            self.assertListEqual(result, [(1, 3, "N"), (5, 1, "E")])
+            self.assertEqual(len(self.scheduler.mowers), 0)
+
+    def test__given_mowers_info_generator_and_no_mower_overlapping_and_not_keep_mowers__when_iter_run__then_ok(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock()
+            config_file_mock.lawn_x_max = "5"
+            config_file_mock.lawn_y_max = "5"
+            config_file_mock.mowers = []
+
+            # Notice that mower2 starts just facing the expected final position of mower1
+            mowers_info = (mower_info for mower_info in [
+                {"initial_orientation": "N", "initial_position": ("1", "2"), "instruction_list": "LFLFLFLFF"},
+                {"initial_orientation": "S", "initial_position": ("1", "4"), "instruction_list": "FFRFFRFRRF"}
+            ])
+
+            self.scheduler.config_file = config_file_mock
+            self.scheduler.mower_overlapping = False
+
+            # When
+            result = [(mower.x, mower.y, mower.orientation.get_str())
+                      for mower in self.scheduler.iter_run(mowers_info=mowers_info, keep_mowers=False)]
+
+            # Then
+            self.assertListEqual(result, [(1, 3, "N"), (0, 4, "S")])
+
+            # Prior mowers are always needed to check collisions
+            self.assertEqual(len(self.scheduler.mowers), 2)
+
+    def test__given_run_length_encoded_instruction_lists__when_run__then_same_as_expanded_instruction_lists(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(0)
+
+            for mower_overlapping in [True, False]:
+                for _ in range(20):
+                    runs_list = [[(random_generator.choice("LRFF"), random_generator.randint(0, 12))
+                                  for _ in range(random_generator.randint(1, 8))] for _ in range(6)]
+                    mowers_info = [{"initial_orientation": random_generator.choice("NESW"),
+                                    "initial_position": (random_generator.randint(0, 7),
+                                                         random_generator.randint(0, 5))} for _ in runs_list]
+
+                    expected_scheduler = Scheduler(Mock(lawn_x_max=7, lawn_y_max=5), mower_overlapping)
+                    expected_scheduler.config_file.mowers = [
+                        dict(mower_info, instruction_list="".join(instruction * count for instruction, count in runs))
+                        for mower_info, runs in zip(mowers_info, runs_list)]
+                    expected_scheduler.run()
+
+                    scheduler = Scheduler(Mock(lawn_x_max=7, lawn_y_max=5), mower_overlapping)
+                    scheduler.config_file.mowers = [
+                        dict(mower_info, instruction_list=" ".join("{}{}".format(instruction, count)
+                                                                   for instruction, count in runs))
+                        for mower_info, runs in zip(mowers_info, runs_list)]
+
+                    # When
+                    scheduler.run()
+
+                    # Then
+                    self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    def test__given_random_instruction_lists__when_run_compiled_programs__then_same_as_not_compiled(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(1)
+
+            for mower_overlapping in [True, False]:
+                for _ in range(20):
+                    config_file_mock = Mock(lawn_x_max=7, lawn_y_max=5)
+                    config_file_mock.mowers = [
+                        {"initial_orientation": random_generator.choice("NESW"),
+                         "initial_position": (random_generator.randint(0, 7), random_generator.randint(0, 5)),
+                         "instruction_list": "".join(random_generator.choices("LRFFfF",
+                                                                              k=random_generator.randint(0, 40)))}
+                        for _ in range(8)]
+
+                    # Some invalid instruction lists (executed instruction by instruction anyway)
+                    config_file_mock.mowers[0]["instruction_list"] += "X"
+
+                    expected_scheduler = Scheduler(config_file_mock, mower_overlapping, compile_programs=False)
+                    expected_scheduler.run()
+
+                    scheduler = Scheduler(config_file_mock, mower_overlapping, compile_programs=True)
+
+                    # When
+                    scheduler.run()
+
+                    # Then
+                    self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    def test__given_mowers_sharing_instruction_lists__when_run_cached_programs__then_same_as_not_compiled(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(2)
+            instruction_lists = ["".join(random_generator.choices("LRFFF", k=30)) for _ in range(3)] + ["FFX"]
+
+            for mower_overlapping in [True, False]:
+                config_file_mock = Mock(lawn_x_max=3, lawn_y_max=2)
+                config_file_mock.mowers = [
+                    {"initial_orientation": random_generator.choice("NESW"),
+                     "initial_position": (random_generator.randint(0, 3), random_generator.randint(0, 2)),
+                     "instruction_list": random_generator.choice(instruction_lists)}
+                    for _ in range(200)]
+
+                expected_scheduler = Scheduler(config_file_mock, mower_overlapping, compile_programs=False)
+                expected_scheduler.run()
+
+                scheduler = Scheduler(config_file_mock, mower_overlapping, cache_programs=True)
+
+                # When
+                scheduler.run()
+
+                # Then
+                self.assertEqual(repr(scheduler), repr(expected_scheduler))
+                self.assertEqual(len(scheduler.programs.programs), len(instruction_lists))
+
+                if mower_overlapping:
+                    # Small lawn: results come from the program tables
+                    self.assertGreater(scheduler.programs.hits, 0)
+                    self.assertEqual(len(scheduler.programs.tables), len(instruction_lists) - 1)
+
+    def test__given_random_instruction_lists__when_run_vectorized__then_same_as_not_compiled(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(3)
+            config_file_mock = Mock(lawn_x_max=7, lawn_y_max=5)
+            config_file_mock.mowers = [
+                {"initial_orientation": random_generator.choice("NESW"),
+                 "initial_position": (random_generator.randint(0, 7), random_generator.randint(0, 5)),
+                 "instruction_list": "".join(random_generator.choices("LRFFfF", k=random_generator.randint(0, 40)))}
+                for _ in range(50)]
+
+            # Invalid and run-length encoded instruction lists (not run by the fleet simulator)
+            config_file_mock.mowers[0]["instruction_list"] += "X"
+            config_file_mock.mowers[1]["instruction_list"] = "F3 R F2"
+
+            expected_scheduler = Scheduler(config_file_mock, mower_overlapping=True, compile_programs=False)
+            expected_scheduler.run()
+
+            scheduler = Scheduler(config_file_mock, mower_overlapping=True, vectorized=True)
+
+            # When
+            scheduler.run()
+
+            # Then
+            self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    def test__given_huge_instruction_lists_and_several_processes__when_run__then_same_as_not_compiled(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(4)
+            config_file_mock = Mock(lawn_x_max=7, lawn_y_max=5)
+            config_file_mock.mowers = [
+                {"initial_orientation": random_generator.choice("NESW"),
+                 "initial_position": (random_generator.randint(0, 7), random_generator.randint(0, 5)),
+                 "instruction_list": "".join(random_generator.choices("LRFFfF", k=random_generator.randint(0, 400)))}
+                for _ in range(5)]
+
+            # Invalid instruction list (executed instruction by instruction anyway)
+            config_file_mock.mowers[0]["instruction_list"] += "X"
+
+            expected_scheduler = Scheduler(config_file_mock, mower_overlapping=True, compile_programs=False)
+            expected_scheduler.run()
+
+            scheduler = Scheduler(config_file_mock, mower_overlapping=True, processes=2)
+            scheduler.parallel_min_instructions = 100
+            scheduler.parallel_compiler.chunk_size = 64
+
+            # When
+            scheduler.run()
+
+            # Then
+            self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    def test__given_program_trees__when_run__then_same_as_expanded_instruction_lists(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(5)
+
+            for mower_overlapping in [True, False]:
+                for _ in range(10):
+                    program_trees = [ProgramTree.parse("{}({})*{}".format(
+                        "".join(random_generator.choices("LRF", k=random_generator.randint(0, 3))),
+                        "".join(random_generator.choices("LRFFF", k=random_generator.randint(1, 6))),
+                        random_generator.randint(0, 50))) for _ in range(6)]
+                    mowers_info = [{"initial_orientation": random_generator.choice("NESW"),
+                                    "initial_position": (random_generator.randint(0, 7),
+                                                         random_generator.randint(0, 5))} for _ in program_trees]
+
+                    expected_scheduler = Scheduler(Mock(lawn_x_max=7, lawn_y_max=5), mower_overlapping,
+                                                   compile_programs=False)
+                    expected_scheduler.config_file.mowers = [
+                        dict(mower_info, instruction_list=program_tree.expand())
+                        for mower_info, program_tree in zip(mowers_info, program_trees)]
+                    expected_scheduler.run()
+
+                    for compile_programs in [True, False]:
+                        scheduler = Scheduler(Mock(lawn_x_max=7, lawn_y_max=5), mower_overlapping,
+                                              compile_programs=compile_programs)
+                        scheduler.config_file.mowers = [dict(mower_info, instruction_list=program_tree)
+                                                        for mower_info, program_tree in zip(mowers_info, program_trees)]
+
+                        # When
+                        scheduler.run()
+
+                        # Then
+                        self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    def test__given_prior_mowers__when_is_prior_mower_position__then_only_their_final_positions(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock(lawn_x_max=5, lawn_y_max=5)
+            config_file_mock.mowers = [{"initial_orientation": "N", "initial_position": ("1", "2"),
+                                        "instruction_list": "FF"},
+                                       {"initial_orientation": "E", "initial_position": ("3", "3"),
+                                        "instruction_list": "F"}]
+            scheduler = Scheduler(config_file_mock)
+            scheduler.run()
+
+            # When
+            result = [(x, y) for x in range(6) for y in range(6) if scheduler.is_prior_mower_position(x, y)]
+
+            # Then
+            self.assertListEqual(result, [(1, 4), (4, 3)])
+
+    def test__given_lawn_and_fleet_sizes__when_create_occupancy__then_grid_only_when_better_unless_overridden(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for lawn_size, mower_count, occupancy_grid, expected_class_name in [
+                    (5, None, None, "OccupancyGrid"),
+                    (999, None, None, "OccupancyIndex"),
+                    (999, 10, None, "OccupancyIndex"),
+                    (999, 10 ** 5, None, "OccupancyGrid"),
+                    (9999, 10 ** 8, None, "OccupancyIndex"),
+                    (5, None, False, "OccupancyIndex"),
+                    (999, 10, True, "OccupancyGrid")]:
+                scheduler = Scheduler(Mock(lawn_x_max=lawn_size, lawn_y_max=lawn_size), occupancy_grid=occupancy_grid)
+
+                # When
+                scheduler.init_scheduler(mower_count=mower_count)
+
+                # Then
+                self.assertEqual(type(scheduler.occupancy).__name__, expected_class_name)
+
+    def test__given_random_instruction_lists__when_run_with_occupancy_grid__then_same_as_occupancy_index(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(2)
+
+            for compile_programs in [True, False]:
+                for _ in range(20):
+                    config_file_mock = Mock(lawn_x_max=7, lawn_y_max=5)
+                    config_file_mock.mowers = [
+                        {"initial_orientation": random_generator.choice("NESW"),
+                         "initial_position": (random_generator.randint(0, 7), random_generator.randint(0, 5)),
+                         "instruction_list": random_generator.choice([
+                             "".join(random_generator.choices("LRFFF", k=random_generator.randint(0, 40))),
+                             "F{}RF{}".format(random_generator.randint(0, 9), random_generator.randint(0, 9)),
+                             "(F{}R)*{}".format("F" * random_generator.randint(0, 4), random_generator.randint(0, 9))])}
+                        for _ in range(12)]
+
+                    expected_scheduler = Scheduler(config_file_mock, compile_programs=compile_programs,
+                                                   occupancy_grid=False)
+                    expected_scheduler.run()
+
+                    scheduler = Scheduler(config_file_mock, compile_programs=compile_programs, occupancy_grid=True)
+
+                    # When
+                    scheduler.run()
+
+                    # Then
+                    self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    def test__given_mowers_moving_at_once__when_run_simultaneous__then_each_tick_at_once(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock(lawn_x_max=5, lawn_y_max=5)
+            config_file_mock.mowers = [{"initial_orientation": "N", "initial_position": ("1", "1"),
+                                        "instruction_list": "FFF"},
+                                       {"initial_orientation": "N", "initial_position": ("1", "2"),
+                                        "instruction_list": "FFF"}]
+            scheduler = Scheduler(config_file_mock, simultaneous=True)
+            sequential_scheduler = Scheduler(config_file_mock)
+
+            # When
+            scheduler.run()
+            sequential_scheduler.run()
+
+            # Then
+            self.assertEqual(repr(scheduler), "1 4 N\n1 5 N\n")
+            self.assertEqual(repr(sequential_scheduler), "1 4 N\n1 3 N\n")
+
+    def test__given_mowers_swapping_cells__when_run_simultaneous__then_only_without_mower_overlapping(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock(lawn_x_max=5, lawn_y_max=5)
+            config_file_mock.mowers = [{"initial_orientation": "E", "initial_position": ("1", "1"),
+                                        "instruction_list": "F"},
+                                       {"initial_orientation": "W", "initial_position": ("2", "1"),
+                                        "instruction_list": "F"}]
+
+            for mower_overlapping, expected_result in [(False, "1 1 E\n2 1 W\n"), (True, "2 1 E\n1 1 W\n")]:
+                scheduler = Scheduler(config_file_mock, mower_overlapping, simultaneous=True)
+
+                # When
+                scheduler.run()
+
+                # Then
+                self.assertEqual(repr(scheduler), expected_result)
+
+    @skipUnless(SimultaneousFleetSimulator.is_available(), "NumPy not installed")
+    def test__given_random_instruction_lists__when_run_simultaneous_vectorized__then_same_as_not_vectorized(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(5)
+            config_file_mock = Mock(lawn_x_max=7, lawn_y_max=5)
+            config_file_mock.mowers = [
+                {"initial_orientation": random_generator.choice("NESW"),
+                 "initial_position": (random_generator.randint(0, 7), random_generator.randint(0, 5)),
+                 "instruction_list": "".join(random_generator.choices("LRFFXF", k=random_generator.randint(0, 40)))}
+                for _ in range(30)]
+
+            # Not properly initialized mower (it does not take part in it)
+            config_file_mock.mowers[0]["initial_orientation"] = "X"
+
+            expected_scheduler = Scheduler(config_file_mock, simultaneous=True)
+            expected_scheduler.run()
+
+            scheduler = Scheduler(config_file_mock, simultaneous=True, vectorized=True)
+
+            # When
+            scheduler.run()
+
+            # Then
+            self.assertEqual(repr(scheduler), repr(expected_scheduler))
+            self.assertEqual({type(mower.x) for mower in scheduler.mowers}, {int})
+
+    def test__given_random_instruction_lists_and_several_processes__when_run__then_same_as_single_process(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(6)
+            config_file_mock = Mock(lawn_x_max=7, lawn_y_max=5)
+            config_file_mock.mowers = [
+                {"initial_orientation": random_generator.choice("NESW"),
+                 "initial_position": (random_generator.randint(0, 7), random_generator.randint(0, 5)),
+                 "instruction_list": "".join(random_generator.choices("LRFFF", k=random_generator.randint(0, 200)))}
+                for _ in range(40)]
+
+            # Invalid, run-length encoded and program tree instruction lists
+            config_file_mock.mowers[0]["instruction_list"] += "X"
+            config_file_mock.mowers[1]["instruction_list"] = "F3 R F2"
+            config_file_mock.mowers[2]["instruction_list"] = ProgramTree.parse("L(FFRFF)*1000")
+
+            expected_scheduler = Scheduler(config_file_mock, mower_overlapping=True)
+            expected_scheduler.run()
+
+            scheduler = Scheduler(config_file_mock, mower_overlapping=True, processes=2)
+            scheduler.parallel_runner.min_chunk_instructions = 256
+
+            # When
+            scheduler.run()
+
+            # Then
+            self.assertEqual(repr(scheduler), repr(expected_scheduler))
+            self.assertEqual(len(scheduler.mowers), 40)
+
+    def test__given_invalid_second_mower_and_several_processes__when_run__then_prior_mowers_still_run(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock(lawn_x_max=5, lawn_y_max=5)
+            config_file_mock.mowers = [{"initial_orientation": "N", "initial_position": ("1", "2"),
+                                        "instruction_list": "LFLFLFLFF"},
+                                       {"initial_orientation": "N", "initial_position": ("9", "9"),
+                                        "instruction_list": "F"},
+                                       {"initial_orientation": "E", "initial_position": ("3", "3"),
+                                        "instruction_list": "FFRFFRFRRF"}]
+
+            expected_scheduler = Scheduler(config_file_mock, mower_overlapping=True)
+            expected_scheduler.run()
+
+            scheduler = Scheduler(config_file_mock, mower_overlapping=True, processes=2)
+
+            # When
+            scheduler.run()
+
+            # Then
+            self.assertEqual(repr(expected_scheduler), "1 3 N\n")
+            self.assertEqual(repr(scheduler), repr(expected_scheduler))
+
+    @skipUnless(FleetSimulator.is_available(), "NumPy not installed")
+    def test__given_invalid_second_mower__when_run_vectorized__then_prior_mowers_still_run(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            config_file_mock = Mock(lawn_x_max=5, lawn_y_max=5)
+            config_file_mock.mowers = [{"initial_orientation": "N", "initial_position": ("1", "2"),
+                                        "instruction_list": "LFLFLFLFF"},
+                                       {"initial_orientation": "N", "initial_position": ("9", "9"),
+                                        "instruction_list": "F"},
+                                       {"initial_orientation": "E", "initial_position": ("3", "3"),
+                                        "instruction_list": "FFRFFRFRRF"}]
+
+            expected_scheduler = Scheduler(config_file_mock, mower_overlapping=True)
+            expected_scheduler.run()
+
+            scheduler = Scheduler(config_file_mock, mower_overlapping=True, vectorized=True)
+
+            # When
+            scheduler.run()
+
+            # Then
+            self.assertEqual(repr(expected_scheduler), "1 3 N\n")
+            self.assertEqual(repr(scheduler), repr(expected_scheduler))
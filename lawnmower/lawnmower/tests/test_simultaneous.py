@@ -0,0 +1,171 @@
+import random
+from unittest import TestCase
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.program_tree import ProgramTree
+from lawnmower.src.simultaneous import SimultaneousSimulator
+from lawnmower.tests.testutils import captured_output
+
+
+class TestSimultaneousSimulator(TestCase):
+
+    def setUp(self):
+        self.lawn = Lawn(x_max=6, y_max=5, x_min=1, y_min=1)
+        self.simulator = SimultaneousSimulator(self.lawn)
+
+    def tearDown(self):
+        pass
+
+    def add_mowers(self, mowers):
+        for x, y, orientation, instruction_list in mowers:
+            self.simulator.add(x, y, Orientation.str_to_int[orientation],
+                               SimultaneousSimulator.get_opcodes(instruction_list))
+
+    def run_simulator(self):
+        return [(x, y, Orientation.int_to_str[orientation]) for x, y, orientation in zip(*self.simulator.run())]
+
+    def test__given_instruction_lists__when_get_opcodes__then_one_opcode_per_tick(self):
+
+        with captured_output() as (out, err):
+
+            # When + Then
+            self.assertEqual(SimultaneousSimulator.get_opcodes("LRFlrf"), b"\x00\x01\x02\x00\x01\x02")
+            self.assertEqual(SimultaneousSimulator.get_opcodes("FXL"), b"\x02\x03\x00")
+            self.assertEqual(SimultaneousSimulator.get_opcodes("F3L"), b"\x02\x02\x02\x00")
+            self.assertEqual(SimultaneousSimulator.get_opcodes(ProgramTree.parse("(FR)*2")), b"\x02\x01\x02\x01")
+            self.assertEqual(SimultaneousSimulator.get_opcodes(None), b"")
+
+    def test__given_random_single_mower__when_run__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(0)
+
+            for _ in range(20):
+                self.simulator = SimultaneousSimulator(self.lawn)
+                x, y = random_generator.randint(1, 6), random_generator.randint(1, 5)
+                orientation = random_generator.choice("NESW")
+                instruction_list = "".join(random_generator.choices("LRFFX", k=random_generator.randint(0, 30)))
+                self.add_mowers([(x, y, orientation, instruction_list)])
+
+                mower = Mower(x, y, Orientation(orientation), self.lawn)
+
+                for instruction in instruction_list:
+                    mower.execute(instruction)
+
+                # When
+                result = self.run_simulator()
+
+                # Then
+                self.assertListEqual(result, [(mower.x, mower.y, mower.orientation.get_str())])
+
+    def test__given_mowers_targeting_same_cell__when_run__then_only_first_one_enters_it(self):
+
+        # Given
+        self.add_mowers([(3, 2, "E", "F"), (5, 2, "W", "F"), (4, 1, "N", "F")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(4, 2, "E"), (5, 2, "W"), (4, 1, "N")])
+
+    def test__given_mowers_swapping_cells__when_run__then_none_of_them_moves(self):
+
+        # Given
+        self.add_mowers([(3, 2, "E", "FR"), (4, 2, "W", "FR")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(3, 2, "S"), (4, 2, "N")])
+
+    def test__given_line_of_mowers_moving_together__when_run__then_all_of_them_move(self):
+
+        # Given
+        self.add_mowers([(2, 3, "E", "FF"), (3, 3, "E", "FF"), (4, 3, "E", "FF")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(4, 3, "E"), (5, 3, "E"), (6, 3, "E")])
+
+    def test__given_line_of_mowers_blocked_by_lawn_edge__when_run__then_none_of_them_moves(self):
+
+        # Given
+        self.add_mowers([(4, 3, "E", "F"), (5, 3, "E", "F"), (6, 3, "E", "F")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(4, 3, "E"), (5, 3, "E"), (6, 3, "E")])
+
+    def test__given_mower_blocked_by_finished_mower__when_run__then_it_stays_just_behind(self):
+
+        # Given
+        self.add_mowers([(2, 2, "N", "FFF"), (2, 4, "N", "")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(2, 3, "N"), (2, 4, "N")])
+
+    def test__given_mower_following_mower_which_stops__when_run__then_it_waits_until_it_leaves(self):
+
+        # Given
+        self.add_mowers([(2, 1, "N", "FFFF"), (2, 2, "N", "FRF")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(2, 4, "N"), (3, 3, "E")])
+
+    def test__given_closed_loop_of_four_mowers__when_run__then_all_of_them_move(self):
+
+        # Given
+        self.add_mowers([(2, 2, "N", "F"), (2, 3, "E", "F"), (3, 3, "S", "F"), (3, 2, "W", "F")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(2, 3, "N"), (3, 3, "E"), (3, 2, "S"), (2, 2, "W")])
+
+    def test__given_mowers_sharing_initial_cell__when_run__then_cell_free_once_all_of_them_leave(self):
+
+        # Given
+        self.add_mowers([(3, 3, "N", "F"), (3, 3, "S", "LF"), (3, 2, "N", "FF")])
+
+        # When
+        result = self.run_simulator()
+
+        # Then
+        self.assertListEqual(result, [(3, 4, "N"), (4, 3, "E"), (3, 3, "N")])
+
+    def test__given_random_fleet_in_distinct_cells__when_run__then_never_two_mowers_in_same_cell(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            random_generator = random.Random(1)
+
+            for _ in range(20):
+                self.simulator = SimultaneousSimulator(self.lawn)
+                cells = random_generator.sample([(x, y) for x in range(1, 7) for y in range(1, 6)], 20)
+                self.add_mowers([(x, y, random_generator.choice("NESW"),
+                                  "".join(random_generator.choices("LRFFF", k=random_generator.randint(0, 30))))
+                                 for x, y in cells])
+
+                # When
+                result = self.run_simulator()
+
+                # Then
+                self.assertEqual(len({(x, y) for x, y, _ in result}), len(result))
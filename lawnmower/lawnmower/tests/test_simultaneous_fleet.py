@@ -0,0 +1,107 @@
+import random
+from unittest import TestCase, skipUnless
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.simultaneous import SimultaneousSimulator
+from lawnmower.src.simultaneous_fleet import SimultaneousFleetSimulator
+from lawnmower.tests.testutils import captured_output
+
+
+@skipUnless(SimultaneousFleetSimulator.is_available(), "NumPy not installed")
+class TestSimultaneousFleetSimulator(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+        self.lawn = Lawn(x_max=6, y_max=5, x_min=1, y_min=1)
+
+    def tearDown(self):
+        pass
+
+    @staticmethod
+    def run_simulator(simulator, mowers):
+        for x, y, orientation, instruction_list in mowers:
+            simulator.add(x, y, Orientation.str_to_int[orientation], simulator.get_opcodes(instruction_list))
+
+        return [(x, y, Orientation.int_to_str[orientation])
+                for x, y, orientation in zip(*(list(values) for values in simulator.run()))]
+
+    def test__given_empty_fleet__when_run__then_empty_result(self):
+
+        # Given
+        simulator = SimultaneousFleetSimulator(self.lawn)
+
+        # When
+        x, y, orientation = simulator.run()
+
+        # Then
+        self.assertListEqual(x.tolist(), [])
+        self.assertListEqual(y.tolist(), [])
+        self.assertListEqual(orientation.tolist(), [])
+
+    def test__given_conflicting_mowers__when_run__then_same_rules_as_simultaneous_simulator(self):
+
+        # Given
+        for mowers, expected_result in [
+                ([(3, 2, "E", "F"), (5, 2, "W", "F"), (4, 1, "N", "F")], [(4, 2, "E"), (5, 2, "W"), (4, 1, "N")]),
+                ([(3, 2, "E", "FR"), (4, 2, "W", "FR")], [(3, 2, "S"), (4, 2, "N")]),
+                ([(2, 3, "E", "FF"), (3, 3, "E", "FF"), (4, 3, "E", "FF")], [(4, 3, "E"), (5, 3, "E"), (6, 3, "E")]),
+                ([(4, 3, "E", "F"), (5, 3, "E", "F"), (6, 3, "E", "F")], [(4, 3, "E"), (5, 3, "E"), (6, 3, "E")]),
+                ([(2, 2, "N", "FFF"), (2, 4, "N", "")], [(2, 3, "N"), (2, 4, "N")]),
+                ([(2, 1, "N", "FFFF"), (2, 2, "N", "FRF")], [(2, 4, "N"), (3, 3, "E")]),
+                ([(2, 2, "N", "F"), (2, 3, "E", "F"), (3, 3, "S", "F"), (3, 2, "W", "F")],
+                 [(2, 3, "N"), (3, 3, "E"), (3, 2, "S"), (2, 2, "W")]),
+                ([(3, 3, "N", "F"), (3, 3, "S", "LF"), (3, 2, "N", "FF")], [(3, 4, "N"), (4, 3, "E"), (3, 3, "N")])]:
+
+            for dense_max_cells in [SimultaneousFleetSimulator.dense_max_cells, 0]:
+                simulator = SimultaneousFleetSimulator(self.lawn)
+                simulator.dense_max_cells = dense_max_cells
+
+                # When
+                result = self.run_simulator(simulator, mowers)
+
+                # Then
+                self.assertListEqual(result, expected_result)
+
+    def test__given_random_fleet__when_run__then_same_as_simultaneous_simulator(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for trial in range(60):
+                lawn = Lawn(x_max=self.random_generator.randint(0, 7), y_max=self.random_generator.randint(0, 7))
+                mowers = [(self.random_generator.randint(0, lawn.x_max), self.random_generator.randint(0, lawn.y_max),
+                           self.random_generator.choice("NESW"),
+                           "".join(self.random_generator.choices("LRFFFX", k=self.random_generator.randint(0, 40))))
+                          for _ in range(self.random_generator.randint(1, 40))]
+                expected_result = self.run_simulator(SimultaneousSimulator(lawn), mowers)
+
+                simulator = SimultaneousFleetSimulator(lawn)
+                simulator.dense_max_cells = 0 if trial % 2 else SimultaneousFleetSimulator.dense_max_cells
+                simulator.block_size = self.random_generator.randint(1, 50)
+
+                # When
+                result = self.run_simulator(simulator, mowers)
+
+                # Then
+                self.assertListEqual(result, expected_result)
+
+    def test__given_huge_lawn__when_run__then_same_as_simultaneous_simulator(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            lawn = Lawn(x_max=10 ** 6, y_max=10 ** 6, x_min=-10 ** 6, y_min=-10 ** 6)
+            mowers = [(self.random_generator.randint(-3, 3), self.random_generator.randint(-3, 3),
+                       self.random_generator.choice("NESW"),
+                       "".join(self.random_generator.choices("LRFFF", k=self.random_generator.randint(0, 40))))
+                      for _ in range(30)]
+            mowers.append((10 ** 6, 0, "E", "FFLF"))
+            expected_result = self.run_simulator(SimultaneousSimulator(lawn), mowers)
+
+            # When
+            result = self.run_simulator(SimultaneousFleetSimulator(lawn), mowers)
+
+            # Then
+            self.assertListEqual(result, expected_result)
+            self.assertEqual(result[-1], (10 ** 6, 1, "N"))
@@ -0,0 +1,88 @@
+import random
+from unittest import TestCase, skipUnless
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.trajectory import TrajectorySimulator
+from lawnmower.tests.testutils import captured_output
+
+
+@skipUnless(TrajectorySimulator.is_available(), "NumPy not installed")
+class TestTrajectorySimulator(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+        self.lawn = Lawn(x_max=9, y_max=6)
+
+    def tearDown(self):
+        pass
+
+    def test__given_invalid_instruction_list__when_init__then_error(self):
+
+        with captured_output() as (out, err):
+
+            # When
+            simulator = TrajectorySimulator(Mower(1, 2, Orientation("N"), self.lawn), "FFX")
+
+            # Then
+            self.assertEqual(out.getvalue(),
+                             "ERROR while initializing TrajectorySimulator : Invalid instruction list\n")
+            self.assertFalse(simulator.is_properly_initialized())
+            self.assertIsNone(simulator.get_states())
+            self.assertIsNone(simulator.get_final_state())
+            self.assertFalse(simulator.run())
+
+    def test__given_empty_instruction_list__when_get_states__then_no_states(self):
+
+        # Given
+        simulator = TrajectorySimulator(Mower(1, 2, Orientation("N"), self.lawn), "")
+
+        # When
+        x, y, orientation = simulator.get_states()
+
+        # Then
+        self.assertListEqual(x.tolist(), [])
+        self.assertListEqual(y.tolist(), [])
+        self.assertListEqual(orientation.tolist(), [])
+        self.assertTupleEqual(simulator.get_final_state(), (1, 2, Orientation.str_to_int["N"]))
+
+    def test__given_valid_instruction_list__when_run__then_mower_at_final_state(self):
+
+        # Given
+        mower = Mower(1, 2, Orientation("N"), Lawn(x_max=5, y_max=5))
+        simulator = TrajectorySimulator(mower, "LFLFLFLFF")
+
+        # When
+        result = simulator.run()
+
+        # Then
+        self.assertTrue(result)
+        self.assertEqual("{} {} {}".format(mower.x, mower.y, mower.orientation.get_str()), "1 3 N")
+
+    def test__given_random_instruction_lists__when_get_states__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for chunk_size in [7, 100, 1 << 20]:
+                for _ in range(20):
+                    instruction_list = "".join(self.random_generator.choices("LRFFFfff",
+                                                                             k=self.random_generator.randint(1, 3000)))
+                    mower = Mower(self.random_generator.randint(0, 9), self.random_generator.randint(0, 6),
+                                  Orientation(self.random_generator.choice("NESW")), self.lawn)
+                    simulator = TrajectorySimulator(mower, instruction_list, chunk_size=chunk_size)
+                    expected_mower = Mower(mower.x, mower.y, Orientation(mower.orientation.get_str()), self.lawn)
+                    expected = []
+
+                    for instruction in instruction_list:
+                        expected_mower.execute(instruction)
+                        expected.append((expected_mower.x, expected_mower.y, expected_mower.orientation.orientation))
+
+                    # When
+                    result = list(zip(*(values.tolist() for values in simulator.get_states())))
+                    final_state = simulator.get_final_state()
+
+                    # Then
+                    self.assertListEqual(result, expected)
+                    self.assertTupleEqual(final_state, expected[-1])
@@ -0,0 +1,142 @@
+import random
+from unittest import TestCase
+
+from lawnmower.src.lawn import Lawn
+from lawnmower.src.mower import Mower
+from lawnmower.src.orientation import Orientation
+from lawnmower.src.transfer import TransferFunction, ParallelCompiler
+from lawnmower.tests.testutils import captured_output
+
+
+class TestTransferFunction(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(0)
+        self.lawn = Lawn(x_max=6, y_max=4, x_min=2, y_min=1)
+
+    def tearDown(self):
+        pass
+
+    def get_expected_state(self, x, y, orientation, instruction_list):
+        mower = Mower(x, y, Orientation(Orientation.int_to_str[orientation]), self.lawn)
+
+        for instruction in instruction_list:
+            mower.execute(instruction)
+
+        return mower.x, mower.y, mower.orientation.orientation
+
+    def get_states(self):
+        return [(x, y, orientation) for x in range(self.lawn.x_min, self.lawn.x_max + 1)
+                for y in range(self.lawn.y_min, self.lawn.y_max + 1) for orientation in range(4)]
+
+    def test__given_invalid_instruction_list__when_compile__then_none(self):
+
+        # When
+        result = TransferFunction.compile("FFX", 4, 3)
+
+        # Then
+        self.assertIsNone(result)
+
+    def test__given_random_instruction_lists__when_apply__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for _ in range(20):
+                instruction_list = "".join(self.random_generator.choices("LRFFFf",
+                                                                         k=self.random_generator.randint(0, 60)))
+
+                # When
+                transfer_function = TransferFunction.compile(instruction_list, 4, 3)
+
+                # Then
+                for state in self.get_states():
+                    self.assertTupleEqual(transfer_function.apply(*state, self.lawn),
+                                          self.get_expected_state(*state, instruction_list))
+
+    def test__given_instruction_lists_mostly_made_up_of_forward_runs__when_apply__then_same_as_mower_execute(self):
+
+        with captured_output() as (out, err):
+
+            # Given
+            for _ in range(20):
+                instruction_list = "".join(
+                    self.random_generator.choice("LR") + "F" * self.random_generator.randint(3, 9)
+                    for _ in range(self.random_generator.randint(0, 8)))
+
+                # When
+                transfer_function = TransferFunction.compile(instruction_list, 4, 3)
+
+                # Then
+                for state in self.get_states():
+                    self.assertTupleEqual(transfer_function.apply(*state, self.lawn),
+                                          self.get_expected_state(*state, instruction_list))
+
+    def test__given_chunks_of_instruction_list__when_then__then_same_as_whole_instruction_list(self):
+
+        # Given
+        instruction_list = "".join(self.random_generator.choices("LRFFF", k=100))
+        expected = TransferFunction.compile(instruction_list, 4, 3)
+        first = TransferFunction.compile(instruction_list[:37], 4, 3)
+        second = TransferFunction.compile(instruction_list[37:], 4, 3)
+
+        # When
+        result = first.then(second)
+
+        # Then
+        self.assertEqual(result.rotation, expected.rotation)
+
+        for state in self.get_states():
+            self.assertTupleEqual(result.apply(*state, self.lawn), expected.apply(*state, self.lawn))
+
+    def test__given_instruction_list__when_power__then_same_as_repeated_instruction_list(self):
+
+        # Given
+        instruction_list = "".join(self.random_generator.choices("LRFFF", k=7))
+        transfer_function = TransferFunction.compile(instruction_list, 4, 3)
+
+        for count in [1, 2, 5, 12]:
+            expected = TransferFunction.compile(instruction_list * count, 4, 3)
+
+            # When
+            result = transfer_function.power(count)
+
+            # Then
+            self.assertEqual(result.rotation, expected.rotation)
+            self.assertListEqual(result.maps, expected.maps)
+
+
+class TestParallelCompiler(TestCase):
+
+    def setUp(self):
+        self.random_generator = random.Random(1)
+        self.lawn = Lawn(x_max=6, y_max=4)
+
+    def tearDown(self):
+        pass
+
+    def test__given_several_processes__when_compile__then_same_as_single_chunk(self):
+
+        # Given
+        instruction_list = "".join(self.random_generator.choices("LRFFF", k=1000))
+        expected = TransferFunction.compile(instruction_list, 6, 4)
+        compiler = ParallelCompiler(processes=2, chunk_size=64)
+
+        # When
+        result = compiler.compile(instruction_list, self.lawn)
+
+        # Then
+        self.assertEqual(result.rotation, expected.rotation)
+        self.assertListEqual(result.maps, expected.maps)
+
+    def test__given_invalid_instruction_in_any_chunk__when_compile__then_none(self):
+
+        # Given
+        instruction_list = "F" * 500 + "X" + "F" * 500
+        compiler = ParallelCompiler(processes=2, chunk_size=64)
+
+        # When
+        result = compiler.compile(instruction_list, self.lawn)
+
+        # Then
+        self.assertIsNone(result)
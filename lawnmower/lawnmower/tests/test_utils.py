@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from lawnmower.src.utils import get_bool_from_str
+from lawnmower.src.utils import get_bool_from_str, get_int_from_str
 from lawnmower.tests.testutils import captured_output
 
 
@@ -76,3 +76,21 @@ class TestUtils(TestCase):
 
                 # Then
                 self.assertTrue(result)
+
+    def test__given_invalid_input_str__when_get_int_from_str__then_return_default(self):
+
+        with captured_output() as (out, err):
+
+            for input_str in [None, "", "four", "4.5", ["4"]]:
+
+                # When + Then
+                self.assertIsNone(get_int_from_str(input_str))
+                self.assertEqual(get_int_from_str(input_str, default=3), 3)
+
+    def test__given_valid_input_str__when_get_int_from_str__then_return_int(self):
+
+        with captured_output() as (out, err):
+
+            # When + Then
+            self.assertEqual(get_int_from_str("4"), 4)
+            self.assertEqual(get_int_from_str("-12", default=3), -12)